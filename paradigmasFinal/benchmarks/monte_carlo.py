@@ -0,0 +1,58 @@
+"""
+Escalado del análisis de tolerancias por Monte Carlo
+Corre la misma simulación (misma semilla) con distinta cantidad de procesos
+y muestra la aceleración y la eficiencia respecto de un solo proceso.
+También verifica que los resultados sean idénticos en todas las corridas.
+
+Uso (desde paradigmasFinal):
+    python -m benchmarks.monte_carlo
+    python -m benchmarks.monte_carlo --samples 500000 --meshes 200 --workers 1,2,4,8
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from controllers.tolerance_analysis import MonteCarloAnalysis
+
+
+def parse_list(text: str):
+    return tuple(int(item) for item in text.split(',') if item.strip())
+
+
+def main(argv=None) -> int:
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Aceleración del Monte Carlo de tolerancias por procesos")
+    parser.add_argument('--samples', type=int, default=200000)
+    parser.add_argument('--meshes', type=int, default=100)
+    parser.add_argument('--type', default='mallas', choices=('serie', 'paralelo', 'mallas'))
+    parser.add_argument('--method', default='auto')
+    parser.add_argument('--workers', type=parse_list,
+                        default=tuple(sorted({1, 2, 4, cores} - {0})))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    resistors = np.random.default_rng(args.seed).uniform(1.0, 100.0, args.meshes)
+    analysis = MonteCarloAnalysis(args.type, 15.0, resistors, tolerance=0.05,
+                                  method=args.method, seed=args.seed)
+
+    print(f"{args.samples} muestras, {args.type} n={args.meshes}, {cores} núcleos")
+    print(f"{'procesos':>8} {'segundos':>10} {'acelera':>8} {'eficiencia':>10}")
+    baseline = reference = None
+    for workers in args.workers:
+        report = analysis.run(args.samples, workers=workers, keep_samples=True)
+        if baseline is None:
+            baseline, reference = report['elapsed'], report['currents']
+        elif not np.array_equal(report['currents'], reference):
+            print(f"Error: los resultados con {workers} procesos difieren de la primera corrida")
+            return 1
+        speedup = baseline / report['elapsed']
+        print(f"{workers:>8} {report['elapsed']:>10.3f} {speedup:>7.2f}x {speedup / workers:>9.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
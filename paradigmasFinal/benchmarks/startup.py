@@ -0,0 +1,163 @@
+"""
+Benchmark de arranque en frío
+Mide con `python -X importtime` cuánto tarda en importarse cada punto de
+entrada, lo compara con un presupuesto y verifica que no se carguen módulos
+pesados antes de tiempo (NumPy y las estrategias recién en el primer cálculo).
+
+Uso (desde paradigmasFinal):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 9 --first-frame --json
+
+Sale con código 1 si algún punto de entrada se pasa del presupuesto.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Presupuestos en milisegundos (tiempo acumulado de importación, mediana)
+TARGETS = {
+    'views.gui': {
+        'budget_ms': 250.0,
+        'forbidden': ('numpy', 'models.circuit', 'strategies.resolution_strategies')
+    },
+    'cli': {
+        'budget_ms': 60.0,
+        'forbidden': ('tkinter', 'customtkinter', 'numpy')
+    }
+}
+FIRST_FRAME_BUDGET_MS = 600.0
+
+FIRST_FRAME_CODE = """
+import time
+start = time.perf_counter()
+import customtkinter as ctk
+from views.gui import CircuitAnalyzerGUI
+root = ctk.CTk()
+app = CircuitAnalyzerGUI(root)
+root.update()
+print((time.perf_counter() - start) * 1000.0)
+root.destroy()
+"""
+
+
+def parse_importtime(stderr: str):
+    """Devuelve [(módulo, propio_us, acumulado_us, nivel)] a partir de la salida de -X importtime"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        level = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), level))
+    return rows
+
+
+def measure_import(module: str):
+    "Importa el módulo en un intérprete nuevo y devuelve (ms totales, filas de importtime)"
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    rows = parse_importtime(completed.stderr)
+    total = next((cumulative for name, _, cumulative, _ in rows if name == module), 0)
+    return total / 1000.0, rows
+
+
+def measure_first_frame():
+    "Tiempo hasta el primer dibujado de la ventana; None si no hay pantalla"
+    completed = subprocess.run(
+        [sys.executable, '-c', FIRST_FRAME_CODE],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        return None
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int = 5, top: int = 8, first_frame: bool = False) -> dict:
+    report = {'python': sys.version.split()[0], 'targets': {}}
+
+    for module, target in TARGETS.items():
+        samples = []
+        for _ in range(repeat):
+            total_ms, rows = measure_import(module)
+            samples.append(total_ms)
+
+        loaded = {name for name, _, _, _ in rows}
+        heaviest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+        median_ms = statistics.median(samples)
+        forbidden = [name for name in target['forbidden'] if name in loaded]
+
+        report['targets'][module] = {
+            'median_ms': round(median_ms, 2),
+            'min_ms': round(min(samples), 2),
+            'budget_ms': target['budget_ms'],
+            'forbidden_loaded': forbidden,
+            'ok': median_ms <= target['budget_ms'] and not forbidden,
+            'heaviest': [
+                {'module': name, 'self_ms': self_us / 1000.0, 'cumulative_ms': cumulative_us / 1000.0}
+                for name, self_us, cumulative_us, _ in heaviest
+            ]
+        }
+
+    if first_frame:
+        frame_ms = measure_first_frame()
+        report['first_frame'] = {
+            'ms': None if frame_ms is None else round(frame_ms, 2),
+            'budget_ms': FIRST_FRAME_BUDGET_MS,
+            # Sin pantalla no se puede medir: no cuenta como fallo
+            'ok': frame_ms is None or frame_ms <= FIRST_FRAME_BUDGET_MS
+        }
+
+    report['ok'] = all(entry['ok'] for entry in report['targets'].values()) and \
+        report.get('first_frame', {}).get('ok', True)
+    return report
+
+
+def print_report(report: dict):
+    for module, entry in report['targets'].items():
+        status = 'OK' if entry['ok'] else 'EXCEDIDO'
+        print(f"{module:<12} {entry['median_ms']:>8.1f} ms  (mín {entry['min_ms']:.1f}, "
+              f"presupuesto {entry['budget_ms']:.0f})  {status}")
+        for name in entry['forbidden_loaded']:
+            print(f"    carga antes de tiempo: {name}")
+        for row in entry['heaviest']:
+            print(f"    {row['module']:<40} propio {row['self_ms']:>7.2f} ms  "
+                  f"acumulado {row['cumulative_ms']:>7.2f} ms")
+
+    if 'first_frame' in report:
+        entry = report['first_frame']
+        if entry['ms'] is None:
+            print("primer dibujado: sin pantalla, no medido")
+        else:
+            status = 'OK' if entry['ok'] else 'EXCEDIDO'
+            print(f"primer dibujado {entry['ms']:>8.1f} ms  (presupuesto {entry['budget_ms']:.0f})  {status}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Tiempo de arranque contra un presupuesto")
+    parser.add_argument('--repeat', type=int, default=5, help="corridas por punto de entrada")
+    parser.add_argument('--top', type=int, default=8, help="módulos más pesados a listar")
+    parser.add_argument('--first-frame', action='store_true',
+                        help="mide también el primer dibujado de la ventana (requiere pantalla)")
+    parser.add_argument('--json', action='store_true', help="salida en JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat, args.top, args.first_frame)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0 if report['ok'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
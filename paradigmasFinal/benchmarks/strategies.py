@@ -0,0 +1,302 @@
+"""
+Benchmark comparativo de estrategias de resolución
+Para cada estrategia, topología y tamaño mide por separado el armado del
+sistema (build_mesh_system) y la resolución, la memoria pico (tracemalloc)
+y la precisión: residuo relativo ‖Ax−b‖/‖b‖ y error contra una solución
+de referencia (fórmula cerrada en serie/paralelo, Thomas en mallas).
+
+Uso (desde paradigmasFinal):
+    python -m benchmarks.strategies
+    python -m benchmarks.strategies --sizes 2,64,1024,32768 --output bench.json
+    python -m benchmarks.strategies --baseline bench_anterior.json
+    python -m benchmarks.strategies --strategies numeric --types mallas \
+        --write-thresholds strategies/auto_thresholds.json
+
+Los tamaños siguientes de cada estrategia y topología se extrapolan por la
+tendencia medida y se omiten si superarían --max-seconds.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli import create_strategy
+from models.circuit import CircuitSnapshot
+from models.mesh_system import build_banded_system
+from strategies.factorization import TridiagonalFactorization
+
+DEFAULT_STRATEGIES = ('cramer', 'gauss', 'numeric')
+# Lo mínimo que necesita --write-thresholds para medir todos los cruces de AutoStrategy
+THRESHOLD_STRATEGIES = ('numeric', 'tridiagonal', 'incremental', 'cg')
+# Estrategias a las que se les mide también el recálculo tras editar una resistencia
+EDIT_STRATEGIES = ('tridiagonal', 'incremental', 'cg')
+DEFAULT_TYPES = ('serie', 'paralelo', 'mallas')
+DEFAULT_SIZES = (2, 8, 32, 128, 512, 2048, 8192, 32768)
+# Estrategias que forman la matriz densa n x n
+DENSE_STRATEGIES = ('cramer', 'gauss', 'numeric')
+# Por debajo de esto los tiempos son sobre todo costo fijo: no sirven para extrapolar
+MIN_PREDICT_SECONDS = 0.01
+
+
+def make_circuit(circuit_type: str, n: int, rng, voltage: float = 15.0) -> CircuitSnapshot:
+    return CircuitSnapshot(circuit_type, voltage, rng.uniform(1.0, 100.0, n))
+
+
+def reference_solution(circuit) -> np.ndarray:
+    R = np.asarray(circuit.resistors)
+    if circuit.circuit_type == 'serie':
+        return np.array([circuit.voltage / R.sum()])
+    if circuit.circuit_type == 'paralelo':
+        return circuit.voltage / R
+    system = build_banded_system(circuit.circuit_type, circuit.voltage, R)
+    return TridiagonalFactorization.from_system(system).solve(system.b)
+
+
+def accuracy(circuit, currents) -> dict:
+    system = build_banded_system(circuit.circuit_type, circuit.voltage, circuit.resistors)
+    x = np.asarray(currents, dtype=float)
+    reference = reference_solution(circuit)
+    return {
+        'residual': float(np.linalg.norm(system.matvec(x) - system.b) / np.linalg.norm(system.b)),
+        'max_error': float(np.max(np.abs(x - reference)) / np.max(np.abs(reference)))
+    }
+
+
+def dense_bytes(circuit_type: str, n: int) -> int:
+    "Memoria de la matriz densa que arma build_mesh_system / _dense_system"
+    size = 1 if circuit_type == 'serie' else n
+    return size * size * 8
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    value = function(*args)
+    return value, time.perf_counter() - start
+
+
+def run_case(method: str, circuit, repeat: int, measure_dense_build: bool = True) -> dict:
+    """
+    Mide un caso. Cada resolución usa una estrategia nueva para que las
+    cachés de factorizaciones no conviertan la medición en un acierto.
+
+    build_ms es build_mesh_system (listas densas) y banded_build_ms la versión
+    compacta que usan las estrategias; solve_ms es strategy.solve completo.
+    """
+    build_times, banded_times, solve_times = [], [], []
+    currents = None
+
+    for _ in range(repeat):
+        if measure_dense_build:
+            _, elapsed = timed(circuit.build_mesh_system)
+            build_times.append(elapsed)
+        _, elapsed = timed(circuit.build_banded_system)
+        banded_times.append(elapsed)
+
+        strategy = create_strategy(method)
+        currents, elapsed = timed(strategy.solve, circuit)
+        solve_times.append(elapsed)
+
+    if currents is None:
+        return {'status': 'failed'}
+
+    # Pasada aparte para la memoria: tracemalloc enlentece lo que mide
+    strategy = create_strategy(method)
+    tracemalloc.start()
+    strategy.solve(circuit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        'status': 'ok',
+        'build_ms': statistics.median(build_times) * 1000.0 if build_times else None,
+        'banded_build_ms': statistics.median(banded_times) * 1000.0,
+        'solve_ms': statistics.median(solve_times) * 1000.0,
+        'solve_min_ms': min(solve_times) * 1000.0,
+        'peak_kb': peak / 1024.0
+    }
+    result.update(accuracy(circuit, currents))
+    return result
+
+
+def edit_seconds(method: str, circuit, repeat: int) -> float:
+    """
+    Tiempo de recalcular después de cambiar una sola resistencia, el uso
+    típico de la interfaz: es lo que aprovecha la estrategia incremental.
+    Usa el circuito real (con registro de cambios) en lugar de una copia.
+    """
+    from models.circuit import Circuit
+
+    live = Circuit.get_instance()
+    with live.batch():
+        live.set_circuit_type(circuit.circuit_type)
+        live.set_voltage(circuit.voltage)
+        live.replace_resistors(circuit.resistors)
+
+    strategy = create_strategy(method)
+    strategy.solve(live.snapshot())
+    n = len(live.resistors)
+    times = []
+    for k in range(repeat):
+        index = (k + 1) * n // (repeat + 1)
+        live.set_resistor(index, float(live.resistors[index]) * 1.01)
+        # La copia no entra en la medición: cuesta lo mismo para todas
+        snapshot = live.snapshot()
+        _, elapsed = timed(strategy.solve, snapshot)
+        times.append(elapsed)
+    return statistics.median(times)
+
+
+def predict_seconds(history, n: int) -> float:
+    """
+    Extrapola el tiempo al tamaño n con el exponente observado en los dos
+    últimos tamaños (al menos lineal, como mucho n⁴ como Cramer).
+    """
+    n2, t2 = history[-1]
+    if len(history) == 1:
+        exponent = 3.0  # eliminación densa
+    else:
+        n1, t1 = history[-2]
+        exponent = math.log(max(t2, 1e-9) / max(t1, 1e-9)) / math.log(n2 / n1)
+        exponent = min(max(exponent, 1.0), 4.0)
+    return t2 * (n / n2) ** exponent
+
+
+def run(methods, circuit_types, sizes, repeat: int = 3, seed: int = 0,
+        max_seconds: float = 2.0, max_dense_mb: float = 256.0, verbose: bool = True) -> dict:
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'seed': seed,
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': []
+    }
+
+    for circuit_type in circuit_types:
+        for method in methods:
+            history = []
+            rng = np.random.default_rng(seed)
+
+            for n in sizes:
+                circuit = make_circuit(circuit_type, n, rng)
+                entry = {'strategy': method, 'type': circuit_type, 'n': n}
+
+                fits_dense = dense_bytes(circuit_type, n) <= max_dense_mb * 2**20
+
+                if method in DENSE_STRATEGIES and not fits_dense:
+                    entry['status'] = 'skipped (memoria)'
+                elif history and history[-1][1] >= MIN_PREDICT_SECONDS and predict_seconds(history, n) > max_seconds:
+                    entry['status'] = 'skipped (tiempo)'
+                else:
+                    entry.update(run_case(method, circuit, repeat, measure_dense_build=fits_dense))
+                    if entry['status'] == 'ok':
+                        history.append((n, entry['solve_ms'] / 1000.0))
+                        if method in EDIT_STRATEGIES and circuit_type == 'mallas':
+                            entry['edit_ms'] = edit_seconds(method, circuit, repeat) * 1000.0
+
+                report['results'].append(entry)
+                if verbose:
+                    print(f"  {circuit_type:<9} {method:<12} n={n:<6} {entry['status']}", file=sys.stderr)
+
+    return report
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        (entry['strategy'], entry['type'], entry['n']): entry
+        for entry in data['results'] if entry.get('status') == 'ok'
+    }
+
+
+def print_table(report: dict, baseline=None):
+    header = (f"{'tipo':<9} {'estrategia':<12} {'n':>6} {'armado ms':>10} {'bandas ms':>10} {'solve ms':>10} "
+              f"{'edición ms':>10} {'pico KB':>10} {'residuo':>9} {'error':>9}")
+    if baseline is not None:
+        header += f" {'vs base':>8}"
+    print(header)
+    print('-' * len(header))
+
+    for entry in report['results']:
+        prefix = f"{entry['type']:<9} {entry['strategy']:<12} {entry['n']:>6}"
+        if entry['status'] != 'ok':
+            print(f"{prefix} {entry['status']}")
+            continue
+
+        build = f"{entry['build_ms']:>10.3f}" if entry['build_ms'] is not None else f"{'-':>10}"
+        edit = f"{entry['edit_ms']:>10.3f}" if 'edit_ms' in entry else f"{'-':>10}"
+        line = (f"{prefix} {build} {entry['banded_build_ms']:>10.3f} {entry['solve_ms']:>10.3f} "
+                f"{edit} {entry['peak_kb']:>10.1f} {entry['residual']:>9.1e} {entry['max_error']:>9.1e}")
+        if baseline is not None:
+            previous = baseline.get((entry['strategy'], entry['type'], entry['n']))
+            # > 1 significa más lento que la versión de referencia
+            line += f" {entry['solve_ms'] / previous['solve_ms']:>7.2f}x" if previous else f" {'-':>8}"
+        print(line)
+
+
+def parse_list(text: str, cast=str):
+    return tuple(cast(item) for item in text.split(',') if item.strip())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compara estrategias por tamaño y topología")
+    parser.add_argument('--strategies', type=parse_list, default=DEFAULT_STRATEGIES,
+                        help="lista separada por comas (cramer,gauss,numeric,tridiagonal,incremental,cg,sparse)")
+    parser.add_argument('--types', type=parse_list, default=DEFAULT_TYPES)
+    parser.add_argument('--sizes', type=lambda text: parse_list(text, int), default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-seconds', type=float, default=2.0,
+                        help="tiempo máximo estimado por resolución antes de omitir tamaños mayores")
+    parser.add_argument('--max-dense-mb', type=float, default=256.0,
+                        help="memoria máxima de la matriz densa (estrategias densas y build_mesh_system)")
+    parser.add_argument('--output', help="archivo JSON de salida (por defecto solo la tabla)")
+    parser.add_argument('--baseline', help="JSON de una corrida anterior para comparar tiempos")
+    parser.add_argument('--json', action='store_true', help="escribe el JSON en stdout en lugar de la tabla")
+    parser.add_argument('--quiet', action='store_true', help="sin progreso en stderr")
+    parser.add_argument('--write-thresholds', metavar='JSON',
+                        help="calibra los umbrales de AutoStrategy con esta corrida y los guarda "
+                             "(p. ej. strategies/auto_thresholds.json); agrega las estrategias "
+                             "y la topología mallas que hagan falta")
+    args = parser.parse_args(argv)
+
+    if args.write_thresholds:
+        args.strategies = tuple(dict.fromkeys(args.strategies + THRESHOLD_STRATEGIES))
+        args.types = tuple(dict.fromkeys(args.types + ('mallas',)))
+
+    report = run(args.strategies, args.types, args.sizes, args.repeat, args.seed,
+                 args.max_seconds, args.max_dense_mb, verbose=not args.quiet)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.write_thresholds:
+        from strategies.resolution_strategies import thresholds_from_benchmark
+        with open(args.write_thresholds, 'w', encoding='utf-8') as f:
+            json.dump(thresholds_from_benchmark(report), f, indent=2)
+            f.write("\n")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_table(report, load_baseline(args.baseline) if args.baseline else None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
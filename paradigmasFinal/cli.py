@@ -0,0 +1,228 @@
+"""
+Punto de entrada sin interfaz gráfica
+Resuelve circuitos leídos de JSON Lines o CSV (archivo o stdin) y escribe
+cada resultado apenas se calcula. No importa Tk, así que sirve en scripts
+y servidores sin pantalla.
+
+Formatos de entrada (una definición por línea):
+    JSONL: {"voltage": 15, "type": "mallas", "resistors": [3, 4, 5], "id": "opcional"}
+           {"netlist": "V1 a 0 12\nR1 a b 1k\nR2 b 0 2k", "id": "opcional"}
+    CSV:   voltaje,tipo,R1,R2,...   (las líneas con # y un encabezado se ignoran)
+
+Un archivo binario .psim (models.circuit_file) se resuelve mapeado en memoria:
+las corrientes se guardan en el mismo archivo y la salida es solo un resumen.
+
+Un netlist (topología arbitraria, ver models.netlist) devuelve la corriente de
+cada resistencia en orden; se resuelve con análisis nodal disperso salvo con
+--method auto o sparse, que ya lo usan.
+
+Con --cache las corrientes se guardan en una base SQLite (utils.disk_cache)
+y las redes ya resueltas en corridas anteriores no se vuelven a resolver.
+
+Uso:
+    python cli.py circuitos.jsonl --method tridiagonal
+    python cli.py escalera.psim
+    python cli.py referencia.jsonl --cache
+    cat circuitos.csv | python cli.py --input-format csv --output-format csv
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+CIRCUIT_TYPES = ('serie', 'paralelo', 'mallas')
+METHODS = ('auto', 'cramer', 'gauss', 'numeric', 'tridiagonal', 'incremental', 'cg', 'sparse')
+
+
+def create_strategy(method: str):
+    "Crea la estrategia pedida (importada recién acá para arrancar rápido)"
+    from strategies import resolution_strategies as rs
+    return {
+        'auto': rs.AutoStrategy,
+        'cramer': rs.CramerStrategy,
+        'gauss': rs.GaussJordanStrategy,
+        'numeric': rs.NumericStrategy,
+        'tridiagonal': rs.TridiagonalStrategy,
+        'incremental': rs.IncrementalStrategy,
+        'cg': rs.ConjugateGradientStrategy,
+        'sparse': rs.SparseMNAStrategy
+    }[method]()
+
+
+def parse_jsonl(line: str) -> dict:
+    data = json.loads(line)
+    if not isinstance(data, dict):
+        raise ValueError(f"se esperaba un objeto JSON y llegó {type(data).__name__}")
+    if 'netlist' in data:
+        from models.netlist import Netlist
+        return {'id': data.get('id'), 'type': 'netlist', 'netlist': Netlist.parse(data['netlist'])}
+    return {
+        'id': data.get('id'),
+        'voltage': float(data['voltage']),
+        'type': data.get('type', data.get('circuit_type', 'mallas')),
+        'resistors': [float(r) for r in data['resistors']]
+    }
+
+
+def parse_csv(line: str) -> dict:
+    row = next(csv.reader([line]))
+    return {
+        'id': None,
+        'voltage': float(row[0]),
+        'type': row[1].strip(),
+        'resistors': [float(r) for r in row[2:] if r.strip()]
+    }
+
+
+def detect_format(path: str) -> str:
+    return 'csv' if path and path.lower().endswith('.csv') else 'jsonl'
+
+
+def read_circuits(stream, input_format: str):
+    """
+    Genera (número de línea, definición o None, error o None) de a una
+    línea por vez: la memoria no crece con el tamaño del archivo.
+    """
+    parse = parse_csv if input_format == 'csv' else parse_jsonl
+
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            definition = parse(line)
+        except (ValueError, KeyError, TypeError, IndexError, StopIteration) as e:
+            # Un encabezado CSV no tiene voltaje numérico en la primera línea
+            if input_format == 'csv' and number == 1:
+                continue
+            yield number, None, f"Línea inválida: {e}"
+            continue
+
+        if definition['type'] == 'netlist':
+            yield number, definition, None
+        elif definition['type'] not in CIRCUIT_TYPES:
+            yield number, None, f"Tipo de circuito desconocido: {definition['type']}"
+        elif definition['voltage'] <= 0 or len(definition['resistors']) < 2:
+            yield number, None, "Agregue al menos 2 resistencias y voltaje > 0V"
+        elif any(r <= 0 for r in definition['resistors']):
+            yield number, None, "La resistencia debe ser mayor a 0Ω"
+        else:
+            yield number, definition, None
+
+
+def solve_stream(stream, controller, input_format: str):
+    """Genera un resultado (dict) por cada circuito leído, en el orden de entrada"""
+    from models.circuit import CircuitSnapshot
+
+    for number, definition, error in read_circuits(stream, input_format):
+        if error is not None:
+            yield {'line': number, 'error': error}
+            continue
+
+        if definition['type'] == 'netlist':
+            circuit = definition['netlist']
+        else:
+            circuit = CircuitSnapshot(definition['type'], definition['voltage'], definition['resistors'])
+        currents = controller.calculate_currents(circuit=circuit)
+
+        result = {'line': number, 'id': definition['id']}
+        if currents is None:
+            result['error'] = "Error en el cálculo"
+        else:
+            result['currents'] = [float(i) for i in currents]
+        yield result
+
+
+def solve_binary(path: str, controller) -> dict:
+    """Resuelve un .psim en su lugar y devuelve el resumen de las corrientes"""
+    try:
+        currents, snapshot = controller.solve_file(path)
+    except (OSError, ValueError) as e:
+        return {'line': 1, 'id': path, 'error': str(e)}
+    if currents is None:
+        return {'line': 1, 'id': path, 'error': f"{path}: Error en el cálculo"}
+    return {'line': 1, 'id': path, 'stored': len(currents), 'summary': controller.summarize(currents, snapshot)}
+
+
+def write_jsonl(out, result: dict):
+    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+def write_csv(out, result: dict):
+    key = result['id'] if result.get('id') is not None else result['line']
+    if 'error' in result:
+        row = [key, 'error', result['error']]
+    elif 'summary' in result:
+        row = [key, 'ok', result['stored']] + [repr(value) for value in result['summary'].values()]
+    else:
+        row = [key, 'ok'] + [repr(i) for i in result['currents']]
+    csv.writer(out, lineterminator="\n").writerow(row)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Resuelve circuitos sin interfaz gráfica (JSON Lines o CSV)"
+    )
+    parser.add_argument('input', nargs='?', default='-',
+                        help="archivo de entrada ('-' o nada para stdin)")
+    parser.add_argument('-m', '--method', choices=METHODS, default='auto',
+                        help="método de resolución para mallas (serie y paralelo usan la fórmula cerrada)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="muestra en stderr qué motor eligió 'auto' y por qué")
+    parser.add_argument('-i', '--input-format', choices=('jsonl', 'csv'),
+                        help="formato de entrada (por defecto según la extensión, si no jsonl)")
+    parser.add_argument('-o', '--output-format', choices=('jsonl', 'csv'), default='jsonl')
+    parser.add_argument('--cache', nargs='?', const='', metavar='ARCHIVO',
+                        help="reutiliza corrientes de corridas anteriores (caché SQLite; "
+                             "sin ARCHIVO, la del usuario)")
+    parser.add_argument('--cache-factorizations', action='store_true',
+                        help="con --cache, guarda también las factorizaciones")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.verbose:
+        import logging
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(message)s")
+    from controllers.circuit_controller import CircuitController
+
+    path = None if args.input == '-' else args.input
+    input_format = args.input_format or detect_format(path)
+    write = write_csv if args.output_format == 'csv' else write_jsonl
+    controller = CircuitController(create_strategy(args.method))
+    if args.cache is not None:
+        controller.enable_disk_cache(args.cache or None, factorizations=args.cache_factorizations)
+
+    if path and path.lower().endswith('.psim'):
+        result = solve_binary(path, controller)
+        if 'error' in result:
+            print(result['error'], file=sys.stderr)
+        write(sys.stdout, result)
+        return 1 if 'error' in result else 0
+
+    errors = 0
+    stream = open(path, encoding='utf-8', newline='') if path else sys.stdin
+    try:
+        for result in solve_stream(stream, controller, input_format):
+            if 'error' in result:
+                errors += 1
+                print(f"Línea {result['line']}: {result['error']}", file=sys.stderr)
+            write(sys.stdout, result)
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # El consumidor (p. ej. head) cerró la salida: no es un error
+        sys.stderr.close()
+        return 0
+    finally:
+        if path:
+            stream.close()
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,293 @@
 from typing import List, Optional
+from utils.profiling import PROFILER, profiled
 
 class CircuitController:
-    def __init__(self, strategy):
+    def __init__(self, strategy=None, use_analytic: bool = True, cache_size: Optional[int] = None):
         from models.circuit import Circuit
         self.circuit = Circuit.get_instance()
         self.strategy = strategy
+        self.use_analytic = use_analytic
+        self._analytic = None
+        self._sparse = None
+        # Caché de resultados opcional (desactivada por defecto)
+        self.result_cache = None
+        if cache_size:
+            self.enable_result_cache(cache_size)
+        # Caché en disco entre sesiones, también opcional
+        self.disk_cache = None
+    
+    @property
+    def analytic(self):
+        """
+        'serie' y 'paralelo' tienen solución cerrada: no hace falta resolver un sistema.
+        Se crea en el primer uso para no cargar las estrategias al arrancar.
+        """
+        if self.use_analytic and self._analytic is None:
+            from strategies.resolution_strategies import AnalyticStrategy
+            self._analytic = AnalyticStrategy()
+        return self._analytic
+    
+    @property
+    def sparse(self):
+        """Análisis nodal disperso para los Netlist, si la estrategia actual no los resuelve"""
+        if self._sparse is None:
+            from strategies.resolution_strategies import SparseMNAStrategy
+            self._sparse = SparseMNAStrategy()
+        return self._sparse
     
     def set_strategy(self, strategy):
         self.strategy = strategy
     
-    def calculate_currents(self) -> Optional[List[float]]:
-        return self.strategy.solve(self.circuit)
+    def current_strategy(self):
+        """La estrategia elegida o, si no hay ninguna, AutoStrategy (creada en el primer uso)"""
+        if self.strategy is None:
+            from strategies.resolution_strategies import AutoStrategy
+            self.strategy = AutoStrategy()
+        return self.strategy
+    
+    def enable_result_cache(self, maxsize: int = 32):
+        """Memoriza corrientes por (red, voltaje, estrategia) con descarte LRU"""
+        from utils.lru_cache import LRUCache
+        self.result_cache = LRUCache(maxsize)
+    
+    def disable_result_cache(self):
+        self.result_cache = None
+    
+    def cache_stats(self) -> Optional[dict]:
+        return self.result_cache.stats() if self.result_cache is not None else None
+    
+    def enable_disk_cache(self, path: Optional[str] = None, max_bytes: Optional[int] = None,
+                          factorizations: bool = False):
+        """
+        Guarda las corrientes calculadas en una base SQLite (por defecto en el
+        directorio de caché del usuario) para reutilizarlas en otras sesiones.
+        Con factorizations=True también se guardan las factorizaciones de
+        todas las estrategias del proceso.
+        """
+        from utils.disk_cache import DEFAULT_MAX_BYTES, DiskCache
+        from strategies.factorization import FactorizationCache
+
+        self.disk_cache = DiskCache(path, max_bytes or DEFAULT_MAX_BYTES)
+        FactorizationCache.persistent = self.disk_cache if factorizations else None
+    
+    def disable_disk_cache(self):
+        if self.disk_cache is None:
+            return
+        from strategies.factorization import FactorizationCache
+        if FactorizationCache.persistent is self.disk_cache:
+            FactorizationCache.persistent = None
+        self.disk_cache.close()
+        self.disk_cache = None
+    
+    def disk_cache_stats(self) -> Optional[dict]:
+        return self.disk_cache.stats() if self.disk_cache is not None else None
+    
+    def calculate_currents(self, monitor=None, circuit=None) -> Optional[List[float]]:
+        """
+        Calcula las corrientes del circuito (o de una copia, p. ej. circuit.snapshot()
+        para resolver en otro hilo). monitor permite informar progreso y cancelar.
+        circuit también puede ser un Netlist: devuelve la corriente de cada resistencia.
+        """
+        circuit = self.circuit if circuit is None else circuit
+        
+        if self.analytic is not None and self.analytic.supports(circuit):
+            strategy = self.analytic
+        elif circuit.circuit_type == 'netlist' and not getattr(self.strategy, 'handles_netlists', False):
+            strategy = self.sparse
+        else:
+            strategy = self.current_strategy()
+        
+        # Se leen una vez: la interfaz puede activarlas o quitarlas durante un cálculo
+        result_cache, disk_cache = self.result_cache, self.disk_cache
+        if result_cache is None and disk_cache is None:
+            return self._solve(strategy, circuit, monitor)
+        
+        # La huella de la red cubre tipo de circuito y resistencias, y la
+        # invalidan los métodos que modifican el circuito; cache_key() agrega
+        # la clase y la configuración de la estrategia
+        key = (circuit.network_fingerprint(), circuit.voltage, strategy.cache_key())
+        if result_cache is not None:
+            cached = result_cache.get(key)
+            if cached is not None:
+                PROFILER.count('result_cache.hit')
+                return list(cached)
+            PROFILER.count('result_cache.miss')
+        
+        currents = self._load_or_solve(strategy, circuit, disk_cache, monitor)
+        if currents is not None and result_cache is not None:
+            result_cache.put(key, tuple(currents))
+        return currents
     
+    def _load_or_solve(self, strategy, circuit, disk_cache, monitor=None):
+        """Busca las corrientes en la caché en disco antes de resolver"""
+        if disk_cache is None:
+            return self._solve(strategy, circuit, monitor)
+        
+        from utils.disk_cache import result_key
+        key = result_key(circuit, strategy)
+        with PROFILER.timer('disk_cache.get'):
+            currents = disk_cache.get_currents(key)
+        if currents is not None:
+            PROFILER.count('disk_cache.hit')
+            return currents
+        
+        PROFILER.count('disk_cache.miss')
+        currents = self._solve(strategy, circuit, monitor)
+        if currents is not None:
+            with PROFILER.timer('disk_cache.put'):
+                disk_cache.put_currents(key, currents)
+        return currents
+    
+    def _solve(self, strategy, circuit, monitor=None):
+        # Un cronómetro por clase de estrategia: son las estadísticas por estrategia del informe
+        with PROFILER.timer(f"solve.{type(strategy).__name__}"):
+            currents = strategy.solve(circuit, monitor)
+        if currents is None:
+            PROFILER.count(f"solve.{type(strategy).__name__}.failed")
+        return currents
+    
+    def enable_profiling(self, track_memory: bool = False):
+        """Activa la instrumentación (desactivada por defecto); track_memory usa tracemalloc"""
+        PROFILER.enable(track_memory)
+    
+    def disable_profiling(self):
+        PROFILER.disable()
+    
+    def reset_profiling(self):
+        PROFILER.reset()
+    
+    def profiling_report(self) -> dict:
+        """Cronómetros, contadores y estadísticas por estrategia acumulados hasta ahora"""
+        report = PROFILER.report()
+        report['result_cache'] = self.cache_stats()
+        report['disk_cache'] = self.disk_cache_stats()
+        return report
+    
+    def export_profile(self, path: Optional[str] = None) -> str:
+        """El informe como JSON (y en el archivo path, si se indica)"""
+        import json
+        text = json.dumps(self.profiling_report(), indent=2, ensure_ascii=False)
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text + "\n")
+        return text
+    
+    @profiled('summarize')
+    def summarize(self, currents, circuit=None) -> Optional[dict]:
+        """
+        Resumen de un vector de corrientes: mínimo, máximo, valor eficaz (RMS),
+        potencia entregada por la fuente (b·x) y cantidad de mallas en sentido
+        antihorario. Es O(n) y no depende de cuántas filas se muestren.
+        """
+        import numpy as np
+
+        circuit = self.circuit if circuit is None else circuit
+        x = np.asarray(currents, dtype=float)
+        if x.size == 0:
+            return None
+
+        system = circuit.build_banded_system() if circuit.circuit_type != 'netlist' else None
+        total_power = float(system.b @ x) if system is not None and len(system.b) == len(x) else None
+
+        return {
+            'count': int(x.size),
+            'min': float(x.min()),
+            'max': float(x.max()),
+            'rms': float(np.sqrt(np.mean(x * x))),
+            'total_power': total_power,
+            'counterclockwise': int(np.count_nonzero(x < 0))
+        }
+
+    def analyze(self) -> Optional[dict]:
+        """Resistencia equivalente, corrientes, caídas y potencias (solo serie/paralelo)"""
+        if self.analytic is None:
+            return None
+        return self.analytic.analyze(self.circuit)
+
+    def sweep(self, voltages=None, resistors=None, strategy=None):
+        """
+        Barrido de parámetros resuelto por lotes, sin modificar el circuito
+        ni notificar a los observadores.
+
+        Args:
+            voltages: lista de voltajes (por defecto el voltaje actual)
+            resistors: lista de vectores de resistencias, todos de igual longitud
+                       (por defecto las resistencias actuales)
+            strategy: estrategia a usar (por defecto la analítica si aplica, si no la actual)
+
+        Returns:
+            Array (n_puntos, n_corrientes) recorriendo la grilla vectores x voltajes,
+            con el voltaje variando más rápido; None si el circuito es inválido
+        """
+        import numpy as np
+
+        V = np.atleast_1d(np.asarray(self.circuit.voltage if voltages is None else voltages, dtype=float))
+        R = np.atleast_2d(np.asarray(self.circuit.resistors if resistors is None else resistors, dtype=float))
+
+        # Solo se expande la grilla si ambos ejes tienen más de un valor
+        if len(V) > 1 and len(R) > 1:
+            n_voltages = len(V)
+            V = np.tile(V, len(R))
+            R = np.repeat(R, n_voltages, axis=0)
+
+        circuit_type = self.circuit.circuit_type
+        if strategy is None:
+            if self.analytic is not None and circuit_type in self.analytic.TOPOLOGIES:
+                strategy = self.analytic
+            else:
+                strategy = self.current_strategy()
+
+        return strategy.solve_batch(circuit_type, V, R)
+
+    def tolerance_analysis(self, tolerance=0.05, samples: int = 10000, distribution: str = 'uniforme',
+                           seed: Optional[int] = None, workers: Optional[int] = None,
+                           spec_tolerance: Optional[float] = None, limits=None, method: str = 'auto'):
+        """
+        Monte Carlo de tolerancias sobre el circuito actual (sin modificarlo):
+        ver MonteCarloAnalysis.run para los argumentos y el informe.
+        """
+        from controllers.tolerance_analysis import MonteCarloAnalysis
+
+        analysis = MonteCarloAnalysis(
+            self.circuit.circuit_type, self.circuit.voltage, self.circuit.resistors,
+            tolerance=tolerance, distribution=distribution, method=method, seed=seed
+        )
+        return analysis.run(samples, workers=workers, spec_tolerance=spec_tolerance, limits=limits)
+
+    def save_circuit(self, path: str, currents=None):
+        """Guarda el circuito actual (y opcionalmente sus corrientes) en formato .psim"""
+        from models.circuit_file import save_circuit
+        save_circuit(path, self.circuit.circuit_type, self.circuit.voltage, self.circuit.resistors, currents)
+
+    def load_circuit(self, path: str):
+        """Carga un .psim en el circuito, con una sola notificación a los observadores"""
+        from models.circuit_file import CircuitFile
+
+        with CircuitFile(path) as circuit_file, self.circuit.batch():
+            self.circuit.set_circuit_type(circuit_file.circuit_type)
+            self.circuit.set_voltage(circuit_file.voltage)
+            self.circuit.replace_resistors(circuit_file.resistors)
+
+    def solve_file(self, path: str, monitor=None):
+        """
+        Resuelve un .psim sin cargarlo en el circuito: las estrategias leen las
+        resistencias directo del archivo mapeado y las corrientes se escriben
+        en el mismo archivo.
+
+        Returns:
+            Tuple[vista de las corrientes en el archivo, snapshot]; (None, snapshot) si falla
+        """
+        from models.circuit_file import CircuitFile
+
+        # close() vuelca y suelta el mapeo en todos los casos; las vistas
+        # devueltas siguen siendo válidas
+        with CircuitFile(path, 'r+') as circuit_file:
+            snapshot = circuit_file.snapshot()
+            currents = self.calculate_currents(monitor, circuit=snapshot)
+            if currents is None:
+                return None, snapshot
+            return circuit_file.write_currents(currents), snapshot
+
     def add_resistor(self, resistance: float):
         self.circuit.add_resistor(resistance)
     
@@ -24,5 +300,6 @@ class CircuitController:
     def get_circuit_data(self):
         return {
             'voltage': self.circuit.voltage,
-            'resistors': self.circuit.resistors.copy()
+            # Vista de solo lectura sin copia
+            'resistors': self.circuit.resistors
         }
@@ -0,0 +1,217 @@
+"""
+Análisis de tolerancias por Monte Carlo
+Perturba las resistencias según su tolerancia (±1 %, ±5 %...), resuelve las
+muestras por lotes con solve_batch y reparte los bloques entre procesos.
+Cada proceso escribe sus corrientes directo en un buffer de memoria
+compartida, así que los resultados no se serializan de vuelta.
+
+Reproducible: cada bloque de muestras tiene su propia semilla derivada de
+la semilla principal (SeedSequence.spawn) y los bloques no dependen de la
+cantidad de procesos, así que la misma semilla da las mismas muestras con
+1 o con 16 procesos.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, Sequence
+import os
+import time
+import numpy as np
+
+DISTRIBUTIONS = ('uniforme', 'normal')
+# Clases de resolution_strategies que se pueden usar en los procesos
+METHODS = {
+    'auto': 'AutoStrategy',
+    'cramer': 'CramerStrategy',
+    'gauss': 'GaussJordanStrategy',
+    'numeric': 'NumericStrategy',
+    'tridiagonal': 'TridiagonalStrategy',
+    'analytic': 'AnalyticStrategy'
+}
+DEFAULT_PERCENTILES = (1.0, 5.0, 50.0, 95.0, 99.0)
+# Muestras por bloque: la unidad de reparto y de semilla
+CHUNK_SIZE = 2048
+# Memoria máxima de cada llamada a solve_batch dentro de un bloque
+BATCH_BYTES = 64 * 2**20
+
+
+def sample_resistors(nominal, tolerance, distribution: str, rng, count: int) -> np.ndarray:
+    """
+    Muestras (count, n) de resistencias alrededor de los valores nominales.
+
+    uniforme -> R·(1 + U(-t, t))
+    normal   -> R·(1 + N(0, t/3)), recortada a ±t (la tolerancia como 3σ)
+    """
+    R = np.asarray(nominal, dtype=float)
+    t = np.broadcast_to(np.asarray(tolerance, dtype=float), R.shape)
+
+    if distribution == 'uniforme':
+        deviation = rng.uniform(-1.0, 1.0, (count, len(R))) * t
+    elif distribution == 'normal':
+        deviation = np.clip(rng.standard_normal((count, len(R))) * (t / 3.0), -t, t)
+    else:
+        raise ValueError(f"Distribución desconocida: {distribution}")
+
+    return R * (1.0 + deviation)
+
+
+def _batch_rows(method: str, circuit_type: str, n: int) -> int:
+    """Muestras por llamada a solve_batch sin pasar de BATCH_BYTES"""
+    banded = circuit_type in ('serie', 'paralelo') or method in ('auto', 'tridiagonal', 'analytic')
+    per_sample = 8 * n * (8 if banded else n + 2)
+    return max(1, int(BATCH_BYTES // per_sample))
+
+
+def _solve_chunk(task: dict) -> int:
+    """
+    Trabajo de un proceso: muestrea un bloque, lo resuelve por lotes y
+    escribe las corrientes en las filas [start, start + count) del buffer
+    compartido. Devuelve cuántas filas quedaron en NaN (sistemas singulares).
+    """
+    from strategies import resolution_strategies
+
+    memory = shared_memory.SharedMemory(name=task['buffer'])
+    try:
+        results = np.ndarray(task['shape'], dtype=float, buffer=memory.buf)
+        rng = np.random.default_rng(task['seed'])
+        R = sample_resistors(task['nominal'], task['tolerance'], task['distribution'], rng, task['count'])
+
+        strategy = getattr(resolution_strategies, METHODS[task['method']])()
+        rows = _batch_rows(task['method'], task['circuit_type'], R.shape[1])
+        failed = 0
+        for offset in range(0, task['count'], rows):
+            block = R[offset:offset + rows]
+            currents = strategy.solve_batch(task['circuit_type'], task['voltage'], block)
+            target = results[task['start'] + offset:task['start'] + offset + len(block)]
+            if currents is None:
+                target[:] = np.nan
+            else:
+                target[:] = currents
+            failed += int(np.count_nonzero(np.isnan(target).any(axis=1)))
+        del results, target
+        return failed
+    finally:
+        memory.close()
+
+
+class MonteCarloAnalysis:
+    """
+    Distribución de las corrientes de un circuito cuando cada resistencia
+    varía dentro de su tolerancia.
+
+        analysis = MonteCarloAnalysis('mallas', 15.0, [3, 4, 5], tolerance=0.05, seed=42)
+        report = analysis.run(samples=100_000, workers=4, spec_tolerance=0.02)
+        report['yield']  # fracción de placas con todas las corrientes en especificación
+
+    tolerance puede ser un escalar o un vector (una tolerancia por resistencia).
+    """
+    def __init__(self, circuit_type: str, voltage: float, resistors: Sequence[float],
+                 tolerance=0.05, distribution: str = 'uniforme', method: str = 'auto',
+                 seed: Optional[int] = None):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Distribución desconocida: {distribution}")
+        if method not in METHODS:
+            raise ValueError(f"Método desconocido: {method}")
+        self.circuit_type = circuit_type
+        self.voltage = float(voltage)
+        self.nominal = np.array(resistors, dtype=float)
+        self.tolerance = np.broadcast_to(np.asarray(tolerance, dtype=float), self.nominal.shape).copy()
+        self.distribution = distribution
+        # serie y paralelo tienen solución cerrada
+        self.method = 'analytic' if circuit_type in ('serie', 'paralelo') else method
+        # Sin semilla se elige una al azar, pero queda registrada en el informe
+        self.seed = int(np.random.SeedSequence().entropy) if seed is None else int(seed)
+
+    def nominal_currents(self) -> Optional[np.ndarray]:
+        from strategies import resolution_strategies
+        strategy = getattr(resolution_strategies, METHODS[self.method])()
+        currents = strategy.solve_batch(self.circuit_type, self.voltage, self.nominal)
+        return None if currents is None else currents[0]
+
+    def run(self, samples: int = 10000, workers: Optional[int] = None,
+            spec_tolerance: Optional[float] = None, limits=None,
+            percentiles: Sequence[float] = DEFAULT_PERCENTILES, chunk_size: int = CHUNK_SIZE,
+            keep_samples: bool = False) -> Optional[dict]:
+        """
+        Corre la simulación.
+
+        Args:
+            samples: cantidad de muestras
+            workers: procesos (por defecto todos los núcleos; 1 corre en este proceso)
+            spec_tolerance: desvío relativo admitido respecto de la corriente nominal
+            limits: (mínimo, máximo) absolutos por corriente, escalares o vectores;
+                    si se dan, tienen prioridad sobre spec_tolerance
+            percentiles: percentiles a informar
+            chunk_size: muestras por bloque (también fija las semillas)
+            keep_samples: incluye la matriz (muestras, corrientes) en el informe
+
+        Returns:
+            dict con mean, std, percentiles {p: vector}, out_of_spec (fracción por
+            corriente), yield, failed, elapsed y los parámetros usados; None si el
+            circuito es inválido
+        """
+        nominal = self.nominal_currents()
+        if nominal is None or samples <= 0:
+            return None
+
+        start_time = time.perf_counter()
+        chunks = [(start, min(chunk_size, samples - start)) for start in range(0, samples, chunk_size)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(chunks))
+        workers = max(1, min(workers or os.cpu_count() or 1, len(chunks)))
+        shape = (samples, len(nominal))
+
+        memory = shared_memory.SharedMemory(create=True, size=max(8 * samples * len(nominal), 1))
+        try:
+            tasks = [{
+                'buffer': memory.name, 'shape': shape, 'start': start, 'count': count, 'seed': seed,
+                'circuit_type': self.circuit_type, 'voltage': self.voltage, 'nominal': self.nominal,
+                'tolerance': self.tolerance, 'distribution': self.distribution, 'method': self.method
+            } for (start, count), seed in zip(chunks, seeds)]
+
+            if workers == 1:
+                failed = sum(map(_solve_chunk, tasks))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    failed = sum(pool.map(_solve_chunk, tasks))
+
+            currents = np.array(np.ndarray(shape, dtype=float, buffer=memory.buf))
+        finally:
+            memory.close()
+            memory.unlink()
+
+        report = self._statistics(currents, nominal, spec_tolerance, limits, percentiles)
+        report.update(
+            samples=samples, failed=failed, seed=self.seed, workers=workers,
+            distribution=self.distribution, method=self.method,
+            elapsed=time.perf_counter() - start_time
+        )
+        if keep_samples:
+            report['currents'] = currents
+        return report
+
+    @staticmethod
+    def _statistics(currents: np.ndarray, nominal: np.ndarray, spec_tolerance, limits, percentiles) -> dict:
+        valid = currents[~np.isnan(currents).any(axis=1)]
+        report = {
+            'nominal': nominal,
+            'mean': valid.mean(axis=0) if len(valid) else np.full(len(nominal), np.nan),
+            'std': valid.std(axis=0, ddof=1) if len(valid) > 1 else np.full(len(nominal), np.nan),
+            'percentiles': {
+                float(p): value for p, value in zip(percentiles, np.percentile(valid, percentiles, axis=0))
+            } if len(valid) else {}
+        }
+
+        if limits is not None:
+            low, high = (np.broadcast_to(np.asarray(limit, dtype=float), nominal.shape) for limit in limits)
+        elif spec_tolerance is not None:
+            margin = np.abs(nominal) * spec_tolerance
+            low, high = nominal - margin, nominal + margin
+        else:
+            return report
+
+        # Una muestra que no se pudo resolver cuenta como fuera de especificación
+        with np.errstate(invalid='ignore'):
+            outside = ~((currents >= low) & (currents <= high))
+        report['limits'] = (low, high)
+        report['out_of_spec'] = outside.mean(axis=0)
+        report['yield'] = float(1.0 - outside.any(axis=1).mean())
+        return report
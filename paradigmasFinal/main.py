@@ -1,16 +1,19 @@
-import customtkinter as ctk
 import sys
 import os
 
 # Agregar el directorio raíz al path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from views.gui import CircuitAnalyzerGUI
 
 def main():
+    # Importaciones diferidas: importar este módulo no carga Tk;
+    # NumPy y las estrategias se cargan después del primer dibujado
+    import customtkinter as ctk
+    from views.gui import CircuitAnalyzerGUI
+    
     root = ctk.CTk()
     app = CircuitAnalyzerGUI(root)
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
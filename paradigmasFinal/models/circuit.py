@@ -1,60 +1,106 @@
-from typing import List, Tuple
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from models.mesh_system import build_banded_system, network_fingerprint
+from models.resistor_buffer import ResistorBuffer, as_float_array
+from utils.profiling import profiled
 
 class Observer:
     #"Interfaz Observer"
+    __slots__ = ()
+    
     def update(self, subject):
         pass
 
+class CircuitChange:
+    """
+    Resumen de cambios entregado en una notificación (subject.last_change).
+
+    events es la lista ordenada de operaciones aplicadas:
+    ('add', inicio, cantidad), ('remove', índice), ('edit', índice, anterior, nuevo),
+    ('replace', n_anterior, n_nuevo), ('voltage', anterior, nuevo),
+    ('circuit_type', anterior, nuevo)
+    """
+    __slots__ = ('events',)
+    NETWORK_EVENTS = ('add', 'remove', 'edit', 'replace', 'circuit_type')
+
+    def __init__(self):
+        self.events: List[tuple] = []
+
+    def record(self, *event):
+        self.events.append(event)
+
+    @property
+    def network_changed(self) -> bool:
+        return any(event[0] in self.NETWORK_EVENTS for event in self.events)
+
+    @property
+    def voltage_changed(self) -> bool:
+        return any(event[0] == 'voltage' for event in self.events)
+
+    @property
+    def added(self) -> int:
+        """Cantidad de resistencias agregadas"""
+        return sum(event[2] for event in self.events if event[0] == 'add')
+
+    @property
+    def removed(self) -> int:
+        """Cantidad de resistencias eliminadas"""
+        return sum(1 for event in self.events if event[0] == 'remove')
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __repr__(self) -> str:
+        return f"CircuitChange({self.events!r})"
+
 class Subject: #CLASE PARA PATRON OBSERVER
+    __slots__ = ('_observers', 'last_change')
+    
     def __init__(self):
         self._observers: List[Observer] = []
+        self.last_change: Optional[CircuitChange] = None
     
     def add_observer(self, observer: Observer):
         self._observers.append(observer)
     
-    def notify_observers(self):
-        for observer in self._observers:
+    def remove_observer(self, observer: Observer):
+        if observer in self._observers:
+            self._observers.remove(observer)
+    
+    def notify_observers(self, change: Optional[CircuitChange] = None):
+        self.last_change = change
+        # Copia: un observador puede darse de baja durante la notificación
+        for observer in list(self._observers):
             observer.update(self)
 
-class Circuit(Subject):
-    #Singleton Pattern: Garantiza una única instancia del circuito
-    #SRP: Responsable solo de mantener el estado del circuito
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
-    def __init__(self):
-        if self._initialized:
-            return
-        super().__init__()
-        self.voltage: float = 15.0
-        self.resistors: List[float] = [7.0, 5.0, 2.0]
-        self.circuit_type: str = 'serie'  # 'serie', 'paralelo', 'mallas'
-        self._initialized = True
+class CircuitState:
+    """
+    Consultas y armado del sistema de mallas a partir del estado del circuito
+    (voltage, circuit_type, resistors, network_revision). Lo comparten el
+    circuito real y sus copias inmutables (CircuitSnapshot).
+    """
+    __slots__ = ()
     
-    def set_voltage(self, voltage: float):
-        self.voltage = voltage
-        self.notify_observers()
-    
-    def set_circuit_type(self, circuit_type: str):
-        if circuit_type in ['serie', 'paralelo', 'mallas']:
-            self.circuit_type = circuit_type
-            self.notify_observers()
-    
-    def add_resistor(self, resistance: float):
-        if resistance > 0:
-            self.resistors.append(resistance)
-            self.notify_observers()
+    def changes_since(self, revision: int) -> Optional[List[tuple]]:
+        """
+        Eventos de red ocurridos después de la revisión indicada, en orden.
+        Devuelve None si el registro ya no llega tan atrás.
+        """
+        if revision == self.network_revision:
+            return []
+        if revision > self.network_revision or not self._change_log or self._change_log[0][0] > revision + 1:
+            return None
+        return [event for event_revision, event in self._change_log if event_revision > revision]
     
-    def remove_resistor(self, index: int):
-        if 0 <= index < len(self.resistors):
-            self.resistors.pop(index)
-            self.notify_observers()
+    def network_fingerprint(self) -> str:
+        """Huella de la red actual; se recalcula solo tras modificar la red"""
+        if self._fingerprint is None:
+            self._fingerprint = network_fingerprint(self.circuit_type, self.resistors)
+        return self._fingerprint
     
+    @profiled('build.mesh_system')
     def build_mesh_system(self) -> Tuple[List[List[float]], List[float]]:
         """
         Construye el sistema de ecuaciones para análisis de mallas
@@ -114,10 +160,203 @@ class Circuit(Subject):
                     A[i][i+1] = -(self.resistors[i+1] if i+1 < n else 0)
         
         return A, b
+
+    @profiled('build.banded_system')
+    def build_banded_system(self):
+        """
+        Construye el mismo sistema que build_mesh_system en forma compacta:
+        solo las diagonales no nulas, como buffers contiguos de NumPy.
+
+        Returns:
+            BandedSystem (o None si hay menos de 2 resistencias)
+        """
+        return build_banded_system(self.circuit_type, self.voltage, self.resistors)
+
+    def to_netlist(self):
+        """El circuito como Netlist general (ver Netlist.from_legacy)"""
+        from models.netlist import Netlist
+        return Netlist.from_legacy(self.circuit_type, self.voltage, self.resistors)
+
+class Circuit(Subject, CircuitState):
+    #Singleton Pattern: Garantiza una única instancia del circuito
+    #SRP: Responsable solo de mantener el estado del circuito
+    _instance = None
+    # Cantidad de eventos de red que se recuerdan para los cálculos incrementales
+    CHANGE_LOG_SIZE = 256
+    __slots__ = (
+        'voltage', 'circuit_type', 'network_revision', '_buffer', '_change_log',
+        '_fingerprint', '_batch_depth', '_pending', '_initialized'
+    )
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+    
+    def __init__(self):
+        if self._initialized:
+            return
+        super().__init__()
+        self.voltage: float = 15.0
+        # Resistencias en un buffer float64 contiguo (ver resistors)
+        self._buffer = ResistorBuffer([7.0, 5.0, 2.0])
+        self.circuit_type: str = 'serie'  # 'serie', 'paralelo', 'mallas'
+        # Cambia cada vez que se modifica la red (resistencias o tipo), no el voltaje
+        self.network_revision: int = 0
+        self._change_log = deque(maxlen=self.CHANGE_LOG_SIZE)
+        self._fingerprint = None
+        # Cambios acumulados dentro de batch()
+        self._batch_depth = 0
+        self._pending: Optional[CircuitChange] = None
+        self._initialized = True
+    
+    @property
+    def origin(self) -> "Circuit":
+        """Circuito del que proviene el estado (él mismo; en una copia, el original)"""
+        return self
+    
+    def snapshot(self) -> "CircuitSnapshot":
+        """Copia inmutable del estado actual, segura para resolver en otro hilo"""
+        return CircuitSnapshot(
+            self.circuit_type, self.voltage, self.resistors,
+            self.network_revision, self._change_log, self._fingerprint, origin=self
+        )
+    
+    @property
+    def resistors(self) -> np.ndarray:
+        """Vista de solo lectura, sin copia, de las resistencias (válida hasta la próxima modificación)"""
+        return self._buffer.view()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa varias modificaciones en una sola notificación:
+
+            with circuit.batch():
+                circuit.add_resistors(valores)
+                circuit.set_voltage(12.0)
+
+        Los observadores reciben un único evento al salir del bloque más externo,
+        con el resumen de cambios en subject.last_change.
+        """
+        self._batch_depth += 1
+        if self._pending is None:
+            self._pending = CircuitChange()
+        try:
+            yield self._pending
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                change, self._pending = self._pending, None
+                if change:
+                    self.notify_observers(change)
+    
+    def _emit(self, *event):
+        """Registra el cambio; fuera de batch() notifica de inmediato"""
+        if event[0] in CircuitChange.NETWORK_EVENTS:
+            self._network_changed()
+            self._change_log.append((self.network_revision, event))
+        
+        if self._batch_depth:
+            self._pending.record(*event)
+            return
+        
+        change = CircuitChange()
+        change.record(*event)
+        self.notify_observers(change)
+    
+    def set_voltage(self, voltage: float):
+        previous = self.voltage
+        self.voltage = voltage
+        self._emit('voltage', previous, voltage)
+    
+    def set_circuit_type(self, circuit_type: str):
+        if circuit_type in ['serie', 'paralelo', 'mallas']:
+            previous = self.circuit_type
+            self.circuit_type = circuit_type
+            self._emit('circuit_type', previous, circuit_type)
+    
+    def add_resistor(self, resistance: float):
+        if resistance > 0:
+            self._buffer.append(resistance)
+            self._emit('add', len(self._buffer) - 1, 1)
+    
+    def remove_resistor(self, index: int):
+        if 0 <= index < len(self._buffer):
+            self._buffer.pop(index)
+            self._emit('remove', index)
+    
+    def set_resistor(self, index: int, resistance: float):
+        """Modifica el valor de una resistencia existente"""
+        if 0 <= index < len(self._buffer) and resistance > 0:
+            previous = float(self._buffer.view()[index])
+            self._buffer.set(index, resistance)
+            self._emit('edit', index, previous, float(resistance))
+    
+    def add_resistors(self, resistances: Iterable[float]):
+        """Agrega varias resistencias con una sola notificación (las no positivas se ignoran)"""
+        values = as_float_array(resistances)
+        values = values[values > 0]
+        if len(values):
+            start = len(self._buffer)
+            self._buffer.extend(values)
+            self._emit('add', start, len(values))
+    
+    def remove_resistors(self, indices: Iterable[int]):
+        """Elimina varias resistencias en O(n) con una sola notificación"""
+        n = len(self._buffer)
+        doomed = sorted({i for i in indices if 0 <= i < n}, reverse=True)
+        if not doomed:
+            return
+        
+        self._buffer.delete(doomed)
+        
+        # Índices de mayor a menor: aplicar los eventos en orden sigue siendo válido
+        with self.batch():
+            for index in doomed:
+                self._emit('remove', index)
+    
+    def replace_resistors(self, resistances: Iterable[float]):
+        """Reemplaza todas las resistencias (las no positivas se ignoran, como en add_resistor)"""
+        values = as_float_array(resistances)
+        previous = len(self._buffer)
+        self._buffer.assign(values[values > 0])
+        self._emit('replace', previous, len(self._buffer))
+    
+    def _network_changed(self):
+        self.network_revision += 1
+        self._fingerprint = None
     
     @classmethod
     def get_instance(cls):
         """Obtiene la instancia única del circuito"""
         if cls._instance is None:
             cls._instance = Circuit()
-        return cls._instance
\ No newline at end of file
+        return cls._instance
+
+class CircuitSnapshot(CircuitState):
+    """Estado congelado de un circuito: no notifica ni cambia después de creado"""
+    __slots__ = (
+        'circuit_type', 'voltage', 'resistors', 'network_revision',
+        '_change_log', '_fingerprint', 'origin'
+    )
+    
+    def __init__(self, circuit_type: str, voltage: float, resistors, network_revision: int = 0,
+                 change_log: Iterable[tuple] = (), fingerprint: Optional[str] = None, origin=None,
+                 copy: bool = True):
+        self.circuit_type = circuit_type
+        self.voltage = voltage
+        # copy=False solo para datos que nadie más modifica (p. ej. un archivo
+        # mapeado en solo lectura): un array float64 de solo lectura se usa tal cual.
+        # Las vistas de Circuit.resistors siempre se copian porque el búfer cambia
+        if (not copy and isinstance(resistors, np.ndarray) and resistors.dtype == np.float64
+                and not resistors.flags.writeable):
+            self.resistors = resistors
+        else:
+            self.resistors = np.array(resistors, dtype=float)
+            self.resistors.flags.writeable = False
+        self.network_revision = network_revision
+        self._change_log = tuple(change_log)
+        self._fingerprint = fingerprint
+        self.origin = self if origin is None else origin
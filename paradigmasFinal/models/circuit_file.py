@@ -0,0 +1,172 @@
+"""
+Formato binario de circuitos y resultados (.psim)
+Un encabezado fijo de 64 bytes seguido de los datos crudos en float64
+little-endian, listos para mapear en memoria sin interpretar ni copiar:
+
+    offset  tamaño  campo
+    0       8       firma b'PSIMCIRC'
+    8       2       versión del formato (uint16)
+    10      1       tipo de circuito (0 serie, 1 paralelo, 2 mallas)
+    11      1       banderas (bit 0: hay corrientes)
+    12      4       reservado
+    16      8       cantidad de resistencias n (uint64)
+    24      8       voltaje (float64)
+    32      8       cantidad de corrientes m (uint64, 0 si no hay)
+    40      24      reservado
+    64      8·n     resistencias
+    64+8·n  8·m     corrientes (opcional)
+
+Abrir un archivo de 10 millones de resistencias cuesta lo mismo que uno de
+tres: solo se lee el encabezado y se mapea el resto.
+"""
+from typing import Optional, Sequence
+import os
+import struct
+import numpy as np
+
+MAGIC = b'PSIMCIRC'
+VERSION = 1
+EXTENSION = '.psim'
+HEADER = struct.Struct('<8sHBBIQdQ24x')
+HEADER_SIZE = HEADER.size  # 64: los datos quedan alineados
+CIRCUIT_TYPES = ('serie', 'paralelo', 'mallas')
+HAS_CURRENTS = 0x01
+DTYPE = np.dtype('<f8')
+
+
+def current_count(circuit_type: str, n: int) -> int:
+    """Corrientes que devuelve una estrategia: una en serie, n en los demás"""
+    return 1 if circuit_type == 'serie' else n
+
+
+def _pack_header(circuit_type: str, voltage: float, n: int, m: int) -> bytes:
+    if circuit_type not in CIRCUIT_TYPES:
+        raise ValueError(f"Tipo de circuito desconocido: {circuit_type}")
+    flags = HAS_CURRENTS if m else 0
+    return HEADER.pack(MAGIC, VERSION, CIRCUIT_TYPES.index(circuit_type), flags, 0, n, float(voltage), m)
+
+
+class CircuitFile:
+    """
+    Circuito guardado en disco y mapeado en memoria.
+
+    resistors y currents son vistas np.memmap sobre el archivo: en modo 'r'
+    son de solo lectura (y snapshot() no las copia); en modo 'r+' escribir
+    en currents, o usar write_currents(), modifica el archivo en su lugar.
+    """
+    def __init__(self, path: str, mode: str = 'r'):
+        if mode not in ('r', 'r+'):
+            raise ValueError(f"Modo no soportado: {mode}")
+        self.path = path
+        self.mode = mode
+
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER_SIZE)
+        if len(raw) < HEADER_SIZE:
+            raise ValueError(f"{path}: archivo demasiado corto para un circuito")
+        magic, version, type_code, flags, _, n, voltage, m = HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: no es un circuito .psim")
+        if version > VERSION:
+            raise ValueError(f"{path}: versión de formato {version} no soportada")
+        if type_code >= len(CIRCUIT_TYPES):
+            raise ValueError(f"{path}: tipo de circuito inválido ({type_code})")
+
+        expected = HEADER_SIZE + 8 * (n + (m if flags & HAS_CURRENTS else 0))
+        if os.path.getsize(path) < expected:
+            raise ValueError(f"{path}: archivo truncado ({os.path.getsize(path)} de {expected} bytes)")
+
+        self.circuit_type = CIRCUIT_TYPES[type_code]
+        self.voltage = voltage
+        self.n = n
+        self.resistors = self._map(HEADER_SIZE, n)
+        self.currents = self._map(HEADER_SIZE + 8 * n, m) if flags & HAS_CURRENTS else None
+
+    def _map(self, offset: int, count: int) -> np.ndarray:
+        if count == 0:
+            return np.empty(0, dtype=DTYPE)
+        return np.memmap(self.path, dtype=DTYPE, mode=self.mode, offset=offset, shape=(count,))
+
+    @classmethod
+    def create(cls, path: str, circuit_type: str, voltage: float, n: int,
+               with_currents: bool = False) -> "CircuitFile":
+        """
+        Crea un archivo de n resistencias (en cero) y lo abre en 'r+' para
+        llenarlo por partes: sirve para generar redes que no entran en memoria.
+        Las corrientes reservadas empiezan en NaN (sin calcular).
+        """
+        m = current_count(circuit_type, n) if with_currents else 0
+        with open(path, 'wb') as f:
+            f.write(_pack_header(circuit_type, voltage, n, m))
+            f.truncate(HEADER_SIZE + 8 * (n + m))
+        circuit_file = cls(path, 'r+')
+        if circuit_file.currents is not None:
+            circuit_file.currents[:] = np.nan
+        return circuit_file
+
+    def snapshot(self):
+        """
+        CircuitSnapshot sobre las resistencias mapeadas, sin copia. En modo
+        'r+' no hay que modificar resistors mientras la copia esté en uso.
+        """
+        from models.circuit import CircuitSnapshot
+        view = self.resistors.view(np.ndarray)
+        view.flags.writeable = False
+        return CircuitSnapshot(self.circuit_type, self.voltage, view, copy=False)
+
+    def write_currents(self, currents) -> np.ndarray:
+        """
+        Guarda las corrientes en el archivo (modo 'r+'). Si todavía no había
+        lugar para ellas, se agrega al final y se actualiza el encabezado.
+        """
+        if self.mode != 'r+':
+            raise ValueError("El archivo está abierto en solo lectura")
+        values = np.asarray(currents, dtype=float)
+        m = current_count(self.circuit_type, self.n)
+        if len(values) != m:
+            raise ValueError(f"Se esperaban {m} corrientes y llegaron {len(values)}")
+
+        if self.currents is None:
+            with open(self.path, 'r+b') as f:
+                f.write(_pack_header(self.circuit_type, self.voltage, self.n, m))
+                f.truncate(HEADER_SIZE + 8 * (self.n + m))
+            self.currents = self._map(HEADER_SIZE + 8 * self.n, m)
+
+        self.currents[:] = values
+        self.flush()
+        return self.currents
+
+    def flush(self):
+        for view in (self.resistors, self.currents):
+            if isinstance(view, np.memmap):
+                view.flush()
+
+    def close(self):
+        """Suelta los mapeos (las vistas que se hayan entregado siguen siendo válidas)"""
+        self.flush()
+        self.resistors = self.currents = None
+
+    def __enter__(self) -> "CircuitFile":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def save_circuit(path: str, circuit_type: str, voltage: float, resistors: Sequence[float],
+                 currents: Optional[Sequence[float]] = None):
+    """Escribe un circuito (y opcionalmente sus corrientes) de una sola vez"""
+    R = np.ascontiguousarray(resistors, dtype=DTYPE)
+    I = None if currents is None else np.ascontiguousarray(currents, dtype=DTYPE)
+    if I is not None and len(I) != current_count(circuit_type, len(R)):
+        raise ValueError(f"Se esperaban {current_count(circuit_type, len(R))} corrientes y llegaron {len(I)}")
+
+    with open(path, 'wb') as f:
+        f.write(_pack_header(circuit_type, voltage, len(R), 0 if I is None else len(I)))
+        R.tofile(f)
+        if I is not None:
+            I.tofile(f)
+
+
+def load_circuit(path: str, mode: str = 'r') -> CircuitFile:
+    return CircuitFile(path, mode)
@@ -0,0 +1,225 @@
+"""
+Representación compacta del sistema de mallas
+Guarda solo las diagonales no nulas de A como buffers contiguos de NumPy
+"""
+from typing import Dict, Optional, Sequence, Tuple
+import hashlib
+import numpy as np
+
+
+class BandedSystem:
+    """
+    Sistema A·x = b almacenado por bandas.
+
+    bands[k] contiene la diagonal k de A (k = 0 principal, k < 0 debajo,
+    k > 0 encima), de longitud n - |k|. Las bandas que no aparecen son cero.
+    """
+    def __init__(self, bands: Dict[int, np.ndarray], b: np.ndarray):
+        self.b = np.ascontiguousarray(b, dtype=float)
+        self.n = len(self.b)
+        self.bands = {
+            k: np.ascontiguousarray(band, dtype=float)
+            for k, band in sorted(bands.items())
+        }
+
+    @property
+    def offsets(self) -> Tuple[int, ...]:
+        return tuple(self.bands)
+
+    @property
+    def is_diagonal(self) -> bool:
+        return self.offsets == (0,)
+
+    @property
+    def is_tridiagonal(self) -> bool:
+        return all(abs(k) <= 1 for k in self.bands)
+
+    @property
+    def nbytes(self) -> int:
+        return self.b.nbytes + sum(band.nbytes for band in self.bands.values())
+
+    def band(self, offset: int) -> np.ndarray:
+        """Devuelve la diagonal pedida (ceros si no está almacenada)"""
+        if offset in self.bands:
+            return self.bands[offset]
+        return np.zeros(max(self.n - abs(offset), 0))
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Calcula A·x en O(n·bandas) sin formar la matriz"""
+        x = np.asarray(x, dtype=float)
+        y = np.zeros(self.n)
+        for k, band in self.bands.items():
+            if k >= 0:
+                y[:self.n - k] += band * x[k:]
+            else:
+                y[-k:] += band * x[:self.n + k]
+        return y
+
+    def to_dense(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Respaldo denso para las estrategias que trabajan con la matriz completa"""
+        A = np.zeros((self.n, self.n))
+        _scatter_bands(A, self.bands)
+        return A, self.b.copy()
+
+
+def _scatter_bands(A: np.ndarray, bands: Dict[int, np.ndarray]):
+    """Copia las bandas en las dos últimas dimensiones de A (sirve para lotes)"""
+    n = A.shape[-1]
+    rows = np.arange(n)
+    for k, band in bands.items():
+        r = rows[:n - abs(k)]
+        if k >= 0:
+            A[..., r, r + k] = band
+        else:
+            A[..., r - k, r] = band
+
+
+def network_fingerprint(circuit_type: str, resistors: Sequence[float]) -> str:
+    """
+    Huella de la red: identifica la matriz A (tipo de circuito + resistencias),
+    independiente del voltaje. Es estable entre procesos.
+    """
+    R = np.ascontiguousarray(resistors, dtype=float)
+    digest = hashlib.blake2b(circuit_type.encode(), digest_size=16)
+    digest.update(R)
+    return digest.hexdigest()
+
+
+def build_banded_system(circuit_type: str, voltage: float,
+                        resistors: Sequence[float]) -> Optional[BandedSystem]:
+    """
+    Construye en forma compacta el mismo sistema que Circuit.build_mesh_system
+
+    serie    -> matriz 1x1 con la suma de resistencias
+    paralelo -> solo la diagonal principal (Ri*Ii = V)
+    mallas   -> escalera tridiagonal: cada Ri (i >= 1) es compartida
+                entre las mallas i-1 e i
+    """
+    R = np.asarray(resistors, dtype=float)
+    bands, b = build_banded_batch(circuit_type, voltage, R[np.newaxis, :])
+
+    if bands is None:
+        return None
+
+    return BandedSystem({k: band[0] for k, band in bands.items()}, b[0])
+
+
+def build_banded_batch(circuit_type: str, voltages,
+                       resistors) -> Tuple[Optional[Dict[int, np.ndarray]], Optional[np.ndarray]]:
+    """
+    Versión por lotes de build_banded_system: arma de una vez los sistemas
+    de k circuitos de la misma topología.
+
+    Args:
+        voltages: escalar o vector de longitud k
+        resistors: matriz (k, n) o vector (n,) compartido por todos los puntos
+
+    Returns:
+        Tuple[bands, b] con bands[offset] de forma (k, n - |offset|) y b de forma (k, n)
+    """
+    V = np.atleast_1d(np.asarray(voltages, dtype=float))
+    R = np.atleast_2d(np.asarray(resistors, dtype=float))
+    k = max(len(V), len(R))
+    n = R.shape[1]
+
+    if n < 2:
+        return None, None
+
+    V = np.broadcast_to(V, (k,))
+    R = np.broadcast_to(R, (k, n))
+
+    if circuit_type == 'serie':
+        return {0: R.sum(axis=1, keepdims=True)}, V[:, np.newaxis].copy()
+
+    if circuit_type == 'paralelo':
+        return {0: R}, np.repeat(V[:, np.newaxis], n, axis=1)
+
+    diag = np.empty((k, n))
+    diag[:, :-1] = R[:, :-1] + R[:, 1:]
+    diag[:, -1] = R[:, -1]
+    shared = -R[:, 1:]
+    b = np.zeros((k, n))
+    b[:, 0] = V
+
+    return {-1: shared, 0: diag, 1: shared}, b
+
+
+def build_dense_batch(circuit_type: str, voltages,
+                      resistors) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Respaldo denso por lotes: A de forma (k, n, n) y b de forma (k, n),
+    listos para una sola llamada a np.linalg.solve.
+    """
+    bands, b = build_banded_batch(circuit_type, voltages, resistors)
+
+    if bands is None:
+        return None, None
+
+    k, n = b.shape
+    A = np.zeros((k, n, n))
+    _scatter_bands(A, bands)
+    return A, b
+
+
+class MeshOperator:
+    """
+    A de mallas como operador lineal, aplicado directo desde las resistencias:
+    no guarda matriz ni bandas, solo R (y su diagonal si se pide).
+
+    En mallas A = Bᵀ·diag(R)·B, con B la incidencia rama-malla (bidiagonal:
+    la rama 0 es la malla 0 y la rama k la diferencia de las mallas k-1 y k).
+    B se invierte con una suma acumulada, así que ladder_solve aplica A⁻¹ en
+    O(n) vectorizado; sirve como precondicionador exacto de la escalera.
+    """
+    __slots__ = ('circuit_type', 'R', 'n')
+
+    def __init__(self, circuit_type: str, resistors: Sequence[float]):
+        self.circuit_type = circuit_type
+        self.R = np.asarray(resistors, dtype=float)
+        self.n = 1 if circuit_type == 'serie' else len(self.R)
+
+    def rhs(self, voltage: float) -> np.ndarray:
+        if self.circuit_type == 'paralelo':
+            return np.full(self.n, float(voltage))
+        b = np.zeros(self.n)
+        b[0] = voltage
+        return b
+
+    def diagonal(self) -> np.ndarray:
+        R = self.R
+        if self.circuit_type == 'serie':
+            return np.array([R.sum()])
+        if self.circuit_type == 'paralelo':
+            return R.copy()
+        diag = R.copy()
+        diag[:-1] += R[1:]
+        return diag
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """A·x en O(n) sin formar A"""
+        R = self.R
+        if self.circuit_type == 'serie':
+            return R.sum() * x
+        if self.circuit_type == 'paralelo':
+            return R * x
+        # (A·x)_i = diag_i·x_i - R_i·x_{i-1} - R_{i+1}·x_{i+1}
+        y = self.diagonal() * x
+        y[:-1] -= R[1:] * x[1:]
+        y[1:] -= R[1:] * x[:-1]
+        return y
+
+    def ladder_solve(self, b: np.ndarray) -> np.ndarray:
+        """
+        A⁻¹·b = B⁻¹·diag(R)⁻¹·B⁻ᵀ·b con dos sumas acumuladas.
+        Las resistencias tienen que ser no nulas.
+        """
+        if self.circuit_type != 'mallas':
+            return b / self.diagonal()
+
+        # Bᵀ·z = b: z_i = -Σ_{j>=i} b_j (i >= 1) y z_0 = Σ b_j
+        z = -np.cumsum(b[::-1])[::-1]
+        z[0] = -z[0]
+        # B·x = y: x_0 = y_0 y x_k = x_{k-1} - y_k
+        y = z / self.R
+        y[1:] = -y[1:]
+        return np.cumsum(y)
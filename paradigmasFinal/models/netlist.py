@@ -0,0 +1,285 @@
+"""
+Netlist: circuitos resistivos de topología arbitraria
+Nodos con nombre, resistencias entre pares de nodos y fuentes de tensión y
+de corriente. Se resuelve por análisis nodal modificado (MNA) con una matriz
+dispersa, así que escala a redes de cientos de miles de nodos.
+
+Las tres topologías clásicas ('serie', 'paralelo', 'mallas') son casos
+particulares: ver Netlist.from_legacy.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import hashlib
+import numpy as np
+from models.sparse import CSRMatrix
+
+GROUND = '0'
+GROUND_ALIASES = ('0', 'gnd', 'GND', 'tierra')
+
+# Sufijos de valores al estilo SPICE (se prueban en orden: 'meg' antes que 'm')
+_SUFFIXES = (('meg', 1e6), ('g', 1e9), ('k', 1e3), ('m', 1e-3), ('u', 1e-6), ('µ', 1e-6), ('n', 1e-9), ('p', 1e-12))
+
+
+def parse_value(text: str) -> float:
+    """'4.7k' -> 4700.0, '2meg' -> 2e6, '10m' -> 0.01"""
+    lowered = text.strip().lower()
+    for suffix, scale in _SUFFIXES:
+        if lowered.endswith(suffix):
+            return float(lowered[:-len(suffix)]) * scale
+    return float(lowered)
+
+
+class MNASystem:
+    """
+    Sistema nodal modificado A·x = b en forma dispersa.
+
+    Incógnitas: tensiones de los nodos (sin la tierra) y, después, la
+    corriente de cada fuente de tensión (entrando por su terminal +).
+
+        [ G   B ] [v]   [i]
+        [ Bᵀ  0 ] [j] = [e]
+    """
+    __slots__ = ('A', 'b', 'node_count', 'source_count')
+
+    def __init__(self, A: CSRMatrix, b: np.ndarray, node_count: int, source_count: int):
+        self.A = A
+        self.b = b
+        self.node_count = node_count
+        self.source_count = source_count
+
+    @property
+    def n(self) -> int:
+        return self.A.n
+
+
+class Netlist:
+    """
+    Red de resistencias y fuentes. Los nodos se crean al nombrarlos; '0'
+    (o gnd / tierra) es la referencia.
+
+    Convenciones (las de SPICE):
+        resistencia  a b R     corriente positiva de a hacia b
+        fuente V     p m V     V = v(p) - v(m)
+        fuente I     p m I     I circula por la fuente de p a m (entra a m)
+
+    Implementa lo que CircuitController y las estrategias consultan de un
+    circuito (circuit_type, voltage, resistors, network_fingerprint, origin).
+    """
+    circuit_type = 'netlist'
+
+    def __init__(self):
+        self.node_names: List[str] = [GROUND]
+        self._node_index: Dict[str, int] = {name: 0 for name in GROUND_ALIASES}
+        # Por tipo de elemento: nombres, nodo inicial, nodo final y valor
+        self._elements = {kind: ([], [], [], []) for kind in ('R', 'V', 'I')}
+        self.network_revision = 0
+        self._fingerprint = None
+
+    # Construcción
+
+    def node(self, name) -> int:
+        """Índice del nodo (lo crea si no existe)"""
+        name = str(name)
+        index = self._node_index.get(name)
+        if index is None:
+            index = len(self.node_names)
+            self.node_names.append(name)
+            self._node_index[name] = index
+        return index
+
+    def _add(self, kind: str, name: Optional[str], a, b, value: float):
+        self._extend(kind, [name], [a], [b], [value])
+
+    def _extend(self, kind: str, new_names, starts, ends, new_values):
+        names, start, end, values = self._elements[kind]
+        first = len(names) + 1
+        names.extend(name or f"{kind}{first + k}" for k, name in enumerate(new_names))
+        start.extend(self.node(a) for a in starts)
+        end.extend(self.node(b) for b in ends)
+        values.extend(float(value) for value in new_values)
+        self.network_revision += 1
+        self._fingerprint = None
+
+    def add_resistor(self, a, b, resistance: float, name: Optional[str] = None):
+        if resistance <= 0:
+            raise ValueError(f"La resistencia debe ser mayor a 0Ω ({name or 'R'}: {resistance})")
+        self._add('R', name, a, b, resistance)
+
+    def add_resistors(self, starts: Sequence, ends: Sequence, resistances: Sequence[float]):
+        """Agrega varias resistencias de una vez (para redes grandes armadas por programa)"""
+        values = np.asarray(resistances, dtype=float)
+        if len(starts) != len(values) or len(ends) != len(values):
+            raise ValueError("starts, ends y resistances deben tener la misma longitud")
+        if np.any(values <= 0):
+            raise ValueError("La resistencia debe ser mayor a 0Ω")
+        self._extend('R', [None] * len(values), starts, ends, values.tolist())
+
+    def add_voltage_source(self, positive, negative, voltage: float, name: Optional[str] = None):
+        self._add('V', name, positive, negative, voltage)
+
+    def add_current_source(self, start, end, current: float, name: Optional[str] = None):
+        self._add('I', name, start, end, current)
+
+    @classmethod
+    def parse(cls, text: str) -> "Netlist":
+        """
+        Lee un netlist al estilo SPICE, un elemento por línea:
+
+            * divisor resistivo
+            V1 entrada 0 12
+            R1 entrada salida 4.7k
+            R2 salida 0 10k
+            I1 0 salida 1m
+
+        Las líneas vacías, los comentarios (* o #) y las directivas (.end) se ignoran.
+        Lanza ValueError con el número de línea si algo no se entiende.
+        """
+        netlist = cls()
+        add = {'R': netlist.add_resistor, 'V': netlist.add_voltage_source, 'I': netlist.add_current_source}
+
+        for number, line in enumerate(text.splitlines(), start=1):
+            fields = line.split()
+            if not fields or fields[0][0] in '*#.':
+                continue
+            kind = fields[0][0].upper()
+            if kind not in add or len(fields) != 4:
+                raise ValueError(f"Línea {number} del netlist no válida: {line.strip()!r}")
+            try:
+                add[kind](fields[1], fields[2], parse_value(fields[3]), name=fields[0])
+            except ValueError as e:
+                raise ValueError(f"Línea {number} del netlist: {e}") from None
+
+        return netlist
+
+    @classmethod
+    def from_legacy(cls, circuit_type: str, voltage: float, resistors: Sequence[float]) -> "Netlist":
+        """
+        Las topologías clásicas como netlist (fuente V1 entre 'fuente' y tierra):
+
+        serie    -> R1..Rn en cadena de 'fuente' a tierra
+        paralelo -> cada Ri de 'fuente' a tierra
+        mallas   -> R1 de 'fuente' a 'a' y cada Rk (k >= 2) es un peldaño de 'a'
+                    a tierra. Los rieles de la escalera no tienen resistencia, así
+                    que todos los peldaños quedan entre los mismos dos nodos; la
+                    última malla se cierra con un conductor ideal (fuente de 0 V).
+
+        La corriente de mallas se recupera con legacy_currents.
+        """
+        R = np.asarray(resistors, dtype=float)
+        netlist = cls()
+        netlist.add_voltage_source('fuente', GROUND, voltage, name='V1')
+
+        n = len(R)
+        if circuit_type == 'serie':
+            nodes = ['fuente'] + [f"n{k}" for k in range(1, n)] + [GROUND]
+            netlist.add_resistors(nodes[:-1], nodes[1:], R)
+        elif circuit_type == 'paralelo':
+            netlist.add_resistors(['fuente'] * n, [GROUND] * n, R)
+        elif circuit_type == 'mallas':
+            netlist.add_resistors(['fuente'] + ['a'] * (n - 1), ['a'] + [GROUND] * (n - 1), R)
+            netlist.add_voltage_source('a', GROUND, 0.0, name='Vcierre')
+        else:
+            raise ValueError(f"Tipo de circuito desconocido: {circuit_type}")
+
+        return netlist
+
+    # Consultas (la interfaz de circuito que usan controlador y estrategias)
+
+    @property
+    def origin(self) -> "Netlist":
+        return self
+
+    @property
+    def resistors(self) -> np.ndarray:
+        """Valores de las resistencias, en orden de alta"""
+        return np.array(self._elements['R'][3])
+
+    @property
+    def voltage(self) -> Tuple[float, ...]:
+        """
+        Valores de todas las fuentes (V y luego I). Cumple el papel del voltaje
+        de los circuitos clásicos: la excitación, separada de la huella de la red.
+        """
+        return tuple(self._elements['V'][3]) + tuple(self._elements['I'][3])
+
+    @property
+    def node_count(self) -> int:
+        """Nodos sin contar la tierra"""
+        return len(self.node_names) - 1
+
+    def element_names(self, kind: str = 'R') -> List[str]:
+        return list(self._elements[kind][0])
+
+    def arrays(self, kind: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(nodo inicial, nodo final, valor) de los elementos del tipo pedido"""
+        _, start, end, values = self._elements[kind]
+        return np.array(start, dtype=np.int64), np.array(end, dtype=np.int64), np.array(values, dtype=float)
+
+    def network_fingerprint(self) -> str:
+        """Huella de topología y resistencias; no depende del valor de las fuentes"""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(self.circuit_type.encode(), digest_size=16)
+            for kind in ('R', 'V', 'I'):
+                start, end, values = self.arrays(kind)
+                digest.update(kind.encode())
+                digest.update(start)
+                digest.update(end)
+                if kind == 'R':
+                    digest.update(values)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    # Sistema MNA
+
+    def build_mna_system(self) -> Optional[MNASystem]:
+        """
+        Estampa resistencias y fuentes como tripletes COO y los compacta a CSR.
+        Todo vectorizado: O(elementos) en tiempo y memoria.
+        """
+        nodes = self.node_count
+        ra, rb, R = self.arrays('R')
+        va, vb, V = self.arrays('V')
+        ia, ib, I = self.arrays('I')
+        size = nodes + len(V)
+        if size == 0:
+            return None
+
+        g = 1.0 / R
+        source = nodes + np.arange(len(V))
+        # Fila/columna 0 es la tierra: se descartan y el resto se corre en 1
+        rows = np.concatenate([ra, rb, ra, rb, va, vb, source + 1, source + 1])
+        cols = np.concatenate([ra, rb, rb, ra, source + 1, source + 1, va, vb])
+        values = np.concatenate([g, g, -g, -g, np.ones(len(V)), -np.ones(len(V)),
+                                 np.ones(len(V)), -np.ones(len(V))])
+        keep = (rows > 0) & (cols > 0)
+        A = CSRMatrix.from_coo(rows[keep] - 1, cols[keep] - 1, values[keep], (size, size))
+
+        b = np.zeros(size + 1)
+        np.add.at(b, ia, -I)
+        np.add.at(b, ib, I)
+        b[source + 1] = V
+        return MNASystem(A, b[1:], nodes, len(V))
+
+    def branch_currents(self, solution: np.ndarray) -> np.ndarray:
+        """Corriente de cada resistencia (de a hacia b) a partir de la solución MNA"""
+        potentials = np.concatenate([[0.0], np.asarray(solution, dtype=float)[:self.node_count]])
+        ra, rb, R = self.arrays('R')
+        return (potentials[ra] - potentials[rb]) / R
+
+
+def legacy_currents(circuit_type: str, branch_currents: np.ndarray) -> np.ndarray:
+    """
+    Corrientes que devuelven las estrategias clásicas, desde las corrientes de
+    rama de Netlist.from_legacy:
+
+    serie    -> la única corriente de la cadena
+    paralelo -> una por rama
+    mallas   -> I1 = i(R1) e Ik = Ik-1 - i(Rk): cada peldaño lleva la
+                diferencia de las dos mallas que separa
+    """
+    if circuit_type == 'serie':
+        return branch_currents[:1]
+    if circuit_type == 'paralelo':
+        return branch_currents
+    currents = -branch_currents
+    currents[0] = branch_currents[0]
+    return np.cumsum(currents)
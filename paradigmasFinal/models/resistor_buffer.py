@@ -0,0 +1,72 @@
+"""
+Buffer contiguo de resistencias (float64)
+Crece por duplicación (append amortizado O(1)) y entrega vistas sin copia
+"""
+from typing import Iterable
+import numpy as np
+
+
+def as_float_array(values: Iterable[float]) -> np.ndarray:
+    """Convierte un iterable de números en un array float64 1-D (sin copiar si ya lo es)"""
+    if isinstance(values, np.ndarray):
+        return np.asarray(values, dtype=float).ravel()
+    return np.fromiter(values, dtype=float)
+
+
+class ResistorBuffer:
+    __slots__ = ('_data', '_size')
+
+    def __init__(self, values: Iterable[float] = (), capacity: int = 8):
+        values = as_float_array(values)
+        self._data = np.empty(max(capacity, len(values)), dtype=float)
+        self._size = len(values)
+        self._data[:self._size] = values
+
+    def _reserve(self, size: int):
+        if size > len(self._data):
+            data = np.empty(max(size, 2 * len(self._data)), dtype=float)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+
+    def append(self, value: float):
+        self._reserve(self._size + 1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values: Iterable[float]):
+        values = as_float_array(values)
+        self._reserve(self._size + len(values))
+        self._data[self._size:self._size + len(values)] = values
+        self._size += len(values)
+
+    def set(self, index: int, value: float):
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        self._data[index] = value
+
+    def pop(self, index: int) -> float:
+        value = float(self._data[index])
+        self._data[index:self._size - 1] = self._data[index + 1:self._size]
+        self._size -= 1
+        return value
+
+    def delete(self, indices: Iterable[int]):
+        """Elimina varias posiciones compactando el buffer en una pasada"""
+        keep = np.ones(self._size, dtype=bool)
+        keep[list(indices)] = False
+        kept = self._data[:self._size][keep]
+        self._data[:len(kept)] = kept
+        self._size = len(kept)
+
+    def assign(self, values: Iterable[float]):
+        self._size = 0
+        self.extend(values)
+
+    def view(self) -> np.ndarray:
+        """Vista de solo lectura sin copia; refleja el buffer hasta la próxima modificación"""
+        view = self._data[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,129 @@
+"""
+Matrices dispersas en formato CSR (filas comprimidas)
+Solo NumPy: se arman desde tripletes (fila, columna, valor) y, si SciPy
+está instalado, se convierten para usar su resolvedor directo.
+"""
+from typing import Tuple
+from collections import deque
+import numpy as np
+
+
+class CSRMatrix:
+    """
+    Matriz dispersa por filas: las columnas y valores de la fila i están en
+    indices[indptr[i]:indptr[i+1]] y data[indptr[i]:indptr[i+1]], ordenadas.
+    """
+    __slots__ = ('shape', 'indptr', 'indices', 'data')
+
+    def __init__(self, indptr, indices, data, shape: Tuple[int, int]):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = shape
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, shape: Tuple[int, int]) -> "CSRMatrix":
+        """Arma la matriz desde tripletes; las entradas repetidas se suman (como al estampar)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+
+        keys = rows * shape[1] + cols
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        unique, starts = np.unique(keys, return_index=True)
+        data = np.add.reduceat(values[order], starts) if len(keys) else values[:0]
+
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(unique // shape[1], minlength=shape[0]), out=indptr[1:])
+        return cls(indptr, unique % shape[1], data, shape)
+
+    @property
+    def n(self) -> int:
+        return self.shape[0]
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + self.data.nbytes
+
+    def row_ids(self) -> np.ndarray:
+        """Fila de cada entrada almacenada"""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """A·x en O(nnz)"""
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.row_ids(), weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def diagonal(self) -> np.ndarray:
+        rows = self.row_ids()
+        diag = np.zeros(min(self.shape))
+        on = rows == self.indices
+        diag[rows[on]] = self.data[on]
+        return diag
+
+    def bandwidth(self) -> Tuple[int, int]:
+        """(ancho inferior, ancho superior): máximas distancias a la diagonal"""
+        if not self.nnz:
+            return 0, 0
+        offset = self.indices - self.row_ids()
+        return int(max(-offset.min(), 0)), int(max(offset.max(), 0))
+
+    def permuted(self, perm: np.ndarray) -> "CSRMatrix":
+        """P·A·Pᵀ: la fila/columna nueva i es la perm[i] original"""
+        inverse = np.empty_like(perm)
+        inverse[perm] = np.arange(len(perm))
+        return CSRMatrix.from_coo(inverse[self.row_ids()], inverse[self.indices], self.data, self.shape)
+
+    def to_dense(self) -> np.ndarray:
+        A = np.zeros(self.shape)
+        A[self.row_ids(), self.indices] = self.data
+        return A
+
+    def to_scipy(self):
+        """Copia como scipy.sparse.csr_matrix (lanza ImportError si SciPy no está)"""
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+def reverse_cuthill_mckee(matrix: CSRMatrix) -> np.ndarray:
+    """
+    Orden de Cuthill-McKee inverso sobre el patrón simétrico de la matriz:
+    recorre cada componente en anchura desde un nodo de grado mínimo,
+    visitando primero a los vecinos de menor grado. Reduce el ancho de banda
+    (una cadena o escalera queda tridiagonal aunque los nodos vengan mezclados).
+    """
+    n = matrix.n
+    rows = matrix.row_ids()
+    off = rows != matrix.indices
+    # Patrón simétrico A + Aᵀ sin la diagonal
+    pattern = CSRMatrix.from_coo(
+        np.concatenate([rows[off], matrix.indices[off]]),
+        np.concatenate([matrix.indices[off], rows[off]]),
+        np.ones(2 * int(off.sum())), (n, n)
+    )
+    indptr, indices = pattern.indptr.tolist(), pattern.indices.tolist()
+    degree = np.diff(pattern.indptr)
+    degree_list = degree.tolist()
+
+    visited = [False] * n
+    order = []
+    for start in np.argsort(degree, kind='stable').tolist():
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            neighbors = [j for j in indices[indptr[node]:indptr[node + 1]] if not visited[j]]
+            neighbors.sort(key=degree_list.__getitem__)
+            for j in neighbors:
+                visited[j] = True
+            queue.extend(neighbors)
+
+    return np.array(order[::-1], dtype=np.int64)
@@ -0,0 +1,448 @@
+"""
+Factorizaciones reutilizables de la matriz de mallas
+A solo depende de las resistencias y del tipo de circuito: una vez factorizada,
+cambiar el voltaje (b) cuesta una sustitución O(n²) densa u O(n) tridiagonal.
+"""
+from typing import Tuple
+import weakref
+import numpy as np
+from models.circuit import Observer
+from models.sparse import CSRMatrix, reverse_cuthill_mckee
+from utils.lru_cache import LRUCache
+from utils.profiling import PROFILER
+
+PIVOT_TOLERANCE = 1e-10
+
+
+class DenseFactorization:
+    """
+    Cholesky (A = L·Lᵀ) si A es simétrica definida positiva, como las matrices
+    de mallas con resistencias positivas; si no, LU con pivoteo parcial de
+    LAPACK (scipy.linalg.lu_factor). Sin SciPy se guarda A⁻¹ (np.linalg.inv,
+    también LAPACK) y cada solve es un producto O(n²).
+
+    Lanza np.linalg.LinAlgError si algún pivote es (casi) cero o, sin SciPy,
+    si A está tan mal condicionada que A⁻¹ no tiene sentido.
+    """
+    def __init__(self, A):
+        A = np.asarray(A, dtype=float)
+        self.n = A.shape[0]
+        # Norma 1 (máxima suma de columna), para estimar el condicionamiento
+        self.norm1 = float(np.abs(A).sum(axis=0).max()) if self.n else 0.0
+        self._condition = None
+
+        try:
+            if not np.allclose(A, A.T):
+                raise np.linalg.LinAlgError("Matriz no simétrica")
+            self.L = np.linalg.cholesky(A)
+            self._inverse_L = None
+            self.kind = 'cholesky'
+            self.pivots = np.diagonal(self.L) ** 2
+        except np.linalg.LinAlgError:
+            self.kind = 'lu'
+            self._factor_lu(A)
+
+        if self.pivots is not None and np.any(np.abs(self.pivots) < PIVOT_TOLERANCE):
+            raise np.linalg.LinAlgError("Sistema singular")
+
+    def _factor_lu(self, A: np.ndarray):
+        try:
+            from scipy.linalg import lu_factor
+        except ImportError:
+            lu_factor = None
+
+        if lu_factor is not None:
+            self.lu = lu_factor(A, check_finite=False)
+            self.inverse = None
+            self.pivots = np.diagonal(self.lu[0]).copy()
+            swaps = np.count_nonzero(self.lu[1] != np.arange(self.n))
+            self._perm_sign = -1.0 if swaps % 2 else 1.0
+            return
+
+        # inv lanza LinAlgError si A es exactamente singular
+        self.lu = None
+        self.inverse = np.linalg.inv(A)
+        self.pivots = None
+        sign, log_det = np.linalg.slogdet(A)
+        self._slogdet = (float(sign), float(log_det))
+        # Con A⁻¹ a mano ‖A⁻¹‖₁ es exacta: no hace falta estimarla
+        self._condition = self.norm1 * float(np.abs(self.inverse).sum(axis=0).max()) if self.n else 0.0
+        if sign == 0 or not np.isfinite(self._condition) or self._condition * np.finfo(float).eps > 1.0:
+            raise np.linalg.LinAlgError("Sistema singular")
+
+    def solve(self, b, transpose: bool = False) -> np.ndarray:
+        """Resuelve A·x = b, o Aᵀ·x = b con transpose (b puede tener varias columnas)"""
+        y = np.array(b, dtype=float)
+
+        if self.kind == 'cholesky':
+            # A es simétrica: Aᵀ·x = b es el mismo sistema
+            try:
+                from scipy.linalg import solve_triangular
+            except ImportError:
+                # Sin SciPy: L⁻¹ se calcula una vez y cada solve son dos productos O(n²)
+                if self._inverse_L is None:
+                    self._inverse_L = np.linalg.inv(self.L)
+                return self._inverse_L.T @ (self._inverse_L @ y)
+            z = solve_triangular(self.L, y, lower=True, check_finite=False)
+            return solve_triangular(self.L, z, lower=True, trans='T', check_finite=False)
+
+        if self.lu is not None:
+            from scipy.linalg import lu_solve
+            return lu_solve(self.lu, y, trans=1 if transpose else 0, check_finite=False)
+        return (self.inverse.T if transpose else self.inverse) @ y
+
+    def condition_estimate(self, max_iterations: int = 5) -> float:
+        """
+        Estimación barata de cond₁(A) = ‖A‖₁·‖A⁻¹‖₁ (método de Hager, como
+        LAPACK xGECON): unas pocas sustituciones O(n²) en vez de invertir A.
+        Suele acertar el orden de magnitud y nunca sobreestima ‖A⁻¹‖₁.
+        Solo depende de A, así que se calcula una vez por factorización.
+        """
+        if self._condition is None:
+            self._condition = self.norm1 * _inverse_norm1_estimate(self.solve, self.n, max_iterations)
+        return self._condition
+
+    def slogdet(self) -> Tuple[float, float]:
+        """Signo y logaritmo del valor absoluto de det(A), sin desbordes"""
+        if self.pivots is None:
+            return self._slogdet
+        sign = 1.0 if self.kind == 'cholesky' else self._perm_sign * np.prod(np.sign(self.pivots))
+        return float(sign), float(np.sum(np.log(np.abs(self.pivots))))
+
+
+def _inverse_norm1_estimate(solve, n: int, max_iterations: int = 5) -> float:
+    """
+    Estima ‖A⁻¹‖₁ con el método de Hager usando solo solve(b) y
+    solve(b, transpose=True); cada iteración cuesta dos sustituciones.
+    """
+    if n == 0:
+        return 0.0
+
+    x = np.full(n, 1.0 / n)
+    estimate = 0.0
+    for iteration in range(max_iterations):
+        y = solve(x)
+        estimate = float(np.abs(y).sum())
+        z = solve(np.where(y >= 0, 1.0, -1.0), transpose=True)
+        j = int(np.argmax(np.abs(z)))
+        # Óptimo local: ningún vértice mejora la estimación
+        if iteration > 0 and abs(z[j]) <= z @ x:
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+
+    # Vector alternativo de Higham: cubre los casos donde Hager se queda corto
+    alternating = (-1.0) ** np.arange(n) * (1.0 + np.arange(n) / max(n - 1, 1))
+    return max(estimate, 2.0 * float(np.abs(solve(alternating)).sum()) / (3.0 * n))
+
+
+class TridiagonalFactorization:
+    """
+    Eliminación de Thomas guardada: pivotes y superdiagonal modificada.
+    Cada solve posterior es un barrido O(n).
+
+    Lanza np.linalg.LinAlgError si algún pivote es (casi) cero.
+    """
+    def __init__(self, lower, diag, upper):
+        # Listas de floats: el barrido es secuencial y así evita escalares de NumPy
+        self.lower = list(lower)
+        self.n = len(diag)
+        self.pivots = [0.0] * self.n
+        self.c = [0.0] * self.n  # superdiagonal modificada
+
+        for i in range(self.n):
+            pivot = diag[i] if i == 0 else diag[i] - self.lower[i-1] * self.c[i-1]
+
+            if abs(pivot) < PIVOT_TOLERANCE:
+                raise np.linalg.LinAlgError("Sistema singular")
+
+            self.pivots[i] = pivot
+            if i < self.n - 1:
+                self.c[i] = upper[i] / pivot
+
+    @classmethod
+    def from_system(cls, system) -> "TridiagonalFactorization":
+        return cls(system.band(-1).tolist(), system.band(0).tolist(), system.band(1).tolist())
+
+    def solve(self, b) -> np.ndarray:
+        lower, pivots, c = self.lower, self.pivots, self.c
+        d = [float(v) for v in b]
+
+        # FASE 1: Eliminación hacia adelante
+        d[0] = d[0] / pivots[0]
+        for i in range(1, self.n):
+            d[i] = (d[i] - lower[i-1] * d[i-1]) / pivots[i]
+
+        # FASE 2: Sustitución hacia atrás
+        for i in range(self.n - 2, -1, -1):
+            d[i] = d[i] - c[i] * d[i+1]
+
+        return np.array(d)
+
+    def slogdet(self) -> Tuple[float, float]:
+        pivots = np.asarray(self.pivots)
+        return float(np.prod(np.sign(pivots))), float(np.sum(np.log(np.abs(pivots))))
+
+
+class BandedLUFactorization:
+    """
+    LU con pivoteo parcial sobre una matriz de bandas (kl debajo, ku encima
+    de la diagonal), con el almacenamiento de LAPACK xGBTRF: A[i, j] vive en
+    ab[kl + ku + i - j, j] y las filas extra absorben el relleno del pivoteo.
+    Tiempo O(n·kl·(kl+ku)) y memoria O(n·(2kl+ku)).
+
+    Lanza np.linalg.LinAlgError si algún pivote es (casi) cero.
+    """
+    # Hasta este kl·(kl+ku) la eliminación recorre listas de floats: con
+    # bandas angostas cada paso de NumPy es casi todo costo fijo
+    NARROW_BAND = 128
+
+    def __init__(self, matrix: CSRMatrix):
+        self.n = n = matrix.n
+        self.kl, self.ku = kl, ku = matrix.bandwidth()
+        kv = kl + ku
+        ab = np.zeros((2 * kl + ku + 1, n))
+        rows = matrix.row_ids()
+        ab[kv + rows - matrix.indices, matrix.indices] = matrix.data
+
+        if kl * kv <= self.NARROW_BAND:
+            ab, pivot_rows = self._eliminate_lists(ab, n, kl, ku)
+        else:
+            pivot_rows = self._eliminate_arrays(ab, n, kl, ku)
+        self.pivot_rows = np.array(pivot_rows)
+        self.ab = ab
+
+        # Para los barridos (secuenciales) se copian L y U por fila como listas
+        # de floats, como en TridiagonalFactorization
+        offsets = np.arange(kv + 1)
+        cols = np.arange(n)[:, np.newaxis] + offsets
+        inside = cols < n
+        upper = np.zeros((n, kv + 1))
+        upper[inside] = ab[np.broadcast_to(kv - offsets, cols.shape)[inside], cols[inside]]
+        self._pivots = upper[:, 0].tolist()
+        self._upper = [row[1:min(kv, n - 1 - i) + 1] for i, row in enumerate(upper.tolist())]
+        self._lower = [column[:min(kl, n - 1 - j)] for j, column in enumerate(ab[kv + 1:].T.tolist())]
+        self._pivot_list = list(pivot_rows)
+
+    @staticmethod
+    def _eliminate_arrays(ab: np.ndarray, n: int, kl: int, ku: int) -> np.ndarray:
+        """Eliminación en el lugar con operaciones vectorizadas por columna"""
+        kv = kl + ku
+        pivot_rows = np.arange(n)
+        for j in range(n):
+            last = min(n - 1, j + kl)
+            column = ab[kv:kv + last - j + 1, j]
+            p = int(np.argmax(np.abs(column)))
+            if abs(column[p]) < PIVOT_TOLERANCE:
+                raise np.linalg.LinAlgError("Sistema singular")
+
+            cols = np.arange(j, min(n - 1, j + kv) + 1)
+            if p:
+                pivot_rows[j] = j + p
+                top, other = kv + j - cols, kv + j + p - cols
+                ab[top, cols], ab[other, cols] = ab[other, cols], ab[top, cols].copy()
+
+            if last > j:
+                multipliers = ab[kv + 1:kv + 1 + last - j, j]
+                multipliers /= ab[kv, j]
+                right = cols[1:]
+                below = np.arange(j + 1, last + 1)
+                ab[kv + below[:, np.newaxis] - right, right] -= np.outer(multipliers, ab[kv + j - right, right])
+        return pivot_rows
+
+    @staticmethod
+    def _eliminate_lists(ab: np.ndarray, n: int, kl: int, ku: int):
+        """La misma eliminación sobre listas de floats (bandas angostas)"""
+        kv = kl + ku
+        rows = ab.tolist()
+        pivot_rows = list(range(n))
+        for j in range(n):
+            last = min(n - 1, j + kl)
+            best, largest = kv, abs(rows[kv][j])
+            for r in range(kv + 1, kv + 1 + last - j):
+                if abs(rows[r][j]) > largest:
+                    best, largest = r, abs(rows[r][j])
+            if largest < PIVOT_TOLERANCE:
+                raise np.linalg.LinAlgError("Sistema singular")
+
+            end = min(n - 1, j + kv)
+            if best != kv:
+                p = best - kv
+                pivot_rows[j] = j + p
+                for c in range(j, end + 1):
+                    top = kv + j - c
+                    rows[top][c], rows[top + p][c] = rows[top + p][c], rows[top][c]
+
+            pivot = rows[kv][j]
+            for r in range(kv + 1, kv + 1 + last - j):
+                multiplier = rows[r][j] / pivot
+                rows[r][j] = multiplier
+                if multiplier:
+                    for c in range(j + 1, end + 1):
+                        rows[r - c + j][c] -= multiplier * rows[kv - c + j][c]
+        return np.array(rows), pivot_rows
+
+    def solve(self, b) -> np.ndarray:
+        y = [float(v) for v in b]
+
+        # L: intercambios de fila y multiplicadores guardados bajo la diagonal
+        for j, (p, multipliers) in enumerate(zip(self._pivot_list, self._lower)):
+            if p != j:
+                y[j], y[p] = y[p], y[j]
+            value = y[j]
+            for t, m in enumerate(multipliers, start=j + 1):
+                y[t] -= m * value
+
+        # U: hasta kl + ku posiciones a la derecha de la diagonal
+        for i in range(self.n - 1, -1, -1):
+            total = y[i]
+            for t, u in enumerate(self._upper[i], start=i + 1):
+                total -= u * y[t]
+            y[i] = total / self._pivots[i]
+        return np.array(y)
+
+
+class SparseFactorization:
+    """
+    Factorización de una matriz dispersa (sistemas MNA), con el primer
+    método disponible:
+
+        'scipy'  SuperLU (scipy.sparse.linalg.splu), si SciPy está instalado
+        'bandas' Cuthill-McKee inverso + BandedLUFactorization: O(n·kl·(kl+ku)),
+                 lineal para redes de ancho de banda acotado (cadenas, escaleras)
+        'densa'  DenseFactorization, para matrices chicas de banda ancha
+
+    Lanza np.linalg.LinAlgError si la matriz es singular (p. ej. un nodo
+    sin camino a tierra) y ValueError si, sin SciPy, no entra en ninguno de
+    los dos presupuestos (grillas anchas y grandes).
+    """
+    DENSE_MAX_N = 1024
+    # Operaciones n·kl·(kl+ku) que se aceptan en la LU por bandas (unos segundos)
+    BANDED_MAX_WORK = 2e9
+
+    def __init__(self, matrix: CSRMatrix):
+        self.n = matrix.n
+        self.perm = None
+        try:
+            from scipy.sparse.linalg import splu
+        except ImportError:
+            splu = None
+
+        if splu is not None:
+            try:
+                self._factor = splu(matrix.to_scipy().tocsc())
+            except RuntimeError as e:  # SuperLU informa la singularidad así
+                raise np.linalg.LinAlgError(str(e)) from None
+            self.kind = 'scipy'
+            return
+
+        perm = reverse_cuthill_mckee(matrix)
+        permuted = matrix.permuted(perm)
+        kl, ku = permuted.bandwidth()
+        work = self.n * kl * (kl + ku)
+
+        if work <= min(self.BANDED_MAX_WORK, self.n ** 3):
+            self.perm = perm
+            self._factor = BandedLUFactorization(permuted)
+            self.kind = 'bandas'
+        elif self.n <= self.DENSE_MAX_N:
+            self._factor = DenseFactorization(matrix.to_dense())
+            self.kind = 'densa'
+        else:
+            raise ValueError(f"ancho de banda {kl} demasiado grande para n={self.n} sin SciPy "
+                             f"(instale scipy para usar SuperLU)")
+
+    def solve(self, b) -> np.ndarray:
+        b = np.asarray(b, dtype=float)
+        if self.perm is None:
+            return np.asarray(self._factor.solve(b), dtype=float)
+        x = np.empty(self.n)
+        x[self.perm] = self._factor.solve(b[self.perm])
+        return x
+
+
+class _WeakObserver(Observer):
+    """
+    Observa en nombre de otro objeto sin mantenerlo vivo: el singleton Circuit
+    no retiene las cachés de estrategias descartadas. Cuando el objeto ya no
+    existe, se da de baja en la siguiente notificación.
+    """
+    __slots__ = ('_target',)
+
+    def __init__(self, target):
+        self._target = weakref.ref(target)
+
+    def update(self, subject):
+        target = self._target()
+        if target is None:
+            subject.remove_observer(self)
+        else:
+            target.update(subject)
+
+
+class FactorizationCache(LRUCache, Observer):
+    """
+    Caché LRU de factorizaciones indexada por la huella de la red
+    (tipo de circuito + resistencias).
+
+    Observa los circuitos que la usan (el original, si recibe una copia):
+    cuando add_resistor o remove_resistor cambian la red, la factorización
+    de la red anterior se descarta. La suscripción es por referencia débil,
+    así que el circuito no mantiene vivas las cachés que ya no se usan.
+
+    Si persistent tiene una DiskCache (ver
+    CircuitController.enable_disk_cache), lo que falta en memoria se busca
+    ahí antes de factorizar, y lo factorizado se guarda para otras sesiones.
+    namespace separa las entradas de cada estrategia, que guardan
+    factorizaciones distintas de la misma red.
+    """
+    persistent = None
+
+    def __init__(self, maxsize: int = 4, namespace: str = ''):
+        super().__init__(maxsize)
+        self.namespace = namespace
+        self._watched = {}  # id(circuito) -> (revisión, huella)
+
+    def lookup(self, circuit, factorize):
+        """Devuelve la factorización de la red actual, calculándola con factorize() si falta"""
+        key = circuit.network_fingerprint()
+        factorization = self.get(key)
+
+        if factorization is None:
+            factorization = self._load_or_factorize(key, factorize)
+            self.put(key, factorization)
+        else:
+            PROFILER.count('factorization.hit')
+
+        # Las copias sueltas (sin circuito observable) no se registran: con un
+        # flujo largo de circuitos independientes la memoria no crece
+        origin = circuit.origin
+        if hasattr(origin, 'add_observer'):
+            if id(origin) not in self._watched:
+                origin.add_observer(_WeakObserver(self))
+            self._watched[id(origin)] = (circuit.network_revision, key)
+        return factorization
+
+    def _load_or_factorize(self, key: str, factorize):
+        store = FactorizationCache.persistent
+        if store is not None:
+            from utils.disk_cache import content_key
+            disk_key = content_key('factorization', self.namespace, key)
+            factorization = store.get_object(disk_key)
+            if factorization is not None:
+                PROFILER.count('factorization.disk_hit')
+                return factorization
+
+        PROFILER.count('factorization.miss')
+        with PROFILER.timer('factorize'):
+            factorization = factorize()
+        # Las que no se pueden serializar (p. ej. splu de SciPy) quedan solo en memoria
+        if store is not None:
+            store.put_object(disk_key, factorization, 'factorization')
+        return factorization
+
+    def update(self, subject):
+        revision, key = self._watched.get(id(subject), (None, None))
+        if revision is not None and subject.network_revision != revision:
+            self.discard(key)
+            self._watched[id(subject)] = (subject.network_revision, None)
@@ -1,24 +1,197 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import json
+import logging
+import os
+import threading
+import time
 import numpy as np
+from models.mesh_system import MeshOperator, build_banded_batch, build_dense_batch
+from models.netlist import Netlist, legacy_currents
+from utils.profiling import PROFILER
+from strategies.factorization import (
+    PIVOT_TOLERANCE, DenseFactorization, FactorizationCache, SparseFactorization,
+    TridiagonalFactorization
+)
+
+# Los errores van al registro (stderr por defecto), no a stdout: la CLI
+# escribe ahí sus resultados
+logger = logging.getLogger(__name__)
+
+
+class SolveCancelled(Exception):
+    """El cálculo se canceló (o fue reemplazado por uno más nuevo)"""
+
+
+class SolveMonitor:
+    """
+    Progreso y cancelación compartidos entre el hilo de cálculo y la interfaz.
+    Las estrategias iterativas llaman a report() en cada paso; si se pidió
+    cancelar, report() lanza SolveCancelled y el cálculo se detiene ahí.
+    """
+    def __init__(self):
+        self.progress = 0.0
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def report(self, fraction: float):
+        if self._cancelled.is_set():
+            raise SolveCancelled()
+        self.progress = fraction
+
 
 class ResolutionStrategy(ABC):
+    # Si resuelve Netlist de topología arbitraria, además de las tres clásicas
+    handles_netlists = False
+    # Atributos de configuración que cambian el resultado (modo, tolerancia...)
+    CONFIG = ()
+
+    def cache_key(self) -> tuple:
+        """Clase y configuración: identifica los resultados en las cachés"""
+        strategy_type = type(self)
+        config = []
+        for name in self.CONFIG:
+            value = getattr(self, name)
+            config.append((name, tuple(sorted(value.items())) if isinstance(value, dict) else value))
+        return (f"{strategy_type.__module__}.{strategy_type.__qualname__}",) + tuple(config)
+
     @abstractmethod
-    def solve(self, circuit) -> Optional[List[float]]:
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
         pass
 
+    def _dense_system(self, circuit):
+        """Respaldo denso: arma A y b como arrays de NumPy a partir de la forma compacta"""
+        system = circuit.build_banded_system()
+        if system is None:
+            return None, None
+        with PROFILER.timer('convert.dense_system'):
+            return system.to_dense()
+
+    def solve_batch(self, circuit_type: str, voltages, resistors) -> Optional[np.ndarray]:
+        """
+        Resuelve k variantes de un circuito con una sola llamada por lotes,
+        sin pasar por el singleton Circuit.
+
+        Args:
+            voltages: escalar o vector (k,)
+            resistors: matriz (k, n) o vector (n,) compartido
+
+        Returns:
+            Matriz (k, corrientes); las filas de sistemas singulares quedan en NaN
+        """
+        A, b = build_dense_batch(circuit_type, voltages, resistors)
+
+        if A is None or b is None:
+            return None
+
+        return _batched_solve(A, b)
+
+
+def _batched_solve(A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """np.linalg.solve sobre la pila (k, n, n); si algún sistema es singular se marca con NaN"""
+    try:
+        solutions = np.linalg.solve(A, b[..., np.newaxis])[..., 0]
+    except np.linalg.LinAlgError:
+        solutions = np.full(b.shape, np.nan)
+        for j in range(len(b)):
+            try:
+                solutions[j] = np.linalg.solve(A[j], b[j])
+            except np.linalg.LinAlgError:
+                pass
+
+    solutions[~np.all(np.isfinite(solutions), axis=1)] = np.nan
+    return solutions
+
+
 class CramerStrategy(ResolutionStrategy):
-    def solve(self, circuit) -> Optional[List[float]]:
+    """
+    Regla de Cramer: xi = det(Ai) / det(A).
+
+    mode='lu' (por defecto) obtiene todos los det(Ai) de una sola factorización:
+    como Ai = A + (b - ai)·eiᵀ, el lema del determinante da det(Ai) = det(A)·(A⁻¹b)i.
+    Los determinantes se llevan como pares (signo, log|det|), así no desbordan
+    ni se anulan con cientos de mallas. Costo total O(n³).
+
+    mode='clasico' calcula n+1 determinantes independientes, O(n⁴).
+    """
+    MODES = ('lu', 'clasico')
+    CONFIG = ('mode',)
+
+    def __init__(self, mode: str = 'lu', cache_size: int = 4):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de Cramer desconocido: {mode}")
+        self.mode = mode
+        self.factorizations = FactorizationCache(cache_size, type(self).__name__)
+
+    def determinants(self, circuit) -> Optional[dict]:
+        """
+        Determinantes de Cramer como pares (signo, log|det|):
+        {'det_A': (signo, log), 'det_Ai': [(signo, log), ...]}
+
+        Lanza np.linalg.LinAlgError si A es singular.
+        """
+        system = circuit.build_banded_system()
+        if system is None:
+            return None
+
+        factorization = self.factorizations.lookup(
+            circuit, lambda: DenseFactorization(system.to_dense()[0])
+        )
+        sign_A, log_A = factorization.slogdet()
+        y = factorization.solve(system.b)  # y = A⁻¹b
+
+        with np.errstate(divide='ignore'):
+            log_Ai = log_A + np.log(np.abs(y))
+
+        return {
+            'det_A': (sign_A, log_A),
+            'det_Ai': list(zip((sign_A * np.sign(y)).tolist(), log_Ai.tolist()))
+        }
+
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        if self.mode == 'clasico':
+            return self._solve_classic(circuit, monitor)
+
         try:
-            A, b = circuit.build_mesh_system()
+            dets = self.determinants(circuit)
+            if dets is None:
+                return None
+
+            sign_A, log_A = dets['det_A']
+            signs, logs = np.array(dets['det_Ai']).T
+
+            # xi = det(Ai) / det(A), cociente calculado en escala logarítmica
+            solutions = signs * sign_A * np.exp(logs - log_A)
+
+            if monitor is not None:
+                monitor.report(1.0)
+
+            if not np.all(np.isfinite(solutions)):
+                return None
+            return solutions.tolist()
+
+        except np.linalg.LinAlgError:
+            # Un pivote (casi) nulo: det(A) = 0
+            return None
+        except SolveCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Error en Cramer: {e}")
+            return None
+
+    def _solve_classic(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        try:
+            A, b = self._dense_system(circuit)
             
             if A is None or b is None:
                 return None
             
-            # Convertir a numpy arrays para cálculos
-            A = np.array(A, dtype=float)
-            b = np.array(b, dtype=float)
-            
             n = len(b)
             
             # Calcular determinante de A
@@ -40,11 +213,16 @@ class CramerStrategy(ResolutionStrategy):
                 # Solución: xi = det(Ai) / det(A)
                 xi = det_Ai / det_A
                 solutions.append(xi)
+                
+                if monitor is not None:
+                    monitor.report((i + 1) / n)
             
             return solutions
             
+        except SolveCancelled:
+            raise
         except Exception as e:
-            print(f"Error en Cramer: {e}")
+            logger.error(f"Error en Cramer: {e}")
             return None
     
     def _determinant(self, matrix):
@@ -62,85 +240,1020 @@ class CramerStrategy(ResolutionStrategy):
         # Para matrices mayores: usar numpy (más eficiente)
         return np.linalg.det(matrix)
 
+    def solve_batch(self, circuit_type: str, voltages, resistors) -> Optional[np.ndarray]:
+        """Regla de Cramer por lotes: cada determinante se calcula para toda la pila a la vez"""
+        if self.mode == 'lu':
+            # det(Ai)/det(A) = (A⁻¹b)i: una factorización por punto, sin n determinantes
+            return super().solve_batch(circuit_type, voltages, resistors)
+
+        A, b = build_dense_batch(circuit_type, voltages, resistors)
+
+        if A is None or b is None:
+            return None
+
+        det_A = np.linalg.det(A)
+        singular = np.abs(det_A) < 1e-10
+        det_A[singular] = 1.0
+
+        solutions = np.empty_like(b)
+        Ai = np.empty_like(A)
+        for i in range(b.shape[1]):
+            # Ai = A con la columna i reemplazada por b, para todos los puntos
+            Ai[:] = A
+            Ai[:, :, i] = b
+            solutions[:, i] = np.linalg.det(Ai) / det_A
+
+        solutions[singular] = np.nan
+        return solutions
+
+
 class GaussJordanStrategy(ResolutionStrategy):
-    def solve(self, circuit) -> Optional[List[float]]:
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
         try:
-            A, b = circuit.build_mesh_system()
+            A, b = self._dense_system(circuit)
             
             if A is None or b is None:
                 return None
             
-            # Convertir a numpy arrays
-            A = np.array(A, dtype=float)
-            b = np.array(b, dtype=float).reshape(-1, 1)
+            with PROFILER.timer('eliminate.gauss_jordan'):
+                return self.eliminate(A, b, monitor).tolist()
             
-            n = len(b)
-            
-            # Crear matriz aumentada [A|b]
-            augmented = np.hstack([A, b])
+        except np.linalg.LinAlgError:
+            return None  # Sistema singular o inconsistente
+        except SolveCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Error en Gauss-Jordan: {e}")
+            return None
+
+    BLOCK_SIZE = 32
+
+    @classmethod
+    def eliminate(cls, A, B, monitor: Optional[SolveMonitor] = None, block_size: Optional[int] = None) -> np.ndarray:
+        """
+        Gauss-Jordan con pivoteo parcial sobre la matriz aumentada [A|B].
+
+        B puede ser un vector (n,) o varias columnas (n, m): todas se resuelven
+        en la misma pasada. Todo ocurre en place sobre un buffer reservado al
+        principio: por columna, búsqueda de pivote con argmax y una sola
+        actualización de rango 1, sin bucles de Python sobre las filas.
+
+        Las columnas se procesan en paneles de block_size: las actualizaciones de
+        rango 1 se limitan al panel y al resto de la matriz se le aplica la
+        transformación acumulada con un producto de matrices. Los pivotes y el
+        resultado son los mismos que columna por columna.
+
+        Returns:
+            X con la misma forma que B
+        Lanza np.linalg.LinAlgError si algún pivote es (casi) cero.
+        """
+        A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float)
+        n = A.shape[0]
+        block_size = block_size or cls.BLOCK_SIZE
+        rhs = B.reshape(n, -1)
+        width = n + rhs.shape[1]
+        
+        # Matriz aumentada [A|B] y espacio para el producto exterior
+        augmented = np.empty((n, width))
+        augmented[:, :n] = A
+        augmented[:, n:] = rhs
+        scratch = np.empty((n, block_size + rhs.shape[1]))
+        
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            # El último panel arrastra también las columnas de B
+            last = width if stop == n else stop
+            panel = augmented[:, start:stop].copy()
+            rows = np.arange(n)
             
-            # FASE 1: Eliminación hacia adelante
-            for i in range(n):
+            for i in range(start, stop):
                 # Buscar el pivote
-                max_row = i
-                for k in range(i + 1, n):
-                    if abs(augmented[k, i]) > abs(augmented[max_row, i]):
-                        max_row = k
+                max_row = i + int(np.argmax(np.abs(augmented[i:, i])))
+                if abs(augmented[max_row, i]) < PIVOT_TOLERANCE:
+                    raise np.linalg.LinAlgError("Sistema singular")
                 
-                # Intercambiar filas si es necesario
+                # Intercambiar filas si es necesario (la fila completa)
                 if max_row != i:
                     augmented[[i, max_row]] = augmented[[max_row, i]]
+                    rows[[i, max_row]] = rows[[max_row, i]]
                 
-                # Verificar si el pivote es cero
-                if abs(augmented[i, i]) < 1e-10:
-                    return None  # Sistema singular o inconsistente
+                # Hacer el pivote = 1 (las columnas anteriores de la fila ya son 0)
+                pivot_row = augmented[i, i:last]
+                pivot_row /= pivot_row[0]
                 
-                # Hacer el pivote = 1
-                augmented[i] = augmented[i] / augmented[i, i]
+                # Ceros en toda la columna i (arriba y abajo): resta factores ⊗ fila pivote
+                factors = augmented[:, i].copy()
+                factors[i] = 0.0
+                update = scratch[:, :last - i]
+                np.multiply(factors[:, np.newaxis], pivot_row, out=update)
+                augmented[:, i:last] -= update
                 
-                # Hacer ceros en toda la columna (arriba y abajo del pivote)
-                for k in range(n):
-                    if k != i:
-                        factor = augmented[k, i]
-                        augmented[k] = augmented[k] - factor * augmented[i]
-            
-            # Las soluciones están en la última columna
-            solutions = augmented[:, -1].tolist()
+                if monitor is not None:
+                    monitor.report((i + 1) / n)
             
-            return solutions
-            
-        except Exception as e:
-            print(f"Error en Gauss-Jordan: {e}")
+            if last < width:
+                # Columnas a la derecha del panel: las filas pivote se multiplican
+                # por la inversa del bloque pivote y al resto se les resta su parte
+                panel = panel[rows]
+                trailing = augmented[:, last:]
+                top = cls.eliminate(panel[start:stop], np.eye(stop - start), block_size=block_size) @ trailing[start:stop]
+                trailing[:start] -= panel[:start] @ top
+                trailing[stop:] -= panel[stop:] @ top
+                trailing[start:stop] = top
+        
+        # Las soluciones están en las últimas columnas
+        return augmented[:, n:].reshape(B.shape).copy()
+
+    def solve_batch(self, circuit_type: str, voltages, resistors) -> Optional[np.ndarray]:
+        """Gauss-Jordan con pivoteo parcial aplicado a toda la pila (k, n, n+1) a la vez"""
+        A, b = build_dense_batch(circuit_type, voltages, resistors)
+
+        if A is None or b is None:
             return None
 
+        k, n = b.shape
+        augmented = np.concatenate([A, b[:, :, np.newaxis]], axis=2)
+        batch = np.arange(k)
+        valid = np.ones(k, dtype=bool)
+
+        for i in range(n):
+            # Pivote de cada sistema e intercambio de filas
+            max_row = i + np.argmax(np.abs(augmented[:, i:, i]), axis=1)
+            row_i = augmented[batch, i].copy()
+            augmented[batch, i] = augmented[batch, max_row]
+            augmented[batch, max_row] = row_i
+
+            pivot = augmented[:, i, i]
+            singular = np.abs(pivot) < PIVOT_TOLERANCE
+            valid &= ~singular
+            pivot = np.where(singular, 1.0, pivot)
+
+            # Pivote = 1 y ceros en el resto de la columna
+            augmented[:, i] /= pivot[:, np.newaxis]
+            factors = augmented[:, :, i].copy()
+            factors[:, i] = 0.0
+            augmented -= factors[:, :, np.newaxis] * augmented[:, np.newaxis, i]
+
+        solutions = augmented[:, :, -1].copy()
+        solutions[~valid] = np.nan
+        return solutions
+
+
+class SolveResult:
+    """
+    Corrientes más diagnósticos de la resolución, para decidir cuánto confiar
+    en el resultado sin otra pasada O(n³):
+        condition: estimación de cond₁(A) (inf si no se pudo estimar)
+        residual: ‖A·x − b‖₂
+        elapsed: segundos empleados
+        method: 'diagonal', 'cholesky' o 'lu'
+    """
+    __slots__ = ('currents', 'condition', 'residual', 'elapsed', 'method')
+
+    def __init__(self, currents: List[float], condition: float, residual: float,
+                 elapsed: float, method: str):
+        self.currents = currents
+        self.condition = condition
+        self.residual = residual
+        self.elapsed = elapsed
+        self.method = method
+
+    def digits_lost(self) -> float:
+        "Cifras decimales que el condicionamiento puede hacer perder (log10 cond)"
+        return float(np.log10(self.condition)) if self.condition > 0 else 0.0
+
+    def is_reliable(self, max_condition: float = 1e12) -> bool:
+        return bool(np.isfinite(self.residual)) and self.condition <= max_condition
+
+    def __repr__(self):
+        return (f"SolveResult(n={len(self.currents)}, method={self.method!r}, "
+                f"condition={self.condition:.3g}, residual={self.residual:.3g}, "
+                f"elapsed={self.elapsed * 1000:.3f} ms)")
+
+
 class NumericStrategy(ResolutionStrategy): 
-    def solve(self, circuit) -> Optional[List[float]]:
+    def __init__(self, cache_size: int = 4):
+        self.factorizations = FactorizationCache(cache_size, type(self).__name__)
+    
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        result = self.solve_detailed(circuit, monitor)
+        return result.currents if result is not None else None
+    
+    def solve_detailed(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[SolveResult]:
+        """
+        Como solve, pero devuelve un SolveResult con diagnósticos.
+        A se factoriza una sola vez (sin calcular det(A) aparte): la singularidad
+        la detectan los pivotes y el condicionamiento se estima con unas pocas
+        sustituciones sobre la misma factorización.
+        """
+        start = time.perf_counter()
         try:
-            A, b = circuit.build_mesh_system()
+            system = circuit.build_banded_system()
             
-            if A is None or b is None:
+            if system is None:
                 return None
             
-            # Convertir a numpy arrays
-            A = np.array(A, dtype=float)
-            b = np.array(b, dtype=float)
+            # Sistema diagonal (paralelo): se resuelve directo sobre la banda
+            if system.is_diagonal:
+                diag = np.abs(system.band(0))
+                if np.any(diag < PIVOT_TOLERANCE):
+                    return None
+                solutions = system.b / system.band(0)
+                condition = float(diag.max() / diag.min())
+                method = 'diagonal'
+            else:
+                # A solo depende de la red: se factoriza una vez y un cambio de
+                # voltaje es solo sustitución O(n²)
+                factorization = self.factorizations.lookup(
+                    circuit, lambda: DenseFactorization(system.to_dense()[0])
+                )
+                solutions = factorization.solve(system.b)
+                condition = factorization.condition_estimate()
+                method = factorization.kind
             
-            # Verificar que la matriz no sea singular
-            if abs(np.linalg.det(A)) < 1e-10:
-                return None
-            
-            # Resolver usando  NumPy
-            solutions = np.linalg.solve(A, b)
+            if monitor is not None:
+                monitor.report(1.0)
             
             # Verificar que las soluciones sean válidas
-            if np.any(np.isnan(solutions)) or np.any(np.isinf(solutions)):
+            if not np.all(np.isfinite(solutions)):
                 return None
             
-            return solutions.tolist()
+            residual = float(np.linalg.norm(system.matvec(solutions) - system.b))
+            return SolveResult(solutions.tolist(), condition, residual,
+                               time.perf_counter() - start, method)
             
         except np.linalg.LinAlgError:
-            print("Error: Sistema singular o mal condicionado")
+            logger.error("Error: Sistema singular o mal condicionado")
             return None
+        except SolveCancelled:
+            raise
         except Exception as e:
-            print(f"Error en método numérico: {e}")
-            return None
\ No newline at end of file
+            logger.error(f"Error en método numérico: {e}")
+            return None
+
+    def solve_batch(self, circuit_type: str, voltages, resistors) -> Optional[np.ndarray]:
+        bands, b = build_banded_batch(circuit_type, voltages, resistors)
+
+        if bands is None or b is None:
+            return None
+
+        # Sistemas diagonales (paralelo): división directa, sin matrices (k, n, n)
+        if list(bands) == [0]:
+            diag = bands[0]
+            singular = np.any(np.abs(diag) < 1e-10, axis=1)
+            solutions = b / np.where(np.abs(diag) < 1e-10, 1.0, diag)
+            solutions[singular] = np.nan
+            return solutions
+
+        return super().solve_batch(circuit_type, voltages, resistors)
+
+
+class TridiagonalStrategy(ResolutionStrategy):
+    """
+    Algoritmo de Thomas: resuelve el sistema trabajando solo sobre las tres
+    diagonales, en tiempo y memoria O(n).
+
+    No usa pivoteo: es estable para las matrices de mallas porque son
+    simétricas definidas positivas (resistencias > 0).
+    """
+    def __init__(self, cache_size: int = 4):
+        self.factorizations = FactorizationCache(cache_size, type(self).__name__)
+
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        try:
+            system = circuit.build_banded_system()
+
+            if system is None or not system.is_tridiagonal:
+                return None
+
+            # La eliminación hacia adelante se guarda por red: un cambio de
+            # voltaje solo repite los barridos O(n)
+            factorization = self.factorizations.lookup(
+                circuit, lambda: TridiagonalFactorization.from_system(system)
+            )
+
+            return factorization.solve(system.b).tolist()
+
+        except np.linalg.LinAlgError:
+            return None  # Sistema singular
+        except Exception as e:
+            logger.error(f"Error en método tridiagonal: {e}")
+            return None
+
+    def solve_batch(self, circuit_type: str, voltages, resistors) -> Optional[np.ndarray]:
+        """Algoritmo de Thomas vectorizado sobre los k puntos: O(k·n)"""
+        bands, b = build_banded_batch(circuit_type, voltages, resistors)
+
+        if bands is None or b is None:
+            return None
+
+        k, n = b.shape
+        diag = bands[0]
+        lower = bands.get(-1, np.zeros((k, n - 1)))
+        upper = bands.get(1, np.zeros((k, n - 1)))
+
+        c = np.zeros((k, n))
+        d = np.empty((k, n))
+        valid = np.ones(k, dtype=bool)
+
+        for i in range(n):
+            if i == 0:
+                pivot = diag[:, 0]
+                rhs = b[:, 0]
+            else:
+                pivot = diag[:, i] - lower[:, i-1] * c[:, i-1]
+                rhs = b[:, i] - lower[:, i-1] * d[:, i-1]
+
+            singular = np.abs(pivot) < 1e-10
+            valid &= ~singular
+            pivot = np.where(singular, 1.0, pivot)
+
+            if i < n - 1:
+                c[:, i] = upper[:, i] / pivot
+            d[:, i] = rhs / pivot
+
+        for i in range(n - 2, -1, -1):
+            d[:, i] -= c[:, i] * d[:, i+1]
+
+        d[~valid] = np.nan
+        return d
+
+
+class AnalyticStrategy(ResolutionStrategy):
+    """
+    Solución cerrada para 'serie' y 'paralelo': no arma ni resuelve ningún
+    sistema, calcula todo con una expresión vectorizada de NumPy.
+
+    serie    -> I = V / (R1 + ... + Rn), una sola corriente
+    paralelo -> Ii = V / Ri para cada rama
+    """
+    TOPOLOGIES = ('serie', 'paralelo')
+
+    def supports(self, circuit) -> bool:
+        """Indica si la topología del circuito admite solución cerrada"""
+        return circuit.circuit_type in self.TOPOLOGIES and len(circuit.resistors) >= 2
+
+    def analyze(self, circuit) -> Optional[dict]:
+        """
+        Calcula en una sola pasada la resistencia equivalente, las corrientes
+        de rama, las caídas de tensión y la potencia de cada resistencia.
+        """
+        if not self.supports(circuit):
+            return None
+
+        R = np.asarray(circuit.resistors, dtype=float)
+        if np.any(R <= 0):
+            return None
+
+        V = float(circuit.voltage)
+        if circuit.circuit_type == 'serie':
+            r_eq = R.sum()
+            branch_currents = np.full(len(R), V / r_eq)
+            currents = branch_currents[:1]
+        else:
+            branch_currents = V / R
+            r_eq = 1.0 / np.reciprocal(R).sum()
+            currents = branch_currents
+
+        voltage_drops = R * branch_currents
+        power = voltage_drops * branch_currents
+
+        return {
+            'equivalent_resistance': float(r_eq),
+            'currents': currents.tolist(),
+            'branch_currents': branch_currents.tolist(),
+            'voltage_drops': voltage_drops.tolist(),
+            'power': power.tolist(),
+            'total_power': float(power.sum())
+        }
+
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        try:
+            result = self.analyze(circuit)
+            return result['currents'] if result else None
+        except Exception as e:
+            logger.error(f"Error en método analítico: {e}")
+            return None
+
+    def solve_batch(self, circuit_type: str, voltages, resistors) -> Optional[np.ndarray]:
+        if circuit_type not in self.TOPOLOGIES:
+            return super().solve_batch(circuit_type, voltages, resistors)
+
+        V = np.atleast_1d(np.asarray(voltages, dtype=float))
+        R = np.atleast_2d(np.asarray(resistors, dtype=float))
+
+        if R.shape[1] < 2:
+            return None
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if circuit_type == 'serie':
+                solutions = (V / R.sum(axis=1))[:, np.newaxis]
+            else:
+                solutions = V[:, np.newaxis] / R
+
+        solutions[~np.all(np.isfinite(solutions), axis=1)] = np.nan
+        return solutions
+
+
+class IncrementalStrategy(ResolutionStrategy):
+    """
+    Reutiliza el cálculo anterior cuando entre dos resoluciones solo cambiaron
+    algunas resistencias (set_resistor, add_resistor, remove_resistor).
+
+    Modo escalera (por defecto): los tres tipos de circuito son tridiagonales;
+    se reinicia el barrido de Thomas desde la primera fila afectada y se repite
+    la sustitución hacia atrás.
+
+    Modo denso (dense=True): se conserva la factorización de la red base y cada
+    edición se aplica como una corrección de rango 1 (Sherman–Morrison, acumuladas
+    como Woodbury), a O(n²) por cálculo en lugar de O(n³).
+
+    Si el registro de cambios no alcanza, la actualización está mal condicionada
+    o el residuo ‖Ax−b‖ supera la tolerancia, se resuelve todo de nuevo.
+    """
+    CONFIG = ('dense', 'tolerance', 'max_updates')
+
+    def __init__(self, dense: bool = False, tolerance: float = 1e-9, max_updates: int = 16):
+        self.dense = dense
+        self.tolerance = tolerance
+        self.max_updates = max_updates
+        self.last_update = None  # 'full' o 'incremental'
+        self._state = None
+
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        try:
+            system = circuit.build_banded_system()
+
+            if system is None:
+                self._state = None
+                return None
+
+            events = self._pending_events(circuit)
+            solutions = None
+
+            if events is not None:
+                if self.dense:
+                    solutions = self._update_dense(circuit, system, events)
+                else:
+                    solutions = self._update_ladder(circuit, system, events)
+
+            if solutions is not None and self._is_accurate(system, solutions):
+                self.last_update = 'incremental'
+            else:
+                solutions = self._full_solve(circuit, system)
+                self.last_update = 'full'
+
+            self._state['revision'] = circuit.network_revision
+            return solutions.tolist()
+
+        except np.linalg.LinAlgError:
+            self._state = None
+            return None  # Sistema singular
+        except Exception as e:
+            self._state = None
+            logger.error(f"Error en método incremental: {e}")
+            return None
+
+    def _pending_events(self, circuit) -> Optional[List[tuple]]:
+        """Cambios de red desde el último cálculo (None si hay que resolver todo)"""
+        state = self._state
+        if state is None or state['circuit'] is not circuit.origin or state['circuit_type'] != circuit.circuit_type:
+            return None
+        events = circuit.changes_since(state['revision'])
+        if events is None or any(event[0] in ('replace', 'circuit_type') for event in events):
+            return None
+        return events
+
+    def _is_accurate(self, system, solutions: np.ndarray) -> bool:
+        residual = np.linalg.norm(system.matvec(solutions) - system.b)
+        return bool(np.all(np.isfinite(solutions))) and residual <= self.tolerance * max(np.linalg.norm(system.b), 1.0)
+
+    def _full_solve(self, circuit, system) -> np.ndarray:
+        if self.dense:
+            factorization = DenseFactorization(system.to_dense()[0])
+            self._state = {'factorization': factorization, 'n': system.n, 'edits': [], 'Z': None}
+            solutions = factorization.solve(system.b)
+        else:
+            self._state = {'pivots': [], 'c': [], 'd': []}
+            solutions = self._sweep(system, 0)
+
+        self._state.update(circuit=circuit.origin, circuit_type=circuit.circuit_type)
+        return solutions
+
+    # Modo escalera
+
+    def _update_ladder(self, circuit, system, events: List[tuple]) -> Optional[np.ndarray]:
+        state = self._state
+        # La fila i usa Ri y Ri+1: un cambio en Rj afecta desde la fila j-1
+        # (en serie la única fila depende de todas). Si cambió el voltaje
+        # cambia b[0] y se reinicia desde el principio.
+        if circuit.circuit_type == 'serie' or state['b0'] != system.b[0]:
+            start = 0
+        else:
+            start = len(state['pivots'])
+        for event in events:
+            start = min(start, max(event[1] - 1, 0))
+        if start == 0:
+            # Nada que reutilizar: es un cálculo completo y así se informa
+            return None
+        return self._sweep(system, min(start, system.n))
+
+    def _sweep(self, system, start: int) -> np.ndarray:
+        """Barrido de Thomas reutilizando las filas [0, start) del cálculo anterior"""
+        state = self._state
+        n = system.n
+        lower = system.band(-1).tolist()
+        diag = system.band(0).tolist()
+        upper = system.band(1).tolist()
+        b = system.b.tolist()
+
+        pivots = state['pivots'][:start] + [0.0] * (n - start)
+        c = state['c'][:start] + [0.0] * (n - start)
+        d = state['d'][:start] + [0.0] * (n - start)
+
+        # FASE 1: Eliminación hacia adelante desde la primera fila afectada
+        for i in range(start, n):
+            if i == 0:
+                pivot = diag[0]
+                rhs = b[0]
+            else:
+                pivot = diag[i] - lower[i-1] * c[i-1]
+                rhs = b[i] - lower[i-1] * d[i-1]
+
+            if abs(pivot) < 1e-10:
+                raise np.linalg.LinAlgError("Sistema singular")
+
+            pivots[i] = pivot
+            c[i] = upper[i] / pivot if i < n - 1 else 0.0
+            d[i] = rhs / pivot
+
+        state.update(pivots=pivots, c=c, d=d, b0=b[0])
+
+        # FASE 2: Sustitución hacia atrás
+        solutions = list(d)
+        for i in range(n - 2, -1, -1):
+            solutions[i] = d[i] - c[i] * solutions[i+1]
+        return np.array(solutions)
+
+    # Modo denso
+
+    def _update_dense(self, circuit, system, events: List[tuple]) -> Optional[np.ndarray]:
+        state = self._state
+        if system.n != state['n'] or any(event[0] != 'edit' for event in events):
+            return None
+        if len(state['edits']) + len(events) > self.max_updates:
+            return None
+
+        factorization = state['factorization']
+        if not events and not state['edits']:
+            return factorization.solve(system.b)
+
+        for _, index, previous, new in events:
+            state['edits'].append((self._edit_vector(circuit.circuit_type, index, system.n), new - previous))
+
+        # A' = A + U·D·Uᵀ  =>  x = y - Z·(D⁻¹ + UᵀZ)⁻¹·Uᵀy, con y = A⁻¹b y Z = A⁻¹U
+        U = np.column_stack([u for u, _ in state['edits']])
+        deltas = np.array([delta for _, delta in state['edits']])
+        Z = state['Z']
+        new_columns = U.shape[1] - (0 if Z is None else Z.shape[1])
+        if new_columns:
+            Z_new = factorization.solve(U[:, -new_columns:])
+            Z = Z_new if Z is None else np.hstack([Z, Z_new])
+            state['Z'] = Z
+
+        if np.any(deltas == 0):
+            return None
+        capacitance = np.diag(1.0 / deltas) + U.T @ Z
+        # Actualización insegura: la capacitancia está mal condicionada
+        if np.linalg.cond(capacitance) > 1e10:
+            return None
+
+        y = factorization.solve(system.b)
+        return y - Z @ np.linalg.solve(capacitance, U.T @ y)
+
+    def _edit_vector(self, circuit_type: str, index: int, n: int) -> np.ndarray:
+        """u tal que cambiar Rj en δ suma δ·u·uᵀ a la matriz A"""
+        u = np.zeros(n)
+        if circuit_type == 'serie':
+            u[0] = 1.0
+        elif circuit_type == 'paralelo' or index == 0:
+            u[index] = 1.0
+        else:
+            # mallas: Rj es compartida entre las mallas j-1 y j
+            u[index - 1] = 1.0
+            u[index] = -1.0
+        return u
+
+
+def _preconditioned_cg(matvec, b: np.ndarray, precondition, x0: np.ndarray, tolerance: float,
+                       max_iterations: int, monitor: Optional[SolveMonitor] = None):
+    """
+    Gradiente conjugado precondicionado para A simétrica definida positiva.
+    Solo necesita A·p (matvec) y M⁻¹·r (precondition). Devuelve (x, telemetría).
+    """
+    norm_b = float(np.linalg.norm(b))
+    x = x0.copy()
+    r = b - matvec(x)
+    history = [float(np.linalg.norm(r)) / norm_b]
+    telemetry = {'converged': history[0] <= tolerance, 'iterations': 0, 'reason': 'tolerancia'}
+
+    if not telemetry['converged']:
+        z = precondition(r)
+        p = z.copy()
+        rz = float(r @ z)
+        for iteration in range(1, max_iterations + 1):
+            Ap = matvec(p)
+            pAp = float(p @ Ap)
+            if pAp <= 0.0:
+                telemetry['reason'] = 'A no es definida positiva'
+                break
+
+            alpha = rz / pAp
+            x += alpha * p
+            r -= alpha * Ap
+            history.append(float(np.linalg.norm(r)) / norm_b)
+            telemetry['iterations'] = iteration
+
+            if monitor is not None and history[-1] > 0:
+                # Progreso en escala logarítmica: de residuo inicial a tolerancia
+                done = np.log(history[0] / history[-1]) / np.log(history[0] / tolerance)
+                monitor.report(float(min(max(done, 0.0), 1.0)))
+
+            if history[-1] <= tolerance:
+                telemetry['converged'] = True
+                break
+
+            z = precondition(r)
+            rz_next = float(r @ z)
+            p = z + (rz_next / rz) * p
+            rz = rz_next
+        else:
+            telemetry['reason'] = 'límite de iteraciones'
+
+    # El residuo actualizado se desvía del real con muchas iteraciones: se recalcula
+    telemetry['relative_residual'] = float(np.linalg.norm(b - matvec(x))) / norm_b
+    telemetry['residual_history'] = history
+    return x, telemetry
+
+
+class ConjugateGradientStrategy(ResolutionStrategy):
+    """
+    Gradiente conjugado precondicionado sin matriz: A se aplica como operador
+    directo desde el vector de resistencias (MeshOperator), en O(n) por iteración
+    y sin guardar bandas, para redes de millones de mallas.
+
+    Precondicionadores:
+        'escalera' (por defecto): A⁻¹ exacta de la escalera vía A = Bᵀ·diag(R)·B,
+                   dos sumas acumuladas; en mallas converge en una o dos iteraciones
+        'jacobi':  diagonal de A; barato pero en escaleras largas necesita del
+                   orden de n iteraciones (cond(A) crece como n²)
+        None:      sin precondicionar
+
+    Con warm_start, si se vuelve a resolver el mismo circuito con igual cantidad
+    de mallas, parte de la solución anterior escalada por el cambio de voltaje.
+    Cada resolución deja en telemetry iteraciones, historial del residuo relativo,
+    residuo final, tiempo y si convergió.
+    """
+    PRECONDITIONERS = ('escalera', 'jacobi', None)
+    # warm_start solo cambia el punto de partida, no la tolerancia del resultado
+    CONFIG = ('tolerance', 'max_iterations', 'preconditioner')
+
+    def __init__(self, tolerance: float = 1e-10, max_iterations: Optional[int] = None,
+                 preconditioner: Optional[str] = 'escalera', warm_start: bool = True):
+        if preconditioner not in self.PRECONDITIONERS:
+            raise ValueError(f"Precondicionador desconocido: {preconditioner}")
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.preconditioner = preconditioner
+        self.warm_start = warm_start
+        self.telemetry = None
+        self._previous = None
+
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        start = time.perf_counter()
+        try:
+            if len(circuit.resistors) < 2:
+                return None
+
+            operator = MeshOperator(circuit.circuit_type, circuit.resistors)
+            b = operator.rhs(circuit.voltage)
+            if not np.any(b):
+                return [0.0] * operator.n
+
+            x0, warm = self._initial_guess(circuit, operator.n)
+            precondition, name = self._precondition(operator)
+            max_iterations = self.max_iterations or max(2 * operator.n, 100)
+
+            with PROFILER.timer('iterate.cg'):
+                x, telemetry = _preconditioned_cg(
+                    operator.matvec, b, precondition, x0, self.tolerance, max_iterations, monitor
+                )
+            PROFILER.count('cg.iterations', telemetry['iterations'])
+            telemetry.update(
+                n=operator.n, preconditioner=name, warm_start=warm,
+                elapsed=time.perf_counter() - start
+            )
+            self.telemetry = telemetry
+
+            if not telemetry['converged'] or not np.all(np.isfinite(x)):
+                logger.error(f"Error: gradiente conjugado sin convergencia ({telemetry['reason']}, "
+                             f"{telemetry['iterations']} iteraciones, residuo {telemetry['relative_residual']:.2e})")
+                return None
+
+            self._previous = {'circuit': circuit.origin, 'voltage': circuit.voltage, 'x': x}
+            return x.tolist()
+
+        except SolveCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Error en gradiente conjugado: {e}")
+            return None
+
+    def _initial_guess(self, circuit, n: int):
+        previous = self._previous
+        if (not self.warm_start or previous is None or previous['circuit'] is not circuit.origin
+                or len(previous['x']) != n or previous['voltage'] == 0):
+            return np.zeros(n), False
+        # La solución es lineal en b: un cambio de voltaje solo la escala
+        return previous['x'] * (circuit.voltage / previous['voltage']), True
+
+    def _precondition(self, operator: MeshOperator):
+        if self.preconditioner == 'escalera' and np.all(operator.R != 0):
+            return operator.ladder_solve, 'escalera'
+        if self.preconditioner is not None:
+            diag = operator.diagonal()
+            if np.all(diag > 0):
+                return (lambda r: r / diag), 'jacobi'
+        return (lambda r: r), 'ninguno'
+
+
+class SparseMNAStrategy(ResolutionStrategy):
+    """
+    Análisis nodal modificado (MNA) disperso: resuelve un Netlist de topología
+    arbitraria, con varias fuentes de tensión y de corriente. Los circuitos
+    clásicos se convierten con Netlist.from_legacy y devuelven las mismas
+    corrientes que las demás estrategias.
+
+    La matriz se arma en CSR y se factoriza con SparseFactorization (SuperLU
+    si SciPy está instalado; si no, LU por bandas tras Cuthill-McKee inverso).
+    La factorización se guarda por huella de la red: cambiar el valor de las
+    fuentes solo repite la sustitución.
+
+    solve() devuelve, para un Netlist, la corriente de cada resistencia en
+    orden de alta; solve_netlist() da además tensiones de nodo y corrientes
+    de las fuentes de tensión.
+    """
+    handles_netlists = True
+
+    def __init__(self, cache_size: int = 4):
+        self.factorizations = FactorizationCache(cache_size, type(self).__name__)
+
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        if circuit.circuit_type != 'netlist' and len(circuit.resistors) < 2:
+            return None
+
+        netlist = circuit if circuit.circuit_type == 'netlist' else circuit.to_netlist()
+        result = self.solve_netlist(netlist, monitor, key_circuit=circuit)
+        if result is None:
+            return None
+
+        if circuit.circuit_type == 'netlist':
+            return result['branch_currents'].tolist()
+        return legacy_currents(circuit.circuit_type, result['branch_currents']).tolist()
+
+    def solve_netlist(self, netlist: Netlist, monitor: Optional[SolveMonitor] = None,
+                      key_circuit=None) -> Optional[dict]:
+        """
+        Resuelve el netlist. key_circuit es el circuito por cuya huella se
+        guarda la factorización (por defecto el propio netlist).
+
+        Returns:
+            dict con node_voltages {nodo: V}, source_currents {fuente: A, entrando
+            por +}, branch_currents (array por resistencia) y method ('scipy',
+            'densa' o 'bandas'); None si el sistema es singular o inválido
+        """
+        try:
+            system = netlist.build_mna_system()
+            if system is None:
+                return None
+
+            factorization = self.factorizations.lookup(
+                netlist if key_circuit is None else key_circuit,
+                lambda: SparseFactorization(system.A)
+            )
+            if monitor is not None:
+                monitor.report(0.5)
+
+            solution = factorization.solve(system.b)
+            if not np.all(np.isfinite(solution)):
+                return None
+            if monitor is not None:
+                monitor.report(1.0)
+
+            nodes = system.node_count
+            return {
+                'node_voltages': dict(zip(netlist.node_names[1:], solution[:nodes].tolist())),
+                'source_currents': dict(zip(netlist.element_names('V'), solution[nodes:].tolist())),
+                'branch_currents': netlist.branch_currents(solution),
+                'method': factorization.kind
+            }
+
+        except SolveCancelled:
+            raise
+        except np.linalg.LinAlgError:
+            logger.error("Error: sistema nodal singular (¿hay nodos sin camino a tierra?)")
+            return None
+        except Exception as e:
+            logger.error(f"Error en análisis nodal disperso: {e}")
+            return None
+
+
+AUTO_THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'auto_thresholds.json')
+
+DEFAULT_THRESHOLDS = {
+    'thomas_min_n': 2,           # desde qué tamaño Thomas le gana a la factorización densa
+    'incremental_min_n': 256,    # desde qué tamaño conviene reutilizar el cálculo anterior
+    'cg_min_n': 4096,            # desde qué tamaño el gradiente conjugado sin matriz le gana a Thomas
+    'cg_edit_min_n': 4096,       # desde qué tamaño cg recalcula una edición más rápido que incremental
+    'max_condition': 1e12        # por encima se avisa que el resultado es poco confiable
+}
+
+
+def load_thresholds(path: Optional[str] = None) -> dict:
+    """Umbrales de AutoStrategy: los valores del archivo pisan a los por defecto"""
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    path = AUTO_THRESHOLDS_PATH if path is None else path
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        thresholds.update({key: data[key] for key in DEFAULT_THRESHOLDS if key in data})
+    except (OSError, ValueError) as e:
+        logger.warning(f"No se pudieron leer los umbrales ({e}); se usan los valores por defecto")
+    return thresholds
+
+
+def _crossover(times: dict, sizes, fast: str, slow: str) -> Optional[int]:
+    """
+    Menor n desde el cual fast es al menos tan rápida como slow en todos los
+    tamaños medidos (un acierto aislado por ruido no cuenta). Si se midieron
+    ambas y fast nunca alcanza, devuelve el doble del mayor n medido: fuera
+    del rango conocido. None si no hay datos.
+    """
+    measured = [n for n in sizes if (fast, n) in times and (slow, n) in times]
+    if not measured:
+        return None
+    threshold = measured[-1] * 2
+    for n in reversed(measured):
+        if times[(fast, n)] > times[(slow, n)]:
+            break
+        threshold = n
+    return threshold
+
+
+def thresholds_from_benchmark(report: dict) -> dict:
+    """
+    Calibra los umbrales con una corrida de benchmarks.strategies (mallas):
+        thomas_min_n:      desde qué n tridiagonal es al menos tan rápida como numeric
+        incremental_min_n: desde qué n incremental recalcula una edición al menos
+                           tan rápido como tridiagonal (edit_ms)
+        cg_min_n:          desde qué n cg es al menos tan rápida como tridiagonal
+        cg_edit_min_n:     desde qué n cg recalcula una edición al menos tan
+                           rápido como incremental (edit_ms)
+    Los umbrales sin datos en el reporte quedan con su valor por defecto.
+    """
+    thresholds = dict(DEFAULT_THRESHOLDS)
+
+    entries = [entry for entry in report['results']
+               if entry.get('status') == 'ok' and entry['type'] == 'mallas']
+    times = {(entry['strategy'], entry['n']): entry['solve_ms'] / 1000.0 for entry in entries}
+    edit_times = {(entry['strategy'], entry['n']): entry['edit_ms'] / 1000.0
+                  for entry in entries if 'edit_ms' in entry}
+    sizes = sorted({n for _, n in times})
+
+    for key, table, fast, slow in (
+        ('thomas_min_n', times, 'tridiagonal', 'numeric'),
+        ('incremental_min_n', edit_times, 'incremental', 'tridiagonal'),
+        ('cg_min_n', times, 'cg', 'tridiagonal'),
+        ('cg_edit_min_n', edit_times, 'cg', 'incremental')
+    ):
+        threshold = _crossover(table, sizes, fast, slow)
+        if threshold is not None:
+            thresholds[key] = threshold
+
+    meta = report.get('meta', {})
+    thresholds['source'] = f"benchmark {meta.get('timestamp', '?')} ({meta.get('machine', '?')}, numpy {meta.get('numpy', '?')})"
+    return thresholds
+
+
+class AutoStrategy(ResolutionStrategy):
+    """
+    Elige el motor según la estructura y el tamaño del sistema:
+
+        diagonal (serie, paralelo)        -> numeric: división directa O(n)
+        mallas con resistencias positivas (tridiagonal diagonalmente dominante)
+            en edición (network_revision > 0), según el costo de recalcular un cambio:
+                n >= cg_edit_min_n        -> cg: gradiente conjugado con arranque en caliente
+                n >= incremental_min_n    -> incremental: Thomas que reutiliza el cálculo anterior
+            sin ediciones:
+                n >= cg_min_n             -> cg: gradiente conjugado sin matriz, O(n) vectorizado
+            n >= thomas_min_n             -> tridiagonal: Thomas O(n), estable sin pivotear
+        mallas sin dominancia diagonal    -> numeric: LU con pivoteo
+        netlist (topología arbitraria)    -> sparse: análisis nodal modificado disperso
+
+    Si cg no converge se reintenta con tridiagonal; si Thomas encuentra un
+    pivote nulo, con LU con pivoteo. El condicionamiento no interviene en la
+    elección: numeric lo estima y avisa si supera max_condition.
+
+    Los umbrales se leen de auto_thresholds.json (calibrado con benchmarks.strategies).
+    Cada elección se registra con logging y queda en last_choice = (motor, motivo).
+    """
+    handles_netlists = True
+    CONFIG = ('thresholds',)
+
+    def __init__(self, thresholds: Optional[dict] = None, config_path: Optional[str] = None):
+        self.thresholds = dict(DEFAULT_THRESHOLDS)
+        self.thresholds.update(thresholds if thresholds is not None else load_thresholds(config_path))
+        self.last_choice = None
+        self.last_result = None  # SolveResult de la última resolución con numeric
+        self._engines = {}
+
+    def engine(self, name: str) -> ResolutionStrategy:
+        if name not in self._engines:
+            self._engines[name] = {
+                'numeric': NumericStrategy,
+                'tridiagonal': TridiagonalStrategy,
+                'incremental': IncrementalStrategy,
+                'cg': ConjugateGradientStrategy,
+                'sparse': SparseMNAStrategy
+            }[name]()
+        return self._engines[name]
+
+    def choose(self, circuit) -> Tuple[str, str]:
+        """Devuelve (motor, motivo) sin resolver nada; cuesta O(n)"""
+        if circuit.circuit_type == 'netlist':
+            return 'sparse', f"netlist, {circuit.node_count} nodos: análisis nodal disperso"
+
+        R = circuit.resistors
+        n = len(R)
+        if n < 2:
+            return 'numeric', "sistema inválido"
+
+        if circuit.circuit_type in ('serie', 'paralelo'):
+            return 'numeric', f"diagonal, n={n}: división directa O(n)"
+
+        # Escalera de mallas: con todas las resistencias positivas cada diagonal
+        # (R[i] + R[i+1]) cubre a sus vecinas (-R[i+1]), así que el sistema es
+        # diagonalmente dominante y Thomas es estable sin pivotear
+        if not np.all(R > 0):
+            return 'numeric', f"tridiagonal sin dominancia diagonal, n={n}: LU con pivoteo"
+
+        if circuit.network_revision > 0:
+            # Circuito que se está editando: lo que importa es el costo de recalcular tras un cambio
+            if n >= self.thresholds['cg_edit_min_n']:
+                return 'cg', f"tridiagonal dominante en edición, n={n} >= {self.thresholds['cg_edit_min_n']}: gradiente conjugado con arranque en caliente"
+            if n >= self.thresholds['incremental_min_n']:
+                return 'incremental', f"tridiagonal dominante en edición, n={n} >= {self.thresholds['incremental_min_n']}: Thomas incremental"
+        elif n >= self.thresholds['cg_min_n']:
+            return 'cg', f"tridiagonal dominante, n={n} >= {self.thresholds['cg_min_n']}: gradiente conjugado sin matriz"
+
+        if n >= self.thresholds['thomas_min_n']:
+            return 'tridiagonal', f"tridiagonal dominante, n={n}: Thomas O(n)"
+        return 'numeric', f"tridiagonal chico, n={n} < {self.thresholds['thomas_min_n']}: factorización densa"
+
+    def solve(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        name, reason = self.choose(circuit)
+        self.last_choice = (name, reason)
+        self.last_result = None
+        logger.info("AutoStrategy: %s (%s)", name, reason)
+
+        while True:
+            if name == 'numeric':
+                return self._solve_numeric(circuit, monitor)
+
+            currents = self.engine(name).solve(circuit, monitor)
+            if currents is not None or name == 'sparse':
+                return currents
+            # cg sin converger -> Thomas, O(n); pivote nulo en Thomas -> LU con pivoteo
+            fallback = 'tridiagonal' if name == 'cg' else 'numeric'
+            logger.info("AutoStrategy: %s falló, se reintenta con %s", name, fallback)
+            self.last_choice = (fallback, f"{name} falló")
+            name = fallback
+
+    def _solve_numeric(self, circuit, monitor: Optional[SolveMonitor] = None) -> Optional[List[float]]:
+        result = self.engine('numeric').solve_detailed(circuit, monitor)
+        if result is None:
+            return None
+
+        self.last_result = result
+        if result.condition > self.thresholds['max_condition']:
+            logger.warning("AutoStrategy: sistema mal condicionado (cond ≈ %.2g), se pierden ~%.0f cifras",
+                           result.condition, result.digits_lost())
+        return result.currents
+
+    def solve_batch(self, circuit_type: str, voltages, resistors) -> Optional[np.ndarray]:
+        R = np.atleast_2d(np.asarray(resistors, dtype=float))
+        # Por lotes: Thomas vectorizado sobre los k sistemas para escaleras, diagonal directa para el resto
+        name = 'tridiagonal' if circuit_type == 'mallas' and R.shape[1] >= self.thresholds['thomas_min_n'] else 'numeric'
+        logger.info("AutoStrategy (lotes): %s", name)
+        return self.engine(name).solve_batch(circuit_type, voltages, resistors)
@@ -0,0 +1,296 @@
+"""
+Caché persistente en disco
+Guarda corrientes ya calculadas (y, si se pide, factorizaciones) en una base
+SQLite para reutilizarlas entre sesiones: la red de referencia que se vuelve
+a analizar cada día no se resuelve de nuevo al abrir la aplicación.
+
+Las claves son huellas del contenido (tipo de circuito, resistencias,
+voltaje, estrategia con su configuración y versión del simulador), así que un cambio en cualquiera
+de ellos da otra clave y las entradas viejas solo ocupan lugar hasta que el
+descarte por tamaño las saca (la menos usada recientemente primero).
+
+Varios procesos pueden compartir el archivo: SQLite serializa las escrituras
+(modo WAL, con espera si otro proceso tiene el bloqueo) y cada hilo usa su
+propia conexión. Un error de la base se informa y cuenta como fallo de caché;
+nunca interrumpe un cálculo. sqlite3, pickle y NumPy se importan en el
+primer uso, así que crear la caché al arrancar no cuesta nada.
+"""
+from typing import Optional
+import hashlib
+import logging
+import numbers
+import os
+import threading
+import time
+from utils.version import __version__
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+# Segundos que se espera a otro proceso que tiene la base bloqueada
+BUSY_TIMEOUT = 30.0
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    kind     TEXT NOT NULL,
+    value    BLOB NOT NULL,
+    size     INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+# Encabezado de las entradas de put_object: marca, versión del formato y
+# blake2b del contenido; lo que no coincide se descarta sin deserializar
+OBJECT_MAGIC = b'PSO'
+OBJECT_FORMAT = 1
+OBJECT_DIGEST_SIZE = 32
+
+logger = logging.getLogger(__name__)
+
+
+def default_path() -> str:
+    """Archivo de caché del usuario (directorio de caché del sistema operativo)"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'paradigmas-simulador', 'cache.sqlite3')
+
+
+def _canonical(part) -> bytes:
+    # Los números se pasan a float: 15, 15.0 y np.float64(15.0) dan la misma clave
+    if part is None or isinstance(part, (bool, str)):
+        return repr(part).encode()
+    if isinstance(part, numbers.Real):
+        return repr(float(part)).encode()
+    if isinstance(part, (tuple, list)):
+        return b'(' + b','.join(_canonical(item) for item in part) + b')'
+    return repr(part).encode()
+
+
+def content_key(kind: str, *parts) -> str:
+    """Huella de las partes más la versión del simulador"""
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (kind, __version__) + parts:
+        digest.update(_canonical(part))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _object_digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=OBJECT_DIGEST_SIZE).digest()
+
+
+def result_key(circuit, strategy) -> str:
+    """
+    Clave de las corrientes de un circuito con una estrategia. La huella de
+    la red ya cubre tipo de circuito y resistencias; strategy.cache_key()
+    agrega la clase y su configuración (modo, tolerancia, precondicionador).
+    """
+    return content_key(
+        'currents', circuit.circuit_type, circuit.network_fingerprint(), circuit.voltage,
+        *strategy.cache_key()
+    )
+
+
+class DiskCache:
+    """
+    Almacén clave -> bytes en SQLite con tamaño total acotado.
+
+        cache = DiskCache()                        # archivo por defecto del usuario
+        key = result_key(circuit, strategy)
+        currents = cache.get_currents(key)
+        if currents is None:
+            currents = strategy.solve(circuit)
+            cache.put_currents(key, currents)
+    """
+    def __init__(self, path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError("max_bytes debe ser al menos 1")
+        self.path = default_path() if path is None else path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        # Todas las conexiones abiertas (de cualquier hilo), para que close() las cierre
+        self._connections = []
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _connection(self):
+        # Una conexión por hilo y por proceso: las de sqlite3 no se comparten.
+        # Tras close() la generación cambia y cada hilo abre una nueva
+        connection = getattr(self._local, 'connection', None)
+        if (connection is not None and self._local.pid == os.getpid()
+                and self._local.generation == self._generation):
+            return connection
+
+        import sqlite3
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # isolation_level=None: las transacciones se abren a mano (BEGIN IMMEDIATE)
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None,
+                                     check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        with self._lock:
+            self._connections.append((os.getpid(), connection))
+            self._local.generation = self._generation
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def _report(error: Exception):
+        # Al registro (stderr) y no a stdout, donde la CLI escribe los resultados
+        logger.warning(f"Caché en disco no disponible: {error}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        import sqlite3
+        try:
+            connection = self._connection()
+            row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            except sqlite3.OperationalError:
+                # Otro proceso está escribiendo: el orden de descarte puede esperar
+                pass
+            self.hits += 1
+            return bytes(row[0])
+        except (sqlite3.Error, OSError) as e:
+            self._report(e)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: bytes, kind: str = 'blob'):
+        """Guarda value y descarta las entradas menos usadas si se pasa de max_bytes"""
+        if len(value) > self.max_bytes:
+            return
+        import sqlite3
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, kind, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, kind, sqlite3.Binary(value), len(value), time.time())
+                )
+                self._evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except (sqlite3.Error, OSError) as e:
+            self._report(e)
+
+    def _evict(self, connection):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        victims = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def get_currents(self, key: str) -> Optional[list]:
+        import numpy as np
+        value = self.get(key)
+        return None if value is None else np.frombuffer(value, dtype='<f8').tolist()
+
+    def put_currents(self, key: str, currents):
+        import numpy as np
+        self.put(key, np.ascontiguousarray(currents, dtype='<f8').tobytes(), 'currents')
+
+    def get_object(self, key: str):
+        """
+        Objeto guardado con put_object (p. ej. una factorización). Usa pickle:
+        el archivo de caché debe ser del propio usuario, como cualquier otro
+        archivo que ejecuta la aplicación. Antes de deserializar se comprueban
+        la versión del formato y la suma blake2b del contenido; una entrada
+        truncada, corrupta o de otro formato se descarta y cuenta como fallo.
+        """
+        import pickle
+        value = self.get(key)
+        if value is None:
+            return None
+
+        header = len(OBJECT_MAGIC) + 1
+        payload = value[header + OBJECT_DIGEST_SIZE:]
+        if (value[:len(OBJECT_MAGIC)] != OBJECT_MAGIC or value[len(OBJECT_MAGIC)] != OBJECT_FORMAT
+                or value[header:header + OBJECT_DIGEST_SIZE] != _object_digest(payload)):
+            logger.warning("Caché en disco: entrada %s inválida, se descarta", key)
+            return self._reject(key)
+        try:
+            return pickle.loads(payload)
+        except Exception:
+            # Entrada de una versión con otras clases: se trata como ausente
+            return self._reject(key)
+
+    def _reject(self, key: str):
+        # get() ya la contó como acierto: una entrada inservible es un fallo
+        self.hits -= 1
+        self.misses += 1
+        self.discard(key)
+        return None
+
+    def put_object(self, key: str, value, kind: str = 'object') -> bool:
+        """Guarda value con pickle; devuelve False si el objeto no se puede serializar"""
+        import pickle
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        self.put(key, OBJECT_MAGIC + bytes([OBJECT_FORMAT]) + _object_digest(payload) + payload, kind)
+        return True
+
+    def discard(self, key: str):
+        import sqlite3
+        try:
+            self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+        except (sqlite3.Error, OSError) as e:
+            self._report(e)
+
+    def clear(self):
+        import sqlite3
+        try:
+            self._connection().execute("DELETE FROM entries")
+        except (sqlite3.Error, OSError) as e:
+            self._report(e)
+
+    def stats(self) -> dict:
+        import sqlite3
+        data = {
+            'path': self.path,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+        try:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            data.update(entries=entries, bytes=size)
+        except (sqlite3.Error, OSError) as e:
+            self._report(e)
+        return data
+
+    def close(self):
+        """
+        Cierra las conexiones de todos los hilos de este proceso (cada hilo
+        abre otra si vuelve a usar la caché). Las heredadas de un fork son del
+        proceso padre: se olvidan sin cerrarlas.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for pid, connection in connections:
+            if pid == os.getpid():
+                connection.close()
+        self._local.connection = None
@@ -0,0 +1,195 @@
+"""
+Instrumentación de las fases de cálculo
+Cronómetros con nombre, contadores y memoria pico (tracemalloc) para saber
+si el tiempo se va en armar el sistema, convertir datos, factorizar,
+eliminar o dibujar los resultados.
+
+Desactivada por defecto: mientras lo está, timer() devuelve un contexto
+vacío compartido y count() retorna enseguida, así que cada punto
+instrumentado cuesta una lectura de atributo.
+
+    from utils.profiling import PROFILER
+    PROFILER.enable(track_memory=True)
+    ...
+    print(PROFILER.to_json())
+"""
+from contextlib import nullcontext
+from typing import Optional
+import functools
+import threading
+import time
+
+_DISABLED = nullcontext()
+
+
+class _Stat:
+    __slots__ = ('calls', 'total', 'min', 'max', 'peak')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.peak = None
+
+    def add(self, elapsed: float, peak: Optional[int]):
+        self.calls += 1
+        self.total += elapsed
+        self.min = min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+        if peak is not None:
+            self.peak = peak if self.peak is None else max(self.peak, peak)
+
+    def as_dict(self) -> dict:
+        data = {
+            'calls': self.calls,
+            'total_ms': self.total * 1000.0,
+            'mean_ms': self.total * 1000.0 / self.calls,
+            'min_ms': self.min * 1000.0,
+            'max_ms': self.max * 1000.0
+        }
+        if self.peak is not None:
+            data['peak_kb'] = self.peak / 1024.0
+        return data
+
+
+class _Timer:
+    """
+    Mide un bloque. Con memoria, informa el pico de bytes asignados dentro
+    del bloque; los bloques anidados le pasan su pico al de afuera, porque
+    tracemalloc tiene un solo registro de pico por proceso.
+    """
+    __slots__ = ('profiler', 'name', 'start', 'frame')
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.frame = None
+
+    def __enter__(self):
+        import tracemalloc
+        if self.profiler.track_memory and tracemalloc.is_tracing():
+            stack = self.profiler._stack()
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            # [memoria al entrar, pico absoluto visto en bloques internos]
+            self.frame = [current, 0]
+            stack.append(self.frame)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        peak = None
+        if self.frame is not None:
+            import tracemalloc
+            _, absolute = tracemalloc.get_traced_memory()
+            absolute = max(absolute, self.frame[1])
+            stack = self.profiler._stack()
+            stack.pop()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], absolute)
+            peak = max(absolute - self.frame[0], 0)
+        self.profiler.record(self.name, elapsed, peak)
+        return False
+
+
+class Profiler:
+    """Registro de cronómetros y contadores, seguro entre hilos"""
+    def __init__(self):
+        self.enabled = False
+        self.track_memory = False
+        self._owns_tracing = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._timers = {}
+        self._counters = {}
+
+    def enable(self, track_memory: bool = False):
+        # tracemalloc se importa solo si se pide memoria: cuesta al arrancar
+        import tracemalloc
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        self.track_memory = track_memory
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self.track_memory = False
+        if self._owns_tracing:
+            import tracemalloc
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def reset(self):
+        with self._lock:
+            self._timers = {}
+            self._counters = {}
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def timer(self, name: str):
+        """Contexto que mide el bloque con ese nombre (vacío si está desactivado)"""
+        return _Timer(self, name) if self.enabled else _DISABLED
+
+    def count(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record(self, name: str, elapsed: float, peak: Optional[int] = None):
+        with self._lock:
+            stat = self._timers.get(name)
+            if stat is None:
+                stat = self._timers[name] = _Stat()
+            stat.add(elapsed, peak)
+
+    def report(self) -> dict:
+        """
+        Estado actual: timers {nombre: estadísticas}, counters y strategies
+        (los cronómetros 'solve.<Estrategia>', uno por clase de estrategia)
+        """
+        with self._lock:
+            timers = {name: stat.as_dict() for name, stat in sorted(self._timers.items())}
+            counters = dict(sorted(self._counters.items()))
+        return {
+            'enabled': self.enabled,
+            'track_memory': self.track_memory,
+            'timers': timers,
+            'counters': counters,
+            'strategies': {
+                name[len('solve.'):]: stats for name, stats in timers.items() if name.startswith('solve.')
+            }
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        import json
+        text = json.dumps(self.report(), indent=2, ensure_ascii=False)
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text + "\n")
+        return text
+
+
+PROFILER = Profiler()
+
+
+def profiled(name: str):
+    """Decorador: mide cada llamada a la función con el cronómetro name"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return function(*args, **kwargs)
+            with PROFILER.timer(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -11,19 +11,36 @@ TRANSLATIONS = {
         'calculator': 'Analizador (Motor de Cálculo)',
         'circuit_type': 'Tipo de Circuito',
         'method': 'Método de Resolución:',
+        'auto': 'Automático (elige el más rápido)',
         'cramer': 'Regla de Cramer',
         'gauss': 'Gauss-Jordan',
         'numeric': 'Librería Numérica (NumPy)',
+        'tridiagonal': 'Algoritmo de Thomas (Tridiagonal)',
+        'incremental': 'Recálculo Incremental',
+        'cg': 'Gradiente Conjugado (sin matriz)',
+        'sparse': 'Análisis Nodal Disperso (MNA)',
         'voltage': 'Voltaje (V):',
         'resistance': 'Nueva Resistencia (Ω):',
         'add_resistor': 'Agregar Resistencia',
         'remove': 'Eliminar',
         'calculate': 'Calcular Corrientes',
+        'cancel': 'Cancelar',
+        'diagnostics': 'Diagnóstico',
+        'disk_cache': 'Caché en disco',
+        'refresh': 'Actualizar',
+        'reset': 'Reiniciar',
+        'export_json': 'Exportar JSON',
         'results': 'Resultados',
         'current': 'Corriente',
         'direction': 'Sentido',
         'clockwise': 'Horario ',
         'counterclockwise': 'Antihorario ',
+        'jump_to_mesh': 'Ir a malla',
+        'min_current': 'Mínima',
+        'max_current': 'Máxima',
+        'rms_current': 'RMS',
+        'total_power': 'Potencia total',
+        'counterclockwise_meshes': 'Antihorarias',
         'patterns': 'Patrones Implementados',
         'solid': 'Principios SOLID',
         'error': 'Error',
@@ -38,19 +55,36 @@ TRANSLATIONS = {
         'calculator': 'Analisador (Motor de Cálculo)',
         'circuit_type': 'Tipo de Circuito',
         'method': 'Método de Resolução:',
+        'auto': 'Automático (escolhe o mais rápido)',
         'cramer': 'Regra de Cramer',
         'gauss': 'Gauss-Jordan',
         'numeric': 'Biblioteca Numérica (NumPy)',
+        'tridiagonal': 'Algoritmo de Thomas (Tridiagonal)',
+        'incremental': 'Recálculo Incremental',
+        'cg': 'Gradiente Conjugado (sem matriz)',
+        'sparse': 'Análise Nodal Esparsa (MNA)',
         'voltage': 'Tensão (V):',
         'resistance': 'Nova Resistência (Ω):',
         'add_resistor': 'Adicionar Resistência',
         'remove': 'Eliminar',
         'calculate': 'Calcular Correntes',
+        'cancel': 'Cancelar',
+        'diagnostics': 'Diagnóstico',
+        'disk_cache': 'Cache em disco',
+        'refresh': 'Atualizar',
+        'reset': 'Reiniciar',
+        'export_json': 'Exportar JSON',
         'results': 'Resultados',
         'current': 'Corrente',
         'direction': 'Sentido',
         'clockwise': 'Horário ',
         'counterclockwise': 'Anti-horário ',
+        'jump_to_mesh': 'Ir para malha',
+        'min_current': 'Mínima',
+        'max_current': 'Máxima',
+        'rms_current': 'RMS',
+        'total_power': 'Potência total',
+        'counterclockwise_meshes': 'Anti-horárias',
         'patterns': 'Padrões Implementados',
         'solid': 'Princípios SOLID',
         'error': 'Erro',
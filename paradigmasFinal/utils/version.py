@@ -0,0 +1,7 @@
+"""
+Versión del simulador
+Forma parte de las claves de la caché en disco: al cambiar algo que pueda
+alterar los resultados (una estrategia, el armado del sistema) hay que
+subirla para que las corrientes guardadas por versiones anteriores no se usen.
+"""
+__version__ = '1.0.0'
@@ -0,0 +1,80 @@
+"""
+Cálculos en segundo plano para la interfaz
+Resuelve en un hilo de trabajo y entrega progreso y resultado en el hilo de Tk
+mediante root.after, así la ventana nunca se congela.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundSolver:
+    """
+    Ejecuta un cálculo por vez. Un pedido nuevo reemplaza al anterior: el viejo
+    se cancela (se detiene en su próximo report()) y su resultado se descarta.
+    """
+    POLL_MS = 50
+
+    def __init__(self, root, monitor_factory):
+        self.root = root
+        self._monitor_factory = monitor_factory
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solver")
+        self._generation = 0
+        self._job = None
+
+    @property
+    def busy(self) -> bool:
+        return self._job is not None
+
+    def submit(self, task, on_done, on_progress=None, on_cancel=None):
+        """
+        task(monitor) corre en el hilo de trabajo; on_done(resultado),
+        on_progress(fracción) y on_cancel() se llaman en el hilo de Tk.
+        """
+        self._drop()
+        monitor = self._monitor_factory()
+        self._generation += 1
+        self._job = {
+            'generation': self._generation,
+            'future': self._executor.submit(task, monitor),
+            'monitor': monitor,
+            'on_done': on_done,
+            'on_progress': on_progress,
+            'on_cancel': on_cancel
+        }
+        self.root.after(self.POLL_MS, self._poll, self._generation)
+
+    def cancel(self):
+        "Cancela el cálculo en curso (si hay uno) y avisa con on_cancel"
+        job = self._drop()
+        if job is not None and job['on_cancel'] is not None:
+            job['on_cancel']()
+
+    def shutdown(self):
+        self._drop()
+        self._executor.shutdown(wait=False)
+
+    def _drop(self):
+        job, self._job = self._job, None
+        if job is not None:
+            job['monitor'].cancel()
+            job['future'].cancel()
+        return job
+
+    def _poll(self, generation):
+        job = self._job
+        if job is None or job['generation'] != generation:
+            return  # cancelado o reemplazado por un pedido más nuevo
+
+        if job['on_progress'] is not None:
+            job['on_progress'](job['monitor'].progress)
+
+        if not job['future'].done():
+            self.root.after(self.POLL_MS, self._poll, generation)
+            return
+
+        self._job = None
+        try:
+            result = job['future'].result()
+        except Exception as e:
+            print(f"Error en el cálculo en segundo plano: {e}")
+            result = None
+        job['on_done'](result)
@@ -0,0 +1,81 @@
+"""
+Panel de diagnóstico (opcional)
+Ventana aparte con los cronómetros, contadores y estadísticas por estrategia
+de utils.profiling. Mientras está abierta la instrumentación queda activa;
+al cerrarla se desactiva.
+"""
+from tkinter import filedialog
+import customtkinter as ctk
+
+
+class DiagnosticsPanel(ctk.CTkToplevel):
+    def __init__(self, master, texts, controller, on_close=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.t = texts
+        self.controller = controller
+        self._on_close = on_close
+
+        self.title(self.t['diagnostics'])
+        self.geometry('640x520')
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.controller.enable_profiling(track_memory=True)
+
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(fill="x", padx=10, pady=(10, 5))
+        for text, command in (
+            (self.t['refresh'], self.refresh),
+            (self.t['reset'], self.reset),
+            (self.t['export_json'], self.export)
+        ):
+            ctk.CTkButton(
+                buttons,
+                text=text,
+                command=command,
+                height=30,
+                font=ctk.CTkFont(size=12, weight="bold"),
+                corner_radius=6
+            ).pack(side="left", expand=True, fill="x", padx=5)
+
+        self._text = ctk.CTkTextbox(self, font=ctk.CTkFont(size=12, family="Courier"), wrap="none")
+        self._text.pack(fill="both", expand=True, padx=10, pady=(5, 10))
+        self.refresh()
+
+    def refresh(self):
+        report = self.controller.profiling_report()
+        lines = [f"{'fase':<32} {'llamadas':>8} {'total ms':>10} {'media ms':>10} {'pico KB':>10}"]
+        for name, stats in report['timers'].items():
+            peak = f"{stats['peak_kb']:>10.1f}" if 'peak_kb' in stats else f"{'-':>10}"
+            lines.append(f"{name:<32} {stats['calls']:>8} {stats['total_ms']:>10.3f} "
+                         f"{stats['mean_ms']:>10.3f} {peak}")
+        if report['counters']:
+            lines.append("")
+            lines.extend(f"{name:<32} {value:>8}" for name, value in report['counters'].items())
+        for name in ('result_cache', 'disk_cache'):
+            if report.get(name):
+                lines.append("")
+                lines.append(f"{name:<32} " + ", ".join(f"{key}={value}" for key, value in report[name].items()))
+
+        self._text.configure(state="normal")
+        self._text.delete("1.0", "end")
+        self._text.insert("1.0", "\n".join(lines))
+        self._text.configure(state="disabled")
+
+    def reset(self):
+        self.controller.reset_profiling()
+        self.refresh()
+
+    def export(self):
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if path:
+            self.controller.export_profile(path)
+
+    def close(self):
+        self.controller.disable_profiling()
+        if self._on_close is not None:
+            self._on_close()
+        self.destroy()
@@ -1,34 +1,42 @@
 import customtkinter as ctk
 from tkinter import messagebox
+from views.background import BackgroundSolver
+from views.results_table import ResultsTable
+from views.virtual_list import VirtualResistorList
+from utils.profiling import PROFILER
 
 
 
 class CircuitAnalyzerGUI:
+    # Estrategias disponibles: se importan y crean recién en el primer cálculo
+    STRATEGIES = {
+        'auto': 'AutoStrategy',
+        'cramer': 'CramerStrategy',
+        'gauss': 'GaussJordanStrategy',
+        'numeric': 'NumericStrategy',
+        'tridiagonal': 'TridiagonalStrategy',
+        'incremental': 'IncrementalStrategy',
+        'cg': 'ConjugateGradientStrategy',
+        'sparse': 'SparseMNAStrategy'
+    }
+    
     def __init__(self, root: ctk.CTk):
-        from models.circuit import Circuit
-        from strategies.resolution_strategies import (
-            CramerStrategy, GaussJordanStrategy, NumericStrategy
-        )
-        from controllers.circuit_controller import CircuitController
         from utils.translations import TRANSLATIONS
         
         self.root = root
-        self.circuit = Circuit.get_instance()
-        self.circuit.add_observer(self)
+        # Modelo (NumPy) y motor de cálculo se cargan después del primer dibujado
+        self.circuit = None
+        self.controller = None
+        self.solver = None
+        self.strategies = {}
+        self.diagnostics = None
+        # Caché en disco entre sesiones: apagada salvo que el usuario la active
+        self.use_disk_cache = False
         
         self.language = 'es'
         self.TRANSLATIONS = TRANSLATIONS
         self.t = self.TRANSLATIONS[self.language]
         
-        # Estrategias disponibles
-        self.strategies = {
-            'cramer': CramerStrategy(),
-            'gauss': GaussJordanStrategy(),
-            'numeric': NumericStrategy()
-        }
-        
-        self.controller = CircuitController(self.strategies['cramer'])
-        
         # Variables para mantener estado
         self.voltage_var = None
         self.resistor_var = None
@@ -37,21 +45,60 @@ class CircuitAnalyzerGUI:
         
         self.setup_ui()
         self.update_resistor_list()
+        
+        # after_idle dentro de after(0): corre cuando Tk ya terminó de dibujar la ventana
+        self.root.after(0, lambda: self.root.after_idle(self.load_model))
     
-    def update(self, subject):
-        """Observer: Actualiza la vista cuando el modelo cambia"""
+    def load_model(self):
+        "Carga el circuito y el controlador (idempotente)"
+        if self.circuit is not None:
+            return
+        from models.circuit import Circuit
+        from controllers.circuit_controller import CircuitController
+        
+        self.circuit = Circuit.get_instance()
+        self.circuit.add_observer(self)
+        self.controller = CircuitController(cache_size=32)
+        if self.use_disk_cache:
+            self.controller.enable_disk_cache()
         self.update_resistor_list()
     
+    def get_strategy(self, method):
+        "Devuelve la estrategia pedida, creándola (e importando el módulo) la primera vez"
+        if method not in self.strategies:
+            from strategies import resolution_strategies
+            self.strategies[method] = getattr(resolution_strategies, self.STRATEGIES[method])()
+        return self.strategies[method]
+    
+    def get_solver(self):
+        "Los cálculos corren en un hilo aparte para no congelar la ventana"
+        if self.solver is None:
+            from strategies.resolution_strategies import SolveMonitor
+            self.solver = BackgroundSolver(self.root, SolveMonitor)
+        return self.solver
+    
+    def update(self, subject):
+        """Observer: Actualiza la vista cuando el modelo cambia (solo las diferencias)"""
+        change = subject.last_change
+        if change is None or change.network_changed:
+            self.resistor_list.apply_change(change, len(self.circuit.resistors))
+    
     def toggle_language(self):
         """Alterna entre español y portugués"""
         voltage_val = self.voltage_var.get() if self.voltage_var else '15.0'
         resistor_val = self.resistor_var.get() if self.resistor_var else '3.0'
-        method_val = self.method_var.get() if self.method_var else 'cramer'
+        method_val = self.method_var.get() if self.method_var else 'auto'
         circuit_type_val = self.circuit_type_var.get() if self.circuit_type_var else 'serie'
         
         self.language = 'pt' if self.language == 'es' else 'es'
         self.t = self.TRANSLATIONS[self.language]
         
+        # Los widgets del cálculo en curso se van a destruir
+        if self.solver is not None:
+            self.solver.cancel()
+        if self.diagnostics is not None:
+            self.diagnostics.close()
+        
         for widget in self.root.winfo_children():
             widget.destroy()
         
@@ -214,13 +261,17 @@ class CircuitAnalyzerGUI:
             font=ctk.CTkFont(size=15, weight="bold")
         ).pack(pady=(20, 10))
         
-        self.resistor_frame = ctk.CTkScrollableFrame(
+        # Lista virtualizada: solo existen widgets para las filas visibles
+        self.resistor_list = VirtualResistorList(
             left_frame,
+            get_values=lambda: self.circuit.resistors if self.circuit is not None else (),
+            on_remove=self.remove_resistor,
+            remove_text=self.t['remove'],
             width=300,
             height=150,
             corner_radius=10
         )
-        self.resistor_frame.pack(pady=(0, 20), padx=20, fill="both", expand=True)
+        self.resistor_list.pack(pady=(0, 20), padx=20, fill="both", expand=True)
         
         
         right_frame = ctk.CTkFrame(content_frame, corner_radius=15)
@@ -239,17 +290,21 @@ class CircuitAnalyzerGUI:
             font=ctk.CTkFont(size=13)
         ).pack(pady=(10, 5))
         
-        self.method_var = ctk.StringVar(value='cramer')
+        # method_var guarda la clave de STRATEGIES; el menú muestra su nombre traducido
+        self.method_var = ctk.StringVar(value='auto')
+        method_keys = {self.t[key]: key for key in self.STRATEGIES}
         method_menu = ctk.CTkOptionMenu(
             right_frame,
-            variable=self.method_var,
-            values=['cramer', 'gauss', 'numerico'],
+            values=list(method_keys),
+            command=lambda label: self.method_var.set(method_keys[label]),
             width=250,
             height=40,
             font=ctk.CTkFont(size=13),
             dropdown_font=ctk.CTkFont(size=12),
             corner_radius=10
         )
+        method_menu.set(self.t['auto'])
+        self.method_var.trace_add('write', lambda *_: method_menu.set(self.t[self.method_var.get()]))
         method_menu.pack(pady=(0, 20))
         
         # Botón calcular
@@ -263,7 +318,49 @@ class CircuitAnalyzerGUI:
             fg_color="#3b82f6",
             hover_color="#2563eb",
             corner_radius=12
-        ).pack(pady=20)
+        ).pack(pady=(20, 10))
+        
+        # Progreso y cancelación del cálculo en segundo plano
+        self.progress_bar = ctk.CTkProgressBar(right_frame, width=250)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(pady=(0, 10))
+        
+        self.cancel_button = ctk.CTkButton(
+            right_frame,
+            text=self.t['cancel'],
+            command=self.cancel_calculation,
+            width=250,
+            height=35,
+            font=ctk.CTkFont(size=13, weight="bold"),
+            fg_color="#ef4444",
+            hover_color="#dc2626",
+            corner_radius=10,
+            state="disabled"
+        )
+        self.cancel_button.pack(pady=(0, 10))
+        
+        # Instrumentación: solo activa mientras el panel está abierto
+        ctk.CTkButton(
+            right_frame,
+            text=self.t['diagnostics'],
+            command=self.toggle_diagnostics,
+            width=250,
+            height=30,
+            font=ctk.CTkFont(size=12),
+            fg_color="gray40",
+            hover_color="gray30",
+            corner_radius=10
+        ).pack(pady=(0, 10))
+        
+        # Reutilizar corrientes de sesiones anteriores (escribe en el directorio de caché)
+        self.disk_cache_var = ctk.BooleanVar(value=self.use_disk_cache)
+        ctk.CTkSwitch(
+            right_frame,
+            text=self.t['disk_cache'],
+            variable=self.disk_cache_var,
+            command=self.toggle_disk_cache,
+            font=ctk.CTkFont(size=12)
+        ).pack(pady=(0, 10))
         
         # Resultados
         results_label = ctk.CTkLabel(
@@ -274,53 +371,31 @@ class CircuitAnalyzerGUI:
         )
         results_label.pack(pady=(20, 10))
         
-        self.results_frame = ctk.CTkScrollableFrame(
+        # Solo dibuja las filas visibles: el costo no depende de cuántas corrientes haya
+        self.results_table = ResultsTable(
             right_frame,
+            self.t,
             width=300,
             height=350,
             corner_radius=10,
             fg_color=("#f0f9ff", "#1a1a2e")
         )
-        self.results_frame.pack(pady=(0, 20), padx=20, fill="both", expand=True)
+        self.results_table.pack(pady=(0, 20), padx=20, fill="both", expand=True)
     
     def change_circuit_type(self, value):
         "Cambia el tipo de circuito"
+        self.load_model()
         self.circuit.set_circuit_type(value)
         print(f"Tipo de circuito cambiado a: {value.upper()} ✓✓✓")
     
     def update_resistor_list(self):
         "Actualiza la lista visual de resistencias"
-        for widget in self.resistor_frame.winfo_children():
-            widget.destroy()
-        
-        for i, r in enumerate(self.circuit.resistors):
-            res_frame = ctk.CTkFrame(
-                self.resistor_frame,
-                corner_radius=8,
-                fg_color=("#e0f2fe", "#1e293b")
-            )
-            res_frame.pack(fill="x", pady=5, padx=5)
-            
-            ctk.CTkLabel(
-                res_frame,
-                text=f"R{i+1} = {r:.1f} Ω",
-                font=ctk.CTkFont(size=14, weight="bold", family="Courier")
-            ).pack(side="left", padx=15, pady=10)
-            
-            ctk.CTkButton(
-                res_frame,
-                text=self.t['remove'],
-                command=lambda idx=i: self.remove_resistor(idx),
-                width=80,
-                height=30,
-                font=ctk.CTkFont(size=11, weight="bold"),
-                fg_color="#ef4444",
-                hover_color="#dc2626",
-                corner_radius=6
-            ).pack(side="right", padx=10, pady=5)
+        count = len(self.circuit.resistors) if self.circuit is not None else 0
+        self.resistor_list.set_count(count)
     
     def add_resistor(self):
         "Agrega una nueva resistencia"
+        self.load_model()
         try:
             resistance = float(self.resistor_var.get())
             if resistance > 0:
@@ -340,6 +415,7 @@ class CircuitAnalyzerGUI:
     
     def calculate(self):
         "Calcula las corrientes del circuito"
+        self.load_model()
         try:
             voltage = float(self.voltage_var.get())
             if voltage <= 0:
@@ -359,63 +435,78 @@ class CircuitAnalyzerGUI:
             self.controller.set_voltage(voltage)
             
             method = self.method_var.get()
-            self.controller.set_strategy(self.strategies[method])
+            self.controller.set_strategy(self.get_strategy(method))
             
-            currents = self.controller.calculate_currents()
-            
-            if currents:
-                self.display_results(currents)
-            else:
-                messagebox.showerror(
-                    self.t['error'],
-                    "Error en el cálculo"
-                )
+            # Se resuelve una copia: el circuito puede seguir editándose mientras tanto
+            snapshot = self.circuit.snapshot()
+            self.progress_bar.set(0)
+            self.cancel_button.configure(state="normal")
+            self.get_solver().submit(
+                lambda monitor: self.controller.calculate_currents(monitor, snapshot),
+                on_done=lambda currents: self.on_calculated(currents, snapshot),
+                on_progress=self.progress_bar.set,
+                on_cancel=self.on_calculation_cancelled
+            )
         
         except ValueError:
             messagebox.showerror(self.t['error'], "Valores inválidos")
     
-    def display_results(self, currents):
+    def on_calculated(self, currents, circuit=None):
+        "Recibe el resultado del hilo de cálculo (ya en el hilo de la interfaz)"
+        self.cancel_button.configure(state="disabled")
+        self.progress_bar.set(1)
+        
+        if currents:
+            self.display_results(currents, circuit)
+            if self.diagnostics is not None:
+                self.diagnostics.refresh()
+        else:
+            messagebox.showerror(
+                self.t['error'],
+                "Error en el cálculo"
+            )
+    
+    def toggle_diagnostics(self):
+        "Abre o cierra el panel de diagnóstico"
+        if self.diagnostics is not None:
+            self.diagnostics.close()
+            return
+        self.load_model()
+        from views.diagnostics import DiagnosticsPanel
+        self.diagnostics = DiagnosticsPanel(self.root, self.t, self.controller, on_close=self.on_diagnostics_closed)
+    
+    def on_diagnostics_closed(self):
+        self.diagnostics = None
+    
+    def toggle_disk_cache(self):
+        "Activa o desactiva la caché en disco (se aplica desde el próximo cálculo)"
+        self.use_disk_cache = self.disk_cache_var.get()
+        if self.controller is None:
+            return
+        if self.use_disk_cache:
+            self.controller.enable_disk_cache()
+        else:
+            self.controller.disable_disk_cache()
+    
+    def cancel_calculation(self):
+        "Detiene el cálculo en curso"
+        if self.solver is not None:
+            self.solver.cancel()
+    
+    def on_calculation_cancelled(self):
+        if self.cancel_button.winfo_exists():
+            self.cancel_button.configure(state="disabled")
+            self.progress_bar.set(0)
+    
+    def display_results(self, currents, circuit=None):
         "Muestra los resultados del cálculo"
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-        
-        circuit_type_display = self.circuit_type_var.get().upper()
-        circuit_type_label = ctk.CTkLabel(
-            self.results_frame,
-            text=f" Circuito: {circuit_type_display}",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color="#8b5cf6"
-        )
-        circuit_type_label.pack(pady=(5, 15))
-        
-        for i, current in enumerate(currents):
-            result_frame = ctk.CTkFrame(
-                self.results_frame,
-                corner_radius=8,
-                fg_color=("#ecfdf5", "#0f5132")
+        with PROFILER.timer('gui.display_results'):
+            # El tipo de la copia que se resolvió: el menú pudo cambiar mientras tanto
+            circuit = self.circuit if circuit is None else circuit
+            circuit_type_display = circuit.circuit_type.upper()
+            self.results_table.set_results(
+                currents,
+                self.controller.summarize(currents, circuit),
+                f" Circuito: {circuit_type_display}"
             )
-            result_frame.pack(fill="x", pady=5, padx=5)
-            
-            content_frame = ctk.CTkFrame(result_frame, fg_color="transparent")
-            content_frame.pack(fill="x", padx=15, pady=10)
-            
-            ctk.CTkLabel(
-                content_frame,
-                text=f"{self.t['current']} I{i+1}:",
-                font=ctk.CTkFont(size=13, weight="bold")
-            ).pack(side="left")
-            
-            ctk.CTkLabel(
-                content_frame,
-                text=f"{current:.4f} A",
-                font=ctk.CTkFont(size=14, weight="bold", family="Courier"),
-                text_color="#10b981"
-            ).pack(side="right", padx=(10, 0))
-            
-            direction = self.t['clockwise'] if current >= 0 else self.t['counterclockwise']
-            ctk.CTkLabel(
-                result_frame,
-                text=f"{self.t['direction']}: {direction}",
-                font=ctk.CTkFont(size=11),
-                text_color="gray60"
-            ).pack(pady=(0, 10))
\ No newline at end of file
+
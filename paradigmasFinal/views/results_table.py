@@ -0,0 +1,216 @@
+"""
+Tabla de resultados sobre un único canvas
+Solo dibuja las filas visibles, así mostrar 10 o 10.000 corrientes cuesta
+lo mismo. Arriba muestra un resumen y permite saltar a una malla.
+"""
+import sys
+import customtkinter as ctk
+from utils.profiling import PROFILER
+
+
+def _pick(colors):
+    "Elige el color (claro, oscuro) según el modo de apariencia actual"
+    return colors[1] if ctk.get_appearance_mode() == "Dark" else colors[0]
+
+
+class ResultsTable(ctk.CTkFrame):
+    """
+    Resultados del cálculo en filas virtuales dibujadas en un canvas.
+
+    set_results() recibe el vector de corrientes y el resumen de
+    CircuitController.summarize(); jump_to() lleva una malla a la vista.
+    """
+    ROW_HEIGHT = 64
+    ROW_COLOR = ("#ecfdf5", "#0f5132")
+    HIGHLIGHT_COLOR = ("#a7f3d0", "#15803d")
+    TEXT_COLOR = ("#111827", "#f9fafb")
+    VALUE_COLOR = "#10b981"
+    MUTED_COLOR = "gray60"
+
+    def __init__(self, master, texts, **kwargs):
+        super().__init__(master, **kwargs)
+        self.t = texts
+        self._currents = ()
+        self._top = 0
+        self._visible = 1
+        self._highlight = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(3, weight=1)
+
+        self._title = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            text_color="#8b5cf6"
+        )
+        self._title.grid(row=0, column=0, columnspan=2, pady=(5, 5))
+
+        self._summary = ctk.CTkLabel(
+            self,
+            text="",
+            justify="left",
+            anchor="w",
+            font=ctk.CTkFont(size=12, family="Courier")
+        )
+        self._summary.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10)
+
+        jump_frame = ctk.CTkFrame(self, fg_color="transparent")
+        jump_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+
+        self._jump_var = ctk.StringVar()
+        jump_entry = ctk.CTkEntry(
+            jump_frame,
+            textvariable=self._jump_var,
+            width=80,
+            height=30,
+            placeholder_text="#"
+        )
+        jump_entry.pack(side="left", padx=(5, 5))
+        jump_entry.bind("<Return>", lambda event: self._on_jump())
+
+        ctk.CTkButton(
+            jump_frame,
+            text=self.t['jump_to_mesh'],
+            command=self._on_jump,
+            height=30,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            corner_radius=6
+        ).pack(side="left", fill="x", expand=True, padx=(0, 5))
+
+        self._canvas = ctk.CTkCanvas(self, highlightthickness=0, bd=0)
+        self._canvas.grid(row=3, column=0, sticky="nsew")
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=3, column=1, sticky="ns")
+
+        self._canvas.bind("<Configure>", self._on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._canvas.bind(sequence, self._on_wheel)
+
+    # Datos
+
+    def set_results(self, currents, summary=None, title=""):
+        self._currents = currents
+        self._top = 0
+        self._highlight = None
+        self._title.configure(text=title)
+        self._summary.configure(text=self._format_summary(summary))
+        self._render()
+
+    def clear(self):
+        self.set_results((), None, "")
+
+    def jump_to(self, mesh):
+        "Centra la malla (numerada desde 1) en la vista y la resalta"
+        index = mesh - 1
+        if not 0 <= index < len(self._currents):
+            return False
+        self._highlight = index
+        self._top = index - self._visible // 2
+        self._render()
+        return True
+
+    def _on_jump(self):
+        try:
+            mesh = int(self._jump_var.get())
+        except ValueError:
+            return
+        self.jump_to(mesh)
+
+    def _format_summary(self, summary):
+        if not summary:
+            return ""
+        lines = [
+            f"{self.t['min_current']}: {summary['min']:.4f} A",
+            f"{self.t['max_current']}: {summary['max']:.4f} A",
+            f"{self.t['rms_current']}: {summary['rms']:.4f} A",
+        ]
+        if summary['total_power'] is not None:
+            lines.append(f"{self.t['total_power']}: {summary['total_power']:.4f} W")
+        lines.append(f"{self.t['counterclockwise_meshes']}: {summary['counterclockwise']} / {summary['count']}")
+        return "\n".join(lines)
+
+    # Dibujo
+
+    def _render(self):
+        with PROFILER.timer('gui.render'):
+            self._draw()
+
+    def _draw(self):
+        canvas = self._canvas
+        count = len(self._currents)
+        self._top = max(0, min(self._top, count - self._visible))
+
+        canvas.delete("all")
+        canvas.configure(bg=_pick(("#f0f9ff", "#1a1a2e")))
+        width = canvas.winfo_width()
+        row_color = _pick(self.ROW_COLOR)
+        highlight_color = _pick(self.HIGHLIGHT_COLOR)
+        text_color = _pick(self.TEXT_COLOR)
+
+        # Una fila parcialmente visible al final
+        for position in range(self._visible + 1):
+            index = self._top + position
+            if index >= count:
+                break
+            current = float(self._currents[index])
+            y = position * self.ROW_HEIGHT
+
+            canvas.create_rectangle(
+                5, y + 3, width - 5, y + self.ROW_HEIGHT - 3,
+                fill=highlight_color if index == self._highlight else row_color,
+                outline=""
+            )
+            canvas.create_text(
+                20, y + 20, anchor="w",
+                text=f"{self.t['current']} I{index+1}:",
+                fill=text_color,
+                font=("TkDefaultFont", 12, "bold")
+            )
+            canvas.create_text(
+                width - 20, y + 20, anchor="e",
+                text=f"{current:.4f} A",
+                fill=self.VALUE_COLOR,
+                font=("Courier", 13, "bold")
+            )
+            direction = self.t['clockwise'] if current >= 0 else self.t['counterclockwise']
+            canvas.create_text(
+                width / 2, y + 45,
+                text=f"{self.t['direction']}: {direction}",
+                fill=self.MUTED_COLOR,
+                font=("TkDefaultFont", 10)
+            )
+
+        if count:
+            self._scrollbar.set(self._top / count, min((self._top + self._visible) / count, 1.0))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+    def _on_resize(self, event):
+        self._visible = max(1, event.height // self.ROW_HEIGHT)
+        self._render()
+
+    # Desplazamiento
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self._currents) - self._visible))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self._scroll_to(int(round(float(value) * len(self._currents))))
+        elif action == 'scroll':
+            step = self._visible if unit == 'pages' else 1
+            self._scroll_to(self._top + int(value) * step)
+
+    def _on_wheel(self, event):
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.num == 4 else 1
+        self._scroll_to(self._top + delta)
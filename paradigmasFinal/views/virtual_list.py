@@ -0,0 +1,181 @@
+"""
+Lista virtualizada de resistencias
+Solo crea widgets para las filas visibles y los reutiliza al desplazarse,
+así agregar o quitar una resistencia cuesta lo mismo con 10 o con 10.000.
+"""
+import sys
+import customtkinter as ctk
+
+
+class _ResistorRow:
+    "Fila reutilizable: se vuelve a asociar a otra resistencia al desplazarse"
+    def __init__(self, master, remove_text, on_remove):
+        self.index = None
+        self._on_remove = on_remove
+
+        self.frame = ctk.CTkFrame(
+            master,
+            corner_radius=8,
+            fg_color=("#e0f2fe", "#1e293b")
+        )
+
+        self.label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=ctk.CTkFont(size=14, weight="bold", family="Courier")
+        )
+        self.label.pack(side="left", padx=15, pady=10)
+
+        self.button = ctk.CTkButton(
+            self.frame,
+            text=remove_text,
+            command=self._remove,
+            width=80,
+            height=30,
+            font=ctk.CTkFont(size=11, weight="bold"),
+            fg_color="#ef4444",
+            hover_color="#dc2626",
+            corner_radius=6
+        )
+        self.button.pack(side="right", padx=10, pady=5)
+
+    def show(self, position, index, resistance):
+        self.index = index
+        self.label.configure(text=f"R{index+1} = {resistance:.1f} Ω")
+        self.frame.grid(row=position, column=0, sticky="ew", pady=5, padx=5)
+
+    def hide(self):
+        self.index = None
+        self.frame.grid_remove()
+
+    def _remove(self):
+        if self.index is not None:
+            self._on_remove(self.index)
+
+
+class VirtualResistorList(ctk.CTkFrame):
+    """
+    Lista de resistencias con filas virtuales.
+
+    get_values() devuelve la secuencia actual de resistencias; los cambios del
+    modelo se aplican con apply_change() (diferencias) o set_count() (todo).
+    """
+    ROW_HEIGHT = 58  # fila de 48 px + pady
+
+    def __init__(self, master, get_values, on_remove, remove_text, **kwargs):
+        super().__init__(master, **kwargs)
+        self._get_values = get_values
+        self._on_remove = on_remove
+        self._remove_text = remove_text
+        self._rows = []
+        self._top = 0
+        self._count = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._body = ctk.CTkFrame(self, fg_color="transparent")
+        self._body.grid(row=0, column=0, sticky="nsew")
+        self._body.grid_columnconfigure(0, weight=1)
+        # El tamaño lo decide el contenedor, no las filas (si no, se realimenta)
+        self._body.grid_propagate(False)
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self._body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self._body)
+
+    # Cambios del modelo
+
+    def set_count(self, count):
+        "Reemplazo completo: vuelve al principio y reasocia las filas visibles"
+        self._count = count
+        self._top = 0
+        self._render()
+
+    def apply_change(self, change, count):
+        """
+        Aplica un CircuitChange como diferencias sobre la vista: solo ajusta
+        la cantidad de filas y la posición, y vuelve a dibujar las visibles.
+        """
+        if change is None:
+            self.set_count(count)
+            return
+
+        # Mantiene a la vista las mismas resistencias si cambian filas de arriba
+        for event in change.events:
+            kind = event[0]
+            if kind == 'add' and event[1] < self._top:
+                self._top += event[2]
+            elif kind == 'remove' and event[1] < self._top:
+                self._top -= 1
+            elif kind == 'replace':
+                self._top = 0
+
+        self._count = count
+        self._render()
+
+    # Dibujo
+
+    def _render(self):
+        values = self._get_values()
+        visible = len(self._rows)
+        self._top = max(0, min(self._top, self._count - visible))
+
+        for position, row in enumerate(self._rows):
+            index = self._top + position
+            if index < self._count:
+                row.show(position, index, values[index])
+            else:
+                row.hide()
+
+        if self._count:
+            self._scrollbar.set(self._top / self._count, min((self._top + visible) / self._count, 1.0))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+    def _on_resize(self, event):
+        "Crea o descarta filas solo cuando cambia la cantidad que entra en pantalla"
+        visible = max(1, event.height // self.ROW_HEIGHT)
+        if visible == len(self._rows):
+            return
+
+        while len(self._rows) < visible:
+            row = _ResistorRow(self._body, self._remove_text, self._on_remove)
+            for widget in (row.frame, row.label, row.button):
+                self._bind_wheel(widget)
+            self._rows.append(row)
+        while len(self._rows) > visible:
+            self._rows.pop().frame.destroy()
+
+        self._render()
+
+    # Desplazamiento
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, self._count - len(self._rows)))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self._scroll_to(int(round(float(value) * self._count)))
+        elif action == 'scroll':
+            step = len(self._rows) if unit == 'pages' else 1
+            self._scroll_to(self._top + int(value) * step)
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", self._on_wheel, add="+")
+        widget.bind("<Button-5>", self._on_wheel, add="+")
+
+    def _on_wheel(self, event):
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.num == 4 else 1
+        self._scroll_to(self._top + delta)